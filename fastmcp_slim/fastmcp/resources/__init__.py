@@ -1,11 +1,13 @@
 from .function_resource import FunctionResource, resource
 from .base import Resource, ResourceContent, ResourceResult
+from .http_client import HttpResourceClient
 from .security import ResourceSecurity
 from .template import ResourceTemplate
 from .types import (
     BinaryResource,
     DirectoryResource,
     FileResource,
+    FileResourceTemplate,
     HttpResource,
     TextResource,
 )
@@ -14,8 +16,10 @@ __all__ = [
     "BinaryResource",
     "DirectoryResource",
     "FileResource",
+    "FileResourceTemplate",
     "FunctionResource",
     "HttpResource",
+    "HttpResourceClient",
     "Resource",
     "ResourceContent",
     "ResourceResult",
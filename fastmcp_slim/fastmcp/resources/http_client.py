@@ -0,0 +1,171 @@
+"""Pooled, cached HTTP fetching for `HttpResource`."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import TracebackType
+
+import httpx2
+
+from fastmcp.utilities.logging import get_logger
+
+__all__ = [
+    "HttpResourceClient",
+]
+
+logger = get_logger(__name__)
+
+ONE_MB_IN_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedBody:
+    """A response body plus the validators used to revalidate it."""
+
+    text: str
+    etag: str | None
+    last_modified: str | None
+
+
+class HttpResourceClient:
+    """Shared HTTP client, validator cache, and request coalescing for `HttpResource`.
+
+    Every FastMCP server owns one of these and holds it open for the length of
+    its lifespan, so reads reuse one connection pool instead of paying DNS,
+    TCP, and TLS setup per read. The underlying `httpx2.AsyncClient` is only
+    created on the first fetch, and is closed when the lifespan ends.
+
+    Responses carrying an `ETag` or `Last-Modified` validator are kept in an
+    in-memory LRU of `max_entries` bodies. Repeat reads of the same URL send
+    `If-None-Match`/`If-Modified-Since`, and a `304 Not Modified` reply serves
+    the cached body. Concurrent reads of the same URL share one request.
+
+    Outside a lifespan (for example, calling `read()` on a resource directly)
+    each fetch uses a short-lived client, but still benefits from the cache
+    and coalescing.
+    """
+
+    def __init__(
+        self,
+        *,
+        client_factory: Callable[[], httpx2.AsyncClient] | None = None,
+        max_entries: int = 256,
+        max_item_size: int = ONE_MB_IN_BYTES,
+    ):
+        """Initialize the client.
+
+        Args:
+            client_factory: Builds the pooled `httpx2.AsyncClient`. Use this to
+                configure timeouts, limits, proxies, or a custom transport.
+                Defaults to `httpx2.AsyncClient` with its default settings.
+            max_entries: Maximum number of response bodies kept for
+                revalidation.
+            max_item_size: Responses with larger bodies are not cached.
+                Defaults to 1MB.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+
+        self._client_factory: Callable[[], httpx2.AsyncClient] = (
+            client_factory or httpx2.AsyncClient
+        )
+        self._max_entries = max_entries
+        self._max_item_size = max_item_size
+        self._client: httpx2.AsyncClient | None = None
+        # Number of lifespans currently holding this client open; a client
+        # can be shared by several servers.
+        self._users = 0
+        self._entries: OrderedDict[str, _CachedBody] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[str]] = {}
+
+    async def __aenter__(self) -> HttpResourceClient:
+        self._users += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._users -= 1
+        if self._users > 0:
+            return
+        client, self._client = self._client, None
+        self._entries.clear()
+        if client is not None:
+            await client.aclose()
+
+    async def get_text(self, url: str) -> str:
+        """Fetch `url` and return its decoded body.
+
+        Raises:
+            httpx2.HTTPStatusError: If the response has an error status.
+        """
+        task = self._inflight.get(url)
+        # A task left over from another event loop (e.g. a previous
+        # `asyncio.run`) can't be awaited here; start a fresh fetch instead.
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            # Run the fetch as its own task so a cancelled caller doesn't
+            # cancel the request for everyone else waiting on it.
+            task = asyncio.ensure_future(self._fetch(url))
+            self._inflight[url] = task
+            task.add_done_callback(lambda t: self._fetch_done(url, t))
+        return await asyncio.shield(task)
+
+    def _fetch_done(self, url: str, task: asyncio.Task[str]) -> None:
+        if self._inflight.get(url) is task:
+            del self._inflight[url]
+        # Mark the exception retrieved in case every waiter was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(self, url: str) -> str:
+        cached = self._entries.get(url)
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        response = await self._get(url, headers)
+
+        if response.status_code == 304 and cached is not None:
+            if url in self._entries:
+                self._entries.move_to_end(url)
+            return cached.text
+
+        response.raise_for_status()
+        self._store(url, response)
+        return response.text
+
+    async def _get(self, url: str, headers: dict[str, str]) -> httpx2.Response:
+        if self._users:
+            if self._client is None:
+                self._client = self._client_factory()
+            return await self._client.get(url, headers=headers)
+        async with self._client_factory() as client:
+            return await client.get(url, headers=headers)
+
+    def _store(self, url: str, response: httpx2.Response) -> None:
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        cache_control = response.headers.get("cache-control", "").lower()
+        if (
+            (etag is None and last_modified is None)
+            or "no-store" in cache_control
+            or len(response.content) > self._max_item_size
+        ):
+            self._entries.pop(url, None)
+            return
+
+        self._entries[url] = _CachedBody(
+            text=response.text, etag=etag, last_modified=last_modified
+        )
+        self._entries.move_to_end(url)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
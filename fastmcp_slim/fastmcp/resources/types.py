@@ -2,21 +2,43 @@
 
 from __future__ import annotations
 
+import codecs
 import json
-from pathlib import Path
-
-import httpx2
+import locale
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path, PurePath
+from typing import Any
+
+import anyio
+import anyio.to_thread
 import pydantic.json
 from anyio import Path as AsyncPath
-from pydantic import Field, ValidationInfo
+from pydantic import Field, PrivateAttr, ValidationInfo
 from typing_extensions import override
 
 from fastmcp.exceptions import ResourceError
 from fastmcp.resources.base import Resource, ResourceContent, ResourceResult
+from fastmcp.resources.http_client import HttpResourceClient
+from fastmcp.resources.template import ResourceTemplate, extract_query_params
 from fastmcp.utilities.logging import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Used when an HttpResource is read outside any server, e.g. directly in tests.
+_standalone_http_client = HttpResourceClient()
+
+# Directory mtimes can lag real changes by up to the filesystem's timestamp
+# granularity (jiffies on ext4, 2s on FAT). A listing taken within this window
+# of a directory's last change can't be told apart from a later change, so it
+# is rescanned on the next read instead of trusted.
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
 
 class TextResource(Resource):
     """A resource that reads from a string."""
@@ -53,7 +75,12 @@ class BinaryResource(Resource):
 class FileResource(Resource):
     """A resource that reads from a file.
 
-    Set is_binary=True to read file as binary data instead of text.
+    Set is_binary=True to read file as binary data instead of text. Set
+    ``offset`` and/or ``length`` to read only a byte range of the file; the
+    range is read in a worker thread without loading the rest of the file,
+    and the content meta reports the offset, bytes returned, and file size.
+    UTF-8 text ranges are narrowed to whole characters, so the meta offset
+    and length describe the bytes actually decoded.
     """
 
     path: Path = Field(description="Path to the file")
@@ -73,6 +100,12 @@ class FileResource(Resource):
             "Set to None to use the system default encoding."
         ),
     )
+    offset: int = Field(default=0, ge=0, description="Byte offset to start reading at")
+    length: int | None = Field(
+        default=None,
+        ge=0,
+        description="Maximum number of bytes to read. None reads to the end of the file.",
+    )
 
     @property
     def _async_path(self) -> AsyncPath:
@@ -99,6 +132,8 @@ class FileResource(Resource):
     async def read(self) -> ResourceResult:
         """Read the file content."""
         try:
+            if self.offset or self.length is not None:
+                return await self._read_range()
             if self.is_binary:
                 content: str | bytes = await self._async_path.read_bytes()
             else:
@@ -109,9 +144,164 @@ class FileResource(Resource):
         except Exception as e:
             raise ResourceError(f"Error reading file {self.path}") from e
 
+    async def stream(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Yield the file's bytes, or its configured range, in chunks.
+
+        Each chunk is read in a worker thread, so memory stays bounded by
+        ``chunk_size`` regardless of file size. Use this to hand large files
+        to something that can stream them, such as a custom HTTP route.
+        """
+        remaining = self.length
+        async with await anyio.open_file(self.path, "rb") as f:
+            await f.seek(self.offset)
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = await f.read(size)
+                if not chunk:
+                    return
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    async def _read_range(self) -> ResourceResult:
+        data, file_size = await anyio.to_thread.run_sync(self._read_range_sync)
+        offset = self.offset
+        if self.is_binary:
+            content: str | bytes = data
+        else:
+            encoding = self.encoding or locale.getpreferredencoding(False)
+            if codecs.lookup(encoding).name == "utf-8":
+                start, end = _utf8_boundaries(data)
+                offset += start
+                data = data[start:end]
+            content = data.decode(encoding)
+        return ResourceResult(
+            contents=[
+                ResourceContent(
+                    content=content,
+                    mime_type=self.mime_type,
+                    meta={
+                        "offset": offset,
+                        "length": len(data),
+                        "size": file_size,
+                    },
+                )
+            ]
+        )
+
+    def _read_range_sync(self) -> tuple[bytes, int]:
+        with self.path.open("rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            # Clamp to the bytes actually available so an oversized length
+            # doesn't preallocate a buffer for data that isn't there.
+            available = max(file_size - self.offset, 0)
+            size = available if self.length is None else min(self.length, available)
+            f.seek(self.offset)
+            return f.read(size), file_size
+
+
+def _utf8_boundaries(data: bytes) -> tuple[int, int]:
+    """Return the slice of ``data`` that holds only whole UTF-8 characters.
+
+    A byte range can start inside a character (on continuation bytes) or end
+    partway through one; both partial characters are dropped.
+    """
+    start = 0
+    while start < len(data) and start < 3 and 0x80 <= data[start] < 0xC0:
+        start += 1
+    end = len(data)
+    # Find the lead byte of the last character and check it is complete.
+    for back in range(1, min(4, end - start) + 1):
+        byte = data[end - back]
+        if byte < 0x80:
+            break
+        if byte >= 0xC0:
+            needed = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            if back < needed:
+                end -= back
+            break
+    return start, end
+
+
+class FileResourceTemplate(ResourceTemplate):
+    """A resource template that serves a file in byte ranges.
+
+    The URI template must declare ``offset`` and ``length`` query parameters,
+    for example ``file:///data/model.bin{?offset,length}``. Each read returns
+    at most ``chunk_size`` bytes, so clients can page through files far
+    larger than they would want in a single response while the server holds
+    one chunk per read. The content meta reports the offset, the number of
+    bytes returned, and the file size.
+    """
+
+    path: Path = Field(description="Path to the file")
+    chunk_size: int = Field(
+        default=DEFAULT_CHUNK_SIZE,
+        gt=0,
+        description="Maximum number of bytes returned by a single read",
+    )
+    mime_type: str = Field(
+        default="application/octet-stream",
+        description="MIME type of the resource content",
+    )
+    parameters: dict[str, Any] = Field(
+        default_factory=lambda: {
+            "type": "object",
+            "properties": {
+                "offset": {"type": "integer", "minimum": 0, "default": 0},
+                "length": {"type": "integer", "minimum": 0},
+            },
+        },
+        description="JSON schema for the range parameters",
+    )
+
+    @pydantic.field_validator("path")
+    @classmethod
+    def validate_absolute_path(cls, path: Path) -> Path:
+        """Ensure path is absolute."""
+        if not path.is_absolute():
+            raise ValueError("Path must be absolute")
+        return path
+
+    @pydantic.field_validator("uri_template")
+    @classmethod
+    def validate_range_params(cls, uri_template: str) -> str:
+        """Ensure the template exposes the range query parameters."""
+        missing = {"offset", "length"} - extract_query_params(uri_template)
+        if missing:
+            raise ValueError(
+                "uri_template must declare {?offset,length} query parameters, "
+                f"missing: {', '.join(sorted(missing))}"
+            )
+        return uri_template
+
+    @override
+    async def create_resource(self, uri: str, params: dict[str, Any]) -> Resource:
+        """Create a FileResource for the requested range, capped at chunk_size."""
+        offset = int(params.get("offset") or 0)
+        # length=0 is an empty read; only a missing length means "one chunk".
+        length = params.get("length")
+        length = self.chunk_size if length in (None, "") else int(length)
+        return FileResource(
+            uri=uri,
+            name=self.name,
+            path=self.path,
+            mime_type=self.mime_type,
+            is_binary=True,
+            offset=offset,
+            length=min(length, self.chunk_size),
+        )
+
 
 class HttpResource(Resource):
-    """A resource that reads from an HTTP endpoint."""
+    """A resource that reads from an HTTP endpoint.
+
+    Reads go through the serving FastMCP server's `HttpResourceClient`, which
+    pools connections for the server's lifespan, revalidates repeat reads with
+    `ETag`/`Last-Modified`, and coalesces concurrent reads of the same URL.
+    """
 
     url: str = Field(description="URL to fetch content from")
     mime_type: str = Field(
@@ -121,18 +311,99 @@ class HttpResource(Resource):
     @override
     async def read(self) -> ResourceResult:
         """Read the HTTP content."""
-        async with httpx2.AsyncClient() as client:
-            response = await client.get(self.url)
-            _ = response.raise_for_status()
-            return ResourceResult(
-                contents=[
-                    ResourceContent(content=response.text, mime_type=self.mime_type)
-                ]
+        from fastmcp.server.dependencies import get_server
+
+        try:
+            client = get_server().http_resource_client
+        except RuntimeError:
+            client = _standalone_http_client
+        text = await client.get_text(self.url)
+        return ResourceResult(
+            contents=[ResourceContent(content=text, mime_type=self.mime_type)]
+        )
+
+
+@dataclass(slots=True)
+class _DirectoryListing:
+    """A cached directory walk and the directory mtimes that validate it."""
+
+    names: list[str]
+    dir_mtimes: dict[str, int]
+    # False when a directory changed too close to the scan to trust its mtime.
+    trusted: bool
+    content: str | None = None
+
+    def is_current(self) -> bool:
+        if not self.trusted:
+            return False
+        try:
+            return all(
+                os.stat(path).st_mtime_ns == mtime
+                for path, mtime in self.dir_mtimes.items()
             )
+        except OSError:
+            return False
+
+
+def _scan_directory(
+    root: Path, pattern: str | None, max_depth: int | None
+) -> _DirectoryListing:
+    """Walk `root` with `os.scandir` and collect files matching `pattern`.
+
+    `max_depth` limits how many directory levels are listed (1 lists only
+    `root` itself); None walks the whole tree. Symlinked directories are not
+    followed, but symlinks to files are listed.
+    """
+    if not root.exists():
+        raise FileNotFoundError(f"Directory not found: {root}")
+    if not root.is_dir():
+        raise NotADirectoryError(f"Not a directory: {root}")
+
+    started = time.time_ns()
+    prefix_len = len(os.path.join(root, ""))
+    names: list[str] = []
+    dir_mtimes: dict[str, int] = {}
+    stack: list[tuple[str, int]] = [(str(root), 1)]
+    while stack:
+        path, depth = stack.pop()
+        # Stat before listing, so a change made mid-scan shows up as a
+        # different mtime on the next read.
+        dir_mtimes[path] = os.stat(path).st_mtime_ns
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if max_depth is None or depth < max_depth:
+                        stack.append((entry.path, depth + 1))
+                elif entry.is_file():
+                    names.append(entry.path[prefix_len:])
+
+    if pattern is not None:
+        pattern_depth = len(PurePath(pattern).parts)
+        names = [
+            name
+            for name in names
+            if (max_depth is None or len(PurePath(name).parts) == pattern_depth)
+            and PurePath(name).match(pattern)
+        ]
+
+    return _DirectoryListing(
+        names=names,
+        dir_mtimes=dir_mtimes,
+        trusted=all(
+            mtime < started - _RACY_MTIME_WINDOW_NS for mtime in dir_mtimes.values()
+        ),
+    )
 
 
 class DirectoryResource(Resource):
-    """A resource that lists files in a directory."""
+    """A resource that lists files in a directory.
+
+    The listing is built by a single `os.scandir` walk in a worker thread and
+    cached. Later reads stat only the directories in the tree and reuse the
+    cached listing when none of their mtimes changed. For large trees, enter
+    `watch()` to invalidate the cache from filesystem events instead, which
+    skips the directory stats entirely.
+    """
 
     path: Path = Field(description="Path to the directory")
     recursive: bool = Field(
@@ -145,6 +416,11 @@ class DirectoryResource(Resource):
         default="application/json", description="MIME type of the resource content"
     )
 
+    _listing: _DirectoryListing | None = PrivateAttr(default=None)
+    # Bumped on every invalidation so a scan that raced a change is dropped.
+    _generation: int = PrivateAttr(default=0)
+    _watching: bool = PrivateAttr(default=False)
+
     @property
     def _async_path(self) -> AsyncPath:
         return AsyncPath(self.path)
@@ -157,32 +433,125 @@ class DirectoryResource(Resource):
             raise ValueError("Path must be absolute")
         return path
 
+    @property
+    def _max_depth(self) -> int | None:
+        if self.recursive:
+            return None
+        if self.pattern is None:
+            return 1
+        return len(PurePath(self.pattern).parts)
+
     async def list_files(self) -> list[Path]:
         """List files in the directory."""
+        listing = await self._get_listing()
+        return [self.path / name for name in listing.names]
+
+    async def _get_listing(self) -> _DirectoryListing:
+        if self.pattern is not None and "**" in self.pattern:
+            # Recursive wildcards don't map onto the depth-limited walk.
+            return await self._glob_listing()
+
+        listing = self._listing
+        if listing is not None and (
+            self._watching or await anyio.to_thread.run_sync(listing.is_current)
+        ):
+            return listing
+
+        generation = self._generation
+        try:
+            listing = await anyio.to_thread.run_sync(
+                _scan_directory, self.path, self.pattern, self._max_depth
+            )
+        except (FileNotFoundError, NotADirectoryError):
+            raise
+        except Exception as e:
+            raise ResourceError(f"Error listing directory {self.path}") from e
+        if generation == self._generation:
+            self._listing = listing
+        return listing
+
+    async def _glob_listing(self) -> _DirectoryListing:
         if not await self._async_path.exists():
             raise FileNotFoundError(f"Directory not found: {self.path}")
         if not await self._async_path.is_dir():
             raise NotADirectoryError(f"Not a directory: {self.path}")
 
         pattern = self.pattern or "*"
-
         glob_fn = self._async_path.rglob if self.recursive else self._async_path.glob
         try:
-            return [Path(p) async for p in glob_fn(pattern) if await p.is_file()]
+            names = [
+                str(Path(p).relative_to(self.path))
+                async for p in glob_fn(pattern)
+                if await p.is_file()
+            ]
         except Exception as e:
             raise ResourceError(f"Error listing directory {self.path}") from e
+        return _DirectoryListing(names=names, dir_mtimes={}, trusted=False)
+
+    def invalidate(self) -> None:
+        """Drop the cached listing so the next read rescans the directory."""
+        self._listing = None
+        self._generation += 1
+
+    @asynccontextmanager
+    async def watch(self) -> AsyncIterator[None]:
+        """Invalidate the cached listing from filesystem events while active.
+
+        Enter this in a server lifespan to serve repeat reads without stat-ing
+        every directory in the tree. Changes show up once the watcher delivers
+        them, typically within a few hundred milliseconds. Until the watcher
+        is running, reads fall back to mtime checks.
+
+        Example:
+            ```python
+            docs = DirectoryResource(uri="dir://docs", path=docs_path, recursive=True)
+
+            @asynccontextmanager
+            async def lifespan(server):
+                async with docs.watch():
+                    yield
+            ```
+        """
+        from watchfiles import awatch
+
+        stop = anyio.Event()
+
+        async def run_watcher() -> None:
+            async for changes in awatch(
+                self.path,
+                watch_filter=None,
+                debounce=200,
+                stop_event=stop,
+                recursive=self._max_depth != 1,
+                # A timeout tick is the first sign the watcher is registered.
+                rust_timeout=1000,
+                yield_on_timeout=True,
+            ):
+                # Invalidate on the first tick too: anything that changed
+                # before the watcher was registered would otherwise be missed.
+                if changes or not self._watching:
+                    self.invalidate()
+                self._watching = True
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(run_watcher)
+            try:
+                yield
+            finally:
+                self._watching = False
+                stop.set()
 
     @override
     async def read(self) -> ResourceResult:
         """Read the directory listing."""
         try:
-            files: list[Path] = await self.list_files()
-
-            file_list = [str(f.relative_to(self.path)) for f in files]
-
-            content = json.dumps({"files": file_list}, indent=2)
+            listing = await self._get_listing()
+            if listing.content is None:
+                listing.content = json.dumps({"files": listing.names}, indent=2)
             return ResourceResult(
-                contents=[ResourceContent(content=content, mime_type=self.mime_type)]
+                contents=[
+                    ResourceContent(content=listing.content, mime_type=self.mime_type)
+                ]
             )
         except Exception as e:
             raise ResourceError(f"Error reading directory {self.path}") from e
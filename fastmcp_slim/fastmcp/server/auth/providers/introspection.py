@@ -65,6 +65,8 @@ class IntrospectionTokenVerifier(TokenVerifier):
     Caching is disabled by default to preserve real-time revocation semantics.
     Set ``cache_ttl_seconds`` to enable caching and reduce load on the
     introspection endpoint (e.g., ``cache_ttl_seconds=300`` for 5 minutes).
+    With caching enabled, ``negative_cache_ttl_seconds`` additionally
+    remembers tokens the endpoint reported as inactive for a short time.
 
     Example:
         ```python
@@ -89,6 +91,7 @@ class IntrospectionTokenVerifier(TokenVerifier):
         base_url: AnyHttpUrl | str | None = None,
         cache_ttl_seconds: int | None = None,
         max_cache_size: int | None = None,
+        negative_cache_ttl_seconds: int | None = None,
         http_client: httpx2.AsyncClient | None = None,
     ):
         """
@@ -109,6 +112,12 @@ class IntrospectionTokenVerifier(TokenVerifier):
                 (e.g., 300 for 5 minutes).
             max_cache_size: Maximum number of tokens to cache when caching is
                 enabled. Default: 10000.
+            negative_cache_ttl_seconds: How long to remember tokens that the
+                introspection endpoint reported as inactive or expired, in
+                seconds. Disabled by default (None); requires caching to be
+                enabled and is capped at ``cache_ttl_seconds``. A few seconds
+                is enough to absorb clients replaying a rejected token. HTTP
+                errors, timeouts, and scope failures are never cached.
             http_client: Optional httpx2.AsyncClient for connection pooling. When provided,
                 the client is reused across calls and the caller is responsible for its
                 lifecycle. When None (default), a fresh client is created per call.
@@ -145,6 +154,7 @@ class IntrospectionTokenVerifier(TokenVerifier):
         self._cache = TokenCache(
             ttl_seconds=cache_ttl_seconds,
             max_size=max_cache_size,
+            negative_ttl_seconds=negative_cache_ttl_seconds,
         )
 
     def _create_basic_auth_header(self) -> str:
@@ -243,10 +253,12 @@ class IntrospectionTokenVerifier(TokenVerifier):
                 introspection_data = response.json()
 
                 # Check if token is active (required field per RFC 7662)
-                # Don't cache inactive tokens - they may become valid later
-                # (e.g., tokens with future nbf, or propagation delays)
+                # Inactive tokens may become valid later (e.g., tokens with
+                # future nbf, or propagation delays), so they are only
+                # remembered for the short negative cache TTL
                 if not introspection_data.get("active", False):
                     self.logger.debug("Token introspection returned active=false")
+                    self._cache.set_rejected(token)
                     return None
 
                 # Extract client_id (should be present for active tokens)
@@ -263,6 +275,7 @@ class IntrospectionTokenVerifier(TokenVerifier):
                             "Token validation failed: expired token for client %s",
                             client_id,
                         )
+                        self._cache.set_rejected(token)
                         return None
 
                 # Extract scopes
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import json
 import time
@@ -323,10 +324,18 @@ class JWTVerifier(TokenVerifier):
         self._http_client = http_client
         self.logger = get_logger(__name__)
 
-        # Simple JWKS cache
+        # JWKS cache. Fetches are single-flight: concurrent callers share
+        # one in-flight task. The set is refreshed in the background shortly
+        # before it expires, and a token with an unknown kid only triggers a
+        # refetch if none was attempted within the last refetch interval.
         self._jwks_cache: dict[str, str] = {}
+        self._jwks_skipped_kids: set[str] = set()
         self._jwks_cache_time: float = 0
+        self._jwks_last_attempt: float = 0
+        self._jwks_fetch_task: asyncio.Task[None] | None = None
         self._cache_ttl = 3600  # 1 hour
+        self._refresh_ahead = 300  # 5 minutes before expiry
+        self._min_refetch_interval = 30
 
     async def _get_verification_key(self, token: str) -> str | bytes:
         """Get the verification key for the token."""
@@ -343,19 +352,93 @@ class JWTVerifier(TokenVerifier):
             raise ValueError(f"Failed to extract key ID from token: {e}") from e
 
     async def _get_jwks_key(self, kid: str | None) -> str:
-        """Fetch key from JWKS with simple caching and SSRF protection."""
+        """Fetch key from JWKS with caching, coalesced refreshes, and SSRF protection."""
         if not self.jwks_uri:
             raise ValueError("JWKS URI not configured")
 
-        current_time = time.time()
+        age = time.time() - self._jwks_cache_time
 
         # Check cache first
-        if current_time - self._jwks_cache_time < self._cache_ttl:
+        if age < self._cache_ttl:
+            if age >= self._cache_ttl - self._refresh_ahead:
+                # Refresh before expiry so no request waits on the fetch
+                self._start_jwks_fetch()
             if kid and kid in self._jwks_cache:
                 return self._jwks_cache[kid]
             elif not kid and len(self._jwks_cache) == 1:
                 # If no kid but only one key cached, use it
                 return next(iter(self._jwks_cache.values()))
+            elif not self._jwks_fetch_allowed():
+                # Rate-limit refetches on key misses so tokens with made-up
+                # kids can't drive a fetch per request
+                return self._select_jwks_key(kid)
+
+        task = self._start_jwks_fetch(force=True)
+        # Shield the shared fetch so one cancelled caller doesn't cancel it
+        # for everyone else waiting on it.
+        await asyncio.shield(task)
+        return self._select_jwks_key(kid)
+
+    def _jwks_fetch_allowed(self) -> bool:
+        in_flight = (
+            self._jwks_fetch_task is not None and not self._jwks_fetch_task.done()
+        )
+        return (
+            in_flight
+            or time.time() - self._jwks_last_attempt >= self._min_refetch_interval
+        )
+
+    def _start_jwks_fetch(self, force: bool = False) -> asyncio.Task[None]:
+        """Return the in-flight JWKS fetch, starting one if needed.
+
+        Background refreshes (``force=False``) respect the refetch interval so
+        a failing endpoint isn't retried on every request.
+        """
+        task = self._jwks_fetch_task
+        if task is not None and not task.done():
+            return task
+        if task is not None and not force and not self._jwks_fetch_allowed():
+            return task
+        task = asyncio.create_task(self._load_jwks())
+        task.add_done_callback(self._on_jwks_fetch_done)
+        self._jwks_fetch_task = task
+        return task
+
+    def _on_jwks_fetch_done(self, task: asyncio.Task[None]) -> None:
+        # Retrieve the exception so failed background refreshes are logged
+        # rather than reported as never-retrieved task exceptions.
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            self.logger.debug("JWKS refresh failed: %s", exc)
+
+    def _select_jwks_key(self, kid: str | None) -> str:
+        """Select the verification key for `kid` from the cached JWKS."""
+        if kid:
+            if kid not in self._jwks_cache:
+                if kid in self._jwks_skipped_kids:
+                    self.logger.debug(
+                        "JWKS key lookup failed: key ID '%s' is present "
+                        "but its key type is unsupported",
+                        kid,
+                    )
+                    raise ValueError(
+                        f"Key ID '{kid}' found in JWKS but its key type is unsupported"
+                    )
+                self.logger.debug("JWKS key lookup failed: key ID '%s' not found", kid)
+                raise ValueError(f"Key ID '{kid}' not found in JWKS")
+            return self._jwks_cache[kid]
+        else:
+            # No kid in token - only allow if there's exactly one key
+            if len(self._jwks_cache) == 1:
+                return next(iter(self._jwks_cache.values()))
+            elif len(self._jwks_cache) > 1:
+                raise ValueError("Multiple keys in JWKS but no key ID (kid) in token")
+            else:
+                raise ValueError("No keys found in JWKS")
+
+    async def _load_jwks(self) -> None:
+        """Fetch the JWKS and replace the cached keys."""
+        fetch_time = time.time()
+        self._jwks_last_attempt = fetch_time
 
         # Fetch JWKS — with SSRF protection when enabled (untrusted URIs)
         try:
@@ -367,7 +450,7 @@ class JWTVerifier(TokenVerifier):
             # key published by the authorization server would reject every
             # token, including ones signed by supported keys in the same set
             # (#4515).
-            self._jwks_cache = {}
+            cache: dict[str, str] = {}
             skipped_kids: set[str] = set()
             expected_key_type = _key_type_for_algorithm(self.algorithm)
             for key_data in jwks_data.get("keys", []):
@@ -395,41 +478,10 @@ class JWTVerifier(TokenVerifier):
                     continue
 
                 if key_kid:
-                    self._jwks_cache[key_kid] = public_key
+                    cache[key_kid] = public_key
                 else:
                     # Key without kid - use a default identifier
-                    self._jwks_cache["_default"] = public_key
-
-            self._jwks_cache_time = current_time
-
-            # Select the appropriate key
-            if kid:
-                if kid not in self._jwks_cache:
-                    if kid in skipped_kids:
-                        self.logger.debug(
-                            "JWKS key lookup failed: key ID '%s' is present "
-                            "but its key type is unsupported",
-                            kid,
-                        )
-                        raise ValueError(
-                            f"Key ID '{kid}' found in JWKS but its key type "
-                            "is unsupported"
-                        )
-                    self.logger.debug(
-                        "JWKS key lookup failed: key ID '%s' not found", kid
-                    )
-                    raise ValueError(f"Key ID '{kid}' not found in JWKS")
-                return self._jwks_cache[kid]
-            else:
-                # No kid in token - only allow if there's exactly one key
-                if len(self._jwks_cache) == 1:
-                    return next(iter(self._jwks_cache.values()))
-                elif len(self._jwks_cache) > 1:
-                    raise ValueError(
-                        "Multiple keys in JWKS but no key ID (kid) in token"
-                    )
-                else:
-                    raise ValueError("No keys found in JWKS")
+                    cache["_default"] = public_key
 
         except (SSRFError, SSRFFetchError) as e:
             self.logger.debug("JWKS fetch blocked by SSRF protection: %s", e)
@@ -442,6 +494,10 @@ class JWTVerifier(TokenVerifier):
             self.logger.debug("JWKS key processing failed: %s", e)
             raise ValueError(f"Failed to process JWKS: {e}") from e
 
+        self._jwks_cache = cache
+        self._jwks_skipped_kids = skipped_kids
+        self._jwks_cache_time = fetch_time
+
     async def _fetch_jwks(self) -> dict[str, Any]:
         """Fetch JWKS data, using SSRF-safe or standard fetch based on config."""
         if not self.jwks_uri:
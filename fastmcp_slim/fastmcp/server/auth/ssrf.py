@@ -172,19 +172,91 @@ def is_ip_allowed(ip_str: str) -> bool:
     return not ip.is_multicast
 
 
-async def resolve_hostname(hostname: str, port: int = 443) -> list[str]:
-    """Resolve hostname to IP addresses using DNS.
+@dataclass
+class _DNSCacheEntry:
+    """A cached resolution: either addresses or the failure message."""
 
-    Args:
-        hostname: Hostname to resolve
-        port: Port number (used for getaddrinfo)
+    ips: list[str] | None
+    error: str | None
+    expires_at: float
 
-    Returns:
-        List of resolved IP addresses
 
-    Raises:
-        SSRFError: If resolution fails
+class _DNSCache:
+    """TTL cache of hostname resolutions with per-host request coalescing.
+
+    Only caches what the resolver returned. Callers must still validate the
+    addresses with `is_ip_allowed` on every use, which `validate_url` does.
     """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: dict[tuple[str, int], _DNSCacheEntry] = {}
+        self._pending: dict[tuple[str, int], asyncio.Task[list[str]]] = {}
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._pending.clear()
+
+    async def resolve(self, hostname: str, port: int) -> list[str]:
+        key = (hostname.lower(), port)
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry.expires_at:
+            if entry.error is not None:
+                raise SSRFError(entry.error)
+            return list(entry.ips or [])
+
+        # Coalesce concurrent lookups for the same host onto one task. A task
+        # from another event loop (e.g. a previous asyncio.run) can't be awaited.
+        task = self._pending.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._lookup(key, hostname, port))
+            self._pending[key] = task
+            task.add_done_callback(lambda t: self._discard_pending(key, t))
+        return list(await asyncio.shield(task))
+
+    def _discard_pending(self, key: tuple[str, int], task: asyncio.Task) -> None:
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        # Mark the exception retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _lookup(
+        self, key: tuple[str, int], hostname: str, port: int
+    ) -> list[str]:
+        try:
+            ips = await _getaddrinfo(hostname, port)
+        except SSRFError as e:
+            self._store(key, None, str(e), fastmcp.settings.ssrf_dns_negative_cache_ttl)
+            raise
+        self._store(key, ips, None, fastmcp.settings.ssrf_dns_cache_ttl)
+        return ips
+
+    def _store(
+        self,
+        key: tuple[str, int],
+        ips: list[str] | None,
+        error: str | None,
+        ttl: float,
+    ) -> None:
+        if ttl <= 0:
+            self._entries.pop(key, None)
+            return
+        now = time.monotonic()
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            self._entries = {
+                k: v for k, v in self._entries.items() if v.expires_at > now
+            }
+            while len(self._entries) >= self.max_entries:
+                # Dicts keep insertion order, so this drops the oldest entry
+                del self._entries[next(iter(self._entries))]
+        self._entries[key] = _DNSCacheEntry(ips=ips, error=error, expires_at=now + ttl)
+
+
+_dns_cache = _DNSCache()
+
+
+async def _getaddrinfo(hostname: str, port: int) -> list[str]:
     loop = asyncio.get_running_loop()
     try:
         infos = await loop.run_in_executor(
@@ -201,6 +273,27 @@ async def resolve_hostname(hostname: str, port: int = 443) -> list[str]:
         raise SSRFError(f"DNS resolution failed for {hostname}: {e}") from e
 
 
+async def resolve_hostname(hostname: str, port: int = 443) -> list[str]:
+    """Resolve hostname to IP addresses using DNS.
+
+    Results are cached for `settings.ssrf_dns_cache_ttl` seconds and failures
+    for `settings.ssrf_dns_negative_cache_ttl` seconds. Concurrent lookups
+    for the same host share a single resolution. The returned addresses are
+    not validated; callers must check each with `is_ip_allowed`.
+
+    Args:
+        hostname: Hostname to resolve
+        port: Port number (used for getaddrinfo)
+
+    Returns:
+        List of resolved IP addresses
+
+    Raises:
+        SSRFError: If resolution fails
+    """
+    return await _dns_cache.resolve(hostname, port)
+
+
 @dataclass
 class ValidatedURL:
     """A URL that has been validated for SSRF with resolved IPs."""
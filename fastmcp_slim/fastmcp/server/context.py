@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 import weakref
 from collections.abc import Callable, Generator, Mapping
 from contextlib import contextmanager
@@ -32,6 +34,7 @@ from fastmcp.server.elicitation import (
     handle_elicit_accept,
     parse_elicit_response_type,
 )
+from fastmcp.server.log_queue import ClientLogQueue
 from fastmcp.server.low_level import client_supports_extension
 from fastmcp.server.server import FastMCP, StateValue
 from fastmcp.server.transforms.visibility import (
@@ -130,6 +133,15 @@ _mcp_level_to_python_level = {
 }
 
 
+@dataclass
+class _ProgressUpdate:
+    """A single `report_progress` call, held while coalescing."""
+
+    progress: float
+    total: float | None
+    message: str | None
+
+
 @contextmanager
 def set_context(context: Context) -> Generator[Context, None, None]:
     token = _current_context.set(context)
@@ -219,6 +231,21 @@ class Context:
         # in both modes — only the transport differs (task store vs wire params).
         self._task_input_responses: mcp_types.InputResponses | None = None
         self._task_request_state: str | None = None
+        # Progress coalescing state (see `report_progress`). Scoped to this
+        # Context, which lives for exactly one request or task run.
+        self._progress_sent: _ProgressUpdate | None = None
+        self._progress_sent_at: float = 0.0
+        self._progress_pending: _ProgressUpdate | None = None
+        self._progress_flush: asyncio.Task[None] | None = None
+        # Asynchronous client log delivery, when the server enables it. Nested
+        # contexts adopt their parent's queue so a request's logs stay ordered.
+        self._log_queue: ClientLogQueue | None = (
+            ClientLogQueue(
+                fastmcp.client_log_queue_size, on_drop=self._count_dropped_log
+            )
+            if fastmcp.client_log_queue_size is not None
+            else None
+        )
 
     @property
     def is_background_task(self) -> bool:
@@ -273,6 +300,8 @@ class Context:
         parent = _current_context.get(None)
         if parent is not None:
             self._request_state = parent._request_state
+            if parent._log_queue is not None:
+                self._log_queue = parent._log_queue
 
         # Always set this context and save the token
         token = _current_context.set(self)
@@ -295,6 +324,20 @@ class Context:
         """Exit the context manager and reset the most recent token."""
         from fastmcp.server.dependencies import _current_server
 
+        # Leaving the outermost scope ends the request: deliver queued log
+        # messages and the last coalesced progress update before the response.
+        if len(self._tokens) <= 1:
+            if self._log_queue is not None:
+                await self._log_queue.flush()
+            if self._progress_flush is not None:
+                self._progress_flush.cancel()
+                self._progress_flush = None
+            if self._progress_pending is not None:
+                try:
+                    await self._send_progress(self._progress_pending)
+                except Exception as e:
+                    logger.debug(f"Failed to flush pending progress update: {e}")
+
         if hasattr(self, "_shared_context"):
             await self._shared_context.__aexit__(exc_type, exc_val, exc_tb)
             del self._shared_context
@@ -458,11 +501,69 @@ class Context:
         Works in both foreground (MCP progress notifications) and background
         (Docket task execution) contexts.
 
+        Updates are coalesced according to the server's `progress_min_interval`
+        and `progress_min_delta`, so it is safe to call this once per item in a
+        tight loop. The first update, updates that change the message or total,
+        and updates that reach the total are always sent immediately. A
+        coalesced update is sent once `progress_min_interval` has elapsed if
+        it has also moved by `progress_min_delta`, and otherwise when the
+        request finishes.
+
         Args:
             progress: Current progress value e.g. 24
             total: Optional total value e.g. 100
             message: Optional status message describing current progress
         """
+        update = _ProgressUpdate(progress=progress, total=total, message=message)
+        if self._should_send_progress(update):
+            await self._send_progress(update)
+            return
+        self._progress_pending = update
+        # Without a trailing send, an update coalesced just before a long
+        # quiet stretch would not reach the client until the request ends.
+        if self.fastmcp.progress_min_interval > 0 and (
+            self._progress_flush is None or self._progress_flush.done()
+        ):
+            self._progress_flush = asyncio.create_task(self._flush_progress_later())
+
+    async def _flush_progress_later(self) -> None:
+        """Send the pending update once the coalescing interval has elapsed."""
+        interval = self.fastmcp.progress_min_interval
+        await asyncio.sleep(
+            max(self._progress_sent_at + interval - time.monotonic(), 0)
+        )
+        pending = self._progress_pending
+        if pending is None or not self._should_send_progress(pending):
+            return
+        try:
+            await self._send_progress(pending)
+        except Exception as e:
+            logger.debug(f"Failed to send coalesced progress update: {e}")
+
+    def _should_send_progress(self, update: _ProgressUpdate) -> bool:
+        """Decide whether a progress update goes out now or is coalesced."""
+        last = self._progress_sent
+        if last is None:
+            return True
+        if update.total is not None and (
+            update.progress >= update.total or update.total != last.total
+        ):
+            return True
+        if update.message is not None and update.message != last.message:
+            return True
+
+        server = self.fastmcp
+        elapsed = time.monotonic() - self._progress_sent_at
+        if elapsed < server.progress_min_interval:
+            return False
+        return abs(update.progress - last.progress) >= server.progress_min_delta
+
+    async def _send_progress(self, update: _ProgressUpdate) -> None:
+        """Deliver a progress update to the client or the task's progress store."""
+        previous = self._progress_sent
+        self._progress_sent = update
+        self._progress_sent_at = time.monotonic()
+        self._progress_pending = None
 
         rc = self.request_context
         progress_token = (
@@ -475,9 +576,9 @@ class Context:
         if progress_token is not None:
             await self.session.send_progress_notification(
                 progress_token=progress_token,
-                progress=progress,
-                total=total,
-                message=message,
+                progress=update.progress,
+                total=update.total,
+                message=update.message,
                 related_request_id=self.request_id,
             )
             return
@@ -494,21 +595,27 @@ class Context:
 
             execution = current_execution.get()
 
-            # Update progress in Redis using Docket's progress API.
+            # Update progress in Redis using Docket's progress API. Each field
+            # is written only when it changed, so a progress-only update costs
+            # a single round trip.
+            if update.total is not None and (
+                previous is None or previous.total != update.total
+            ):
+                await execution.progress.set_total(int(update.total))
+
             # Docket only exposes increment() (relative), so we compute
             # the delta from the last reported value stored on this execution.
-            if total is not None:
-                await execution.progress.set_total(int(total))
-
-            current = int(progress)
+            current = int(update.progress)
             last: int = getattr(execution, "_fastmcp_last_progress", 0)
             delta = current - last
             if delta > 0:
                 await execution.progress.increment(delta)
             execution._fastmcp_last_progress = current  # type: ignore[attr-defined]  # ty:ignore[unresolved-attribute]
 
-            if message is not None:
-                await execution.progress.set_message(message)
+            if update.message is not None and (
+                previous is None or previous.message != update.message
+            ):
+                await execution.progress.set_message(update.message)
         except LookupError:
             # Not running in Docket worker context - no progress tracking available
             pass
@@ -644,8 +751,14 @@ class Context:
             logger_name=logger_name,
             related_request_id=related_request_id,
             min_level=min_level,
+            queue=self._log_queue,
         )
 
+    def _count_dropped_log(self) -> None:
+        fastmcp = self._fastmcp()
+        if fastmcp is not None:
+            fastmcp.client_log_messages_dropped += 1
+
     @property
     def transport(self) -> TransportType | None:
         """Get the current transport type.
@@ -1335,8 +1448,13 @@ async def _log_to_server_and_client(
     logger_name: str | None = None,
     related_request_id: str | None = None,
     min_level: LoggingLevel | None = None,
+    queue: ClientLogQueue | None = None,
 ) -> None:
-    """Log a message to the server and client."""
+    """Log a message to the server and client.
+
+    With a `queue`, the client send is enqueued for background delivery
+    instead of awaited.
+    """
     if min_level is not None:
         if _MCP_LEVEL_SEVERITY[level] < _MCP_LEVEL_SEVERITY[min_level]:
             return
@@ -1352,6 +1470,16 @@ async def _log_to_server_and_client(
         extra=data.extra,
     )
 
+    if queue is not None:
+        queue.put(
+            session=session,
+            level=level,
+            data=data,
+            logger_name=logger_name,
+            related_request_id=related_request_id,
+        )
+        return
+
     # Deprecated upstream in SDK v2 but deliberately kept per compat directive;
     # removed with the multi-round-trip follow-up.
     await session.send_log_message(  # ty: ignore[deprecated]
@@ -0,0 +1,112 @@
+"""Asynchronous, bounded delivery of `Context` log messages to MCP clients."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from mcp import LoggingLevel, ServerSession
+
+from fastmcp.utilities.logging import get_logger
+
+if TYPE_CHECKING:
+    from fastmcp.server.context import LogData
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _QueuedLog:
+    session: ServerSession
+    level: LoggingLevel
+    data: LogData
+    logger_name: str | None
+    related_request_id: str | None
+
+
+class ClientLogQueue:
+    """Decouples `ctx.log()` calls from the transport writes that deliver them.
+
+    `put` enqueues a message and returns immediately; a single background
+    sender drains the queue in order, so a chatty tool no longer waits on one
+    `notifications/message` write per log line. The queue holds at most
+    `maxsize` messages. When it is full the oldest queued message is dropped,
+    counted in `dropped`, and reported to `on_drop` if given.
+
+    Level gating (`logging/setLevel`) happens before `put`, so filtered
+    messages never occupy queue slots. Callers must `flush` before the request
+    that produced the messages completes; `Context` does this on exit.
+    """
+
+    def __init__(self, maxsize: int, on_drop: Callable[[], None] | None = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize: int = maxsize
+        self.dropped: int = 0
+        self._on_drop = on_drop
+        self._pending: deque[_QueuedLog] = deque()
+        self._sender: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def put(
+        self,
+        session: ServerSession,
+        level: LoggingLevel,
+        data: LogData,
+        logger_name: str | None = None,
+        related_request_id: str | None = None,
+    ) -> None:
+        """Enqueue a log message without waiting for it to be sent."""
+        if len(self._pending) >= self.maxsize:
+            self._pending.popleft()
+            self.dropped += 1
+            if self._on_drop is not None:
+                self._on_drop()
+            if self.dropped == 1:
+                logger.warning(
+                    f"Client log queue is full (maxsize={self.maxsize}); "
+                    "dropping the oldest queued messages"
+                )
+        self._pending.append(
+            _QueuedLog(
+                session=session,
+                level=level,
+                data=data,
+                logger_name=logger_name,
+                related_request_id=related_request_id,
+            )
+        )
+        if self._sender is None or self._sender.done():
+            self._sender = asyncio.create_task(self._drain())
+
+    async def flush(self) -> None:
+        """Wait until every queued message has been handed to the transport."""
+        sender = self._sender
+        if sender is None:
+            return
+        try:
+            await asyncio.shield(sender)
+        except asyncio.CancelledError:
+            sender.cancel()
+            raise
+
+    async def _drain(self) -> None:
+        while self._pending:
+            item = self._pending.popleft()
+            try:
+                # Deprecated upstream in SDK v2 but deliberately kept per compat
+                # directive; removed with the multi-round-trip follow-up.
+                await item.session.send_log_message(  # ty: ignore[deprecated]
+                    level=item.level,
+                    data=item.data,
+                    logger=item.logger_name,
+                    related_request_id=item.related_request_id,
+                )
+            except Exception as e:
+                # A failed write must not strand the rest of the queue.
+                logger.debug(f"Failed to deliver queued client log message: {e}")
@@ -1,5 +1,9 @@
 """Middleware that dereferences $ref in JSON schemas before sending to clients."""
 
+import copy
+import hashlib
+import json
+from collections import OrderedDict
 from collections.abc import Sequence
 from typing import Any
 
@@ -18,8 +22,56 @@ class DereferenceRefsMiddleware(Middleware):
     Some MCP clients (e.g., VS Code Copilot) don't handle JSON Schema $ref
     properly. This middleware inlines all $ref definitions so schemas are
     self-contained. Enabled by default via ``FastMCP(dereference_schemas=True)``.
+
+    Dereferenced schemas are memoized by a hash of the source schema's content,
+    so repeated listings of an unchanged catalog skip the resolution work. At
+    most ``cache_size`` schemas are kept, evicting the least recently used.
+    Each call returns its own copy, so downstream edits can't corrupt the cache.
     """
 
+    def __init__(self, cache_size: int = 1024) -> None:
+        if cache_size <= 0:
+            raise ValueError("cache_size must be a positive integer")
+        self._cache_size = cache_size
+        self._cache: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+
+    def _dereference(self, schema: dict[str, Any]) -> dict[str, Any]:
+        # Hashing the schema costs a small fraction of resolving it, and unlike
+        # object identity it stays correct if a schema dict is mutated in place.
+        key = hashlib.sha256(
+            json.dumps(schema, sort_keys=True, default=str).encode()
+        ).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return copy.deepcopy(cached)
+        result = dereference_refs(schema)
+        self._cache[key] = result
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return copy.deepcopy(result)
+
+    def _dereference_tool(self, tool: Tool) -> Tool:
+        """Return a copy of the tool with dereferenced schemas."""
+        updates: dict[str, object] = {}
+        if _needs_dereference(tool.parameters):
+            updates["parameters"] = self._dereference(tool.parameters)
+        if tool.output_schema is not None and _needs_dereference(tool.output_schema):
+            updates["output_schema"] = self._dereference(tool.output_schema)
+        if updates:
+            return tool.model_copy(update=updates)
+        return tool
+
+    def _dereference_resource_template(
+        self, template: ResourceTemplate
+    ) -> ResourceTemplate:
+        """Return a copy of the template with dereferenced schemas."""
+        if _needs_dereference(template.parameters):
+            return template.model_copy(
+                update={"parameters": self._dereference(template.parameters)}
+            )
+        return template
+
     @override
     async def on_list_tools(
         self,
@@ -27,7 +79,7 @@ class DereferenceRefsMiddleware(Middleware):
         call_next: CallNext[mt.ListToolsRequest, Sequence[Tool]],
     ) -> Sequence[Tool]:
         tools = await call_next(context)
-        return [_dereference_tool(tool) for tool in tools]
+        return [self._dereference_tool(tool) for tool in tools]
 
     @override
     async def on_list_resource_templates(
@@ -38,30 +90,11 @@ class DereferenceRefsMiddleware(Middleware):
         ],
     ) -> Sequence[ResourceTemplate]:
         templates = await call_next(context)
-        return [_dereference_resource_template(t) for t in templates]
-
-
-def _dereference_tool(tool: Tool) -> Tool:
-    """Return a copy of the tool with dereferenced schemas."""
-    updates: dict[str, object] = {}
-    if "$defs" in tool.parameters or _has_ref(tool.parameters):
-        updates["parameters"] = dereference_refs(tool.parameters)
-    if tool.output_schema is not None and (
-        "$defs" in tool.output_schema or _has_ref(tool.output_schema)
-    ):
-        updates["output_schema"] = dereference_refs(tool.output_schema)
-    if updates:
-        return tool.model_copy(update=updates)
-    return tool
-
-
-def _dereference_resource_template(template: ResourceTemplate) -> ResourceTemplate:
-    """Return a copy of the template with dereferenced schemas."""
-    if "$defs" in template.parameters or _has_ref(template.parameters):
-        return template.model_copy(
-            update={"parameters": dereference_refs(template.parameters)}
-        )
-    return template
+        return [self._dereference_resource_template(t) for t in templates]
+
+
+def _needs_dereference(schema: dict[str, Any]) -> bool:
+    return "$defs" in schema or _has_ref(schema)
 
 
 def _has_ref(schema: dict[str, Any]) -> bool:
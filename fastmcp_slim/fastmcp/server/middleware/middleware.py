@@ -11,6 +11,7 @@ from typing import (
     Generic,
     Literal,
     Protocol,
+    cast,
     runtime_checkable,
 )
 
@@ -133,6 +134,25 @@ def make_handler_wrapper(
     return wrapper
 
 
+_METHOD_HOOKS: dict[str, str] = {
+    "initialize": "on_initialize",
+    "server/discover": "on_discover",
+    "tools/call": "on_call_tool",
+    "resources/read": "on_read_resource",
+    "prompts/get": "on_get_prompt",
+    "tools/list": "on_list_tools",
+    "resources/list": "on_list_resources",
+    "resources/templates/list": "on_list_resource_templates",
+    "prompts/list": "on_list_prompts",
+}
+"""The typed per-method hook for each MCP method that has one."""
+
+_TYPE_HOOKS: dict[str, str] = {
+    "request": "on_request",
+    "notification": "on_notification",
+}
+
+
 class Middleware:
     """Base class for FastMCP middleware with dispatching hooks."""
 
@@ -165,41 +185,35 @@ class Middleware:
     ) -> CallNext[Any, Any]:
         """Builds a chain of handlers for a given message and dispatch phase."""
         handler = call_next
+        for hook in reversed(self._hooks_for(context.method, context.type, phase)):
+            handler = make_handler_wrapper(hook, handler)
+        return handler
 
-        if phase in ("all", "typed"):
-            match context.method:
-                case "initialize":
-                    handler = make_handler_wrapper(self.on_initialize, handler)
-                case "server/discover":
-                    handler = make_handler_wrapper(self.on_discover, handler)
-                case "tools/call":
-                    handler = make_handler_wrapper(self.on_call_tool, handler)
-                case "resources/read":
-                    handler = make_handler_wrapper(self.on_read_resource, handler)
-                case "prompts/get":
-                    handler = make_handler_wrapper(self.on_get_prompt, handler)
-                case "tools/list":
-                    handler = make_handler_wrapper(self.on_list_tools, handler)
-                case "resources/list":
-                    handler = make_handler_wrapper(self.on_list_resources, handler)
-                case "resources/templates/list":
-                    handler = make_handler_wrapper(
-                        self.on_list_resource_templates,
-                        handler,
-                    )
-                case "prompts/list":
-                    handler = make_handler_wrapper(self.on_list_prompts, handler)
+    def _hooks_for(
+        self,
+        method: str | None,
+        message_type: Literal["request", "notification"],
+        phase: MiddlewarePhase = "all",
+    ) -> list[Callable[..., Awaitable[Any]]]:
+        """Return the hooks that handle a message, outermost first.
 
+        Hooks this middleware does not override only forward to ``call_next``,
+        so they are left out.
+        """
+        names: list[str] = []
         if phase in ("all", "outer"):
-            match context.type:
-                case "request":
-                    handler = make_handler_wrapper(self.on_request, handler)
-                case "notification":
-                    handler = make_handler_wrapper(self.on_notification, handler)
-
-            handler = make_handler_wrapper(self.on_message, handler)
-
-        return handler
+            names.append("on_message")
+            if message_type in _TYPE_HOOKS:
+                names.append(_TYPE_HOOKS[message_type])
+        if phase in ("all", "typed") and method in _METHOD_HOOKS:
+            names.append(_METHOD_HOOKS[method])
+
+        hooks = []
+        for name in names:
+            hook = getattr(self, name)
+            if getattr(hook, "__func__", None) is not getattr(Middleware, name):
+                hooks.append(hook)
+        return hooks
 
     async def on_message(
         self,
@@ -286,3 +300,57 @@ class Middleware:
         call_next: CallNext[mt.ListPromptsRequest, Sequence[Prompt]],
     ) -> Sequence[Prompt]:
         return await call_next(context)
+
+
+@dataclass(frozen=True, slots=True)
+class _ChainStep:
+    handler: Callable[..., Awaitable[Any]]
+    # Hooks take ``call_next`` by keyword; opaque middleware is called as
+    # ``middleware(context, call_next)``.
+    is_hook: bool
+
+
+def _uses_default_dispatch(middleware: Any) -> bool:
+    return (
+        isinstance(middleware, Middleware)
+        and type(middleware).__call__ is Middleware.__call__
+        and type(middleware)._dispatch_handler is Middleware._dispatch_handler
+    )
+
+
+def compile_middleware_chain(
+    middleware: Sequence[Middleware],
+    method: str | None,
+    message_type: Literal["request", "notification"],
+    phase: MiddlewarePhase = "all",
+) -> tuple[_ChainStep, ...]:
+    """Resolve a middleware stack into the flat list of handlers for one kind of message.
+
+    Middleware using the standard dispatch contributes only the hooks it
+    overrides; middleware that replaces ``__call__`` or ``_dispatch_handler``
+    is kept as a single opaque step. The result depends only on the stack and
+    the message's method, type, and phase, so it can be reused across requests.
+    """
+    steps: list[_ChainStep] = []
+    for mw in middleware:
+        if _uses_default_dispatch(mw):
+            steps.extend(
+                _ChainStep(hook, is_hook=True)
+                for hook in mw._hooks_for(method, message_type, phase)
+            )
+        else:
+            steps.append(_ChainStep(mw, is_hook=False))
+    return tuple(steps)
+
+
+def build_call_chain(
+    steps: Sequence[_ChainStep], call_next: CallNext[Any, Any]
+) -> CallNext[Any, Any]:
+    """Link compiled steps around the terminal handler for a single request."""
+    chain = call_next
+    for step in reversed(steps):
+        if step.is_hook:
+            chain = make_handler_wrapper(step.handler, chain)
+        else:
+            chain = make_middleware_wrapper(cast(Middleware, step.handler), chain)
+    return chain
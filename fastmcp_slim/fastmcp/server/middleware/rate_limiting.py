@@ -1,16 +1,25 @@
 """Rate limiting middleware for protecting FastMCP servers from abuse."""
 
+from __future__ import annotations
+
 import inspect
+import math
 import time
-from collections import defaultdict, deque
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, cast
 
-import anyio
 from mcp import MCPError
 
 from .middleware import CallNext, Middleware, MiddlewareContext
 
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+# Key used for the shared limiter when no client identity applies.
+GLOBAL_KEY = "global"
+
 
 class RateLimitError(MCPError):
     """Error raised when rate limit is exceeded."""
@@ -20,7 +29,13 @@ class RateLimitError(MCPError):
 
 
 class TokenBucketRateLimiter:
-    """Token bucket implementation for rate limiting."""
+    """Token bucket implementation for rate limiting.
+
+    Checks never await between reading and updating state, so they are
+    atomic on the event loop without a lock.
+    """
+
+    __slots__ = ("capacity", "last_refill", "refill_rate", "tokens")
 
     def __init__(self, capacity: int, refill_rate: float):
         """Initialize token bucket.
@@ -33,7 +48,6 @@ class TokenBucketRateLimiter:
         self.refill_rate = refill_rate
         self.tokens = capacity
         self.last_refill = time.time()
-        self._lock = anyio.Lock()
 
     async def consume(self, tokens: int = 1) -> bool:
         """Try to consume tokens from the bucket.
@@ -44,22 +58,41 @@ class TokenBucketRateLimiter:
         Returns:
             True if tokens were available and consumed, False otherwise
         """
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_refill
+        now = time.time()
+        elapsed = now - self.last_refill
+
+        # Add tokens based on elapsed time
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.last_refill = now
 
-            # Add tokens based on elapsed time
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
-            self.last_refill = now
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
 
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
-            return False
+    def resets_at(self) -> float:
+        """Return when the bucket will be full again if left untouched."""
+        if self.refill_rate <= 0:
+            return math.inf
+        return self.last_refill + (self.capacity - self.tokens) / self.refill_rate
 
 
 class SlidingWindowRateLimiter:
-    """Sliding window rate limiter implementation."""
+    """Sliding window counter rate limiter.
+
+    Approximates a true sliding window with two fixed windows: the request
+    count in the previous window is weighted by how much of it still overlaps
+    the sliding window, then added to the count in the current window. This
+    keeps constant memory per client regardless of the allowed rate.
+    """
+
+    __slots__ = (
+        "current_count",
+        "current_window",
+        "max_requests",
+        "previous_count",
+        "window_seconds",
+    )
 
     def __init__(self, max_requests: int, window_seconds: int):
         """Initialize sliding window rate limiter.
@@ -70,23 +103,284 @@ class SlidingWindowRateLimiter:
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = deque()
-        self._lock = anyio.Lock()
+        self.current_window = math.floor(time.time() / window_seconds)
+        self.current_count = 0
+        self.previous_count = 0
 
     async def is_allowed(self) -> bool:
         """Check if a request is allowed."""
-        async with self._lock:
-            now = time.time()
-            cutoff = now - self.window_seconds
+        position = time.time() / self.window_seconds
+        window = math.floor(position)
+
+        if window != self.current_window:
+            # Counts older than the previous window no longer overlap.
+            adjacent = window == self.current_window + 1
+            self.previous_count = self.current_count if adjacent else 0
+            self.current_count = 0
+            self.current_window = window
+
+        overlap = 1 - (position - window)
+        estimated = self.previous_count * overlap + self.current_count
+        if estimated < self.max_requests:
+            self.current_count += 1
+            return True
+        return False
+
+    def resets_at(self) -> float:
+        """Return when the window will be empty again if left untouched."""
+        return (self.current_window + 2) * self.window_seconds
+
+
+class _Resettable(Protocol):
+    def resets_at(self) -> float: ...
+
+
+_LimiterT = TypeVar("_LimiterT", bound=_Resettable)
+
+
+class RateLimitBackend(ABC):
+    """Storage for rate limiter state, keyed by client.
+
+    Each method checks and records a single request atomically, so a backend
+    shared between server replicas enforces one limit across all of them.
+    """
+
+    @abstractmethod
+    async def consume_token(self, key: str, capacity: int, refill_rate: float) -> bool:
+        """Take one token from the bucket for `key`.
+
+        Args:
+            key: Client identifier
+            capacity: Maximum number of tokens in the bucket
+            refill_rate: Tokens added per second
+
+        Returns:
+            True if a token was available and consumed, False otherwise
+        """
+
+    @abstractmethod
+    async def record_request(
+        self, key: str, max_requests: int, window_seconds: int
+    ) -> bool:
+        """Record a request for `key` in its sliding window.
+
+        Args:
+            key: Client identifier
+            max_requests: Maximum requests allowed in the time window
+            window_seconds: Time window in seconds
+
+        Returns:
+            True if the request fits in the window and was recorded
+        """
 
-            # Remove old requests outside the window
-            while self.requests and self.requests[0] < cutoff:
-                self.requests.popleft()
 
-            if len(self.requests) < self.max_requests:
-                self.requests.append(now)
-                return True
-            return False
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Process-local rate limiter state. Each server replica limits alone.
+
+    Clients are kept in least-recently-used order. Entries whose limiter has
+    fully reset are dropped, since a fresh limiter behaves identically, and
+    beyond `max_clients` the least recently seen client is evicted.
+    """
+
+    def __init__(self, max_clients: int = 10_000) -> None:
+        """Initialize the in-memory backend.
+
+        Args:
+            max_clients: Maximum number of clients tracked per limiter type.
+                An evicted client starts over with a fresh limiter, so set
+                this above the number of clients expected to be active at once.
+        """
+        if max_clients <= 0:
+            raise ValueError("max_clients must be a positive integer")
+        self.max_clients = max_clients
+        self.token_buckets: OrderedDict[str, TokenBucketRateLimiter] = OrderedDict()
+        self.sliding_windows: OrderedDict[str, SlidingWindowRateLimiter] = OrderedDict()
+
+    def get_token_bucket(
+        self, key: str, capacity: int, refill_rate: float
+    ) -> TokenBucketRateLimiter:
+        """Return the bucket for `key`, creating it full if needed."""
+        return self._get_or_create(
+            self.token_buckets,
+            key,
+            lambda: TokenBucketRateLimiter(capacity, refill_rate),
+        )
+
+    def get_sliding_window(
+        self, key: str, max_requests: int, window_seconds: int
+    ) -> SlidingWindowRateLimiter:
+        """Return the window for `key`, creating it empty if needed."""
+        return self._get_or_create(
+            self.sliding_windows,
+            key,
+            lambda: SlidingWindowRateLimiter(max_requests, window_seconds),
+        )
+
+    def _get_or_create(
+        self,
+        limiters: OrderedDict[str, _LimiterT],
+        key: str,
+        factory: Callable[[], _LimiterT],
+    ) -> _LimiterT:
+        limiter = limiters.get(key)
+        if limiter is not None:
+            limiters.move_to_end(key)
+            return limiter
+
+        # Idle clients sit at the front; drop those whose state has reset.
+        now = time.time()
+        while limiters:
+            oldest = next(iter(limiters.values()))
+            if len(limiters) < self.max_clients and oldest.resets_at() > now:
+                break
+            limiters.popitem(last=False)
+
+        limiter = limiters[key] = factory()
+        return limiter
+
+    async def consume_token(self, key: str, capacity: int, refill_rate: float) -> bool:
+        return await self.get_token_bucket(key, capacity, refill_rate).consume()
+
+    async def record_request(
+        self, key: str, max_requests: int, window_seconds: int
+    ) -> bool:
+        return await self.get_sliding_window(
+            key, max_requests, window_seconds
+        ).is_allowed()
+
+
+# Both scripts take the current time as an argument instead of calling Redis
+# TIME, so replicas need reasonably synchronized clocks. Elapsed time is
+# clamped at zero so a replica running slightly behind can't drain a bucket.
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+
+local tokens = tonumber(redis.call("HGET", KEYS[1], "tokens"))
+local stored_refill = redis.call("HGET", KEYS[1], "last_refill")
+local last_refill = tonumber(stored_refill)
+if tokens == nil or last_refill == nil then
+    tokens = capacity
+    last_refill = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - last_refill) * refill_rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+-- A caller whose clock is behind must not rewind the refill time, or the next
+-- caller would be credited for the same span twice.
+local refilled_at = ARGV[3]
+if last_refill > now then
+    refilled_at = stored_refill
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "last_refill", refilled_at)
+if tonumber(ARGV[4]) > 0 then
+    redis.call("PEXPIRE", KEYS[1], ARGV[4])
+end
+return allowed
+"""
+
+_SLIDING_WINDOW_SCRIPT = """
+local max_requests = tonumber(ARGV[1])
+local position = tonumber(ARGV[2]) / tonumber(ARGV[3])
+local window = math.floor(position)
+
+local current_window = tonumber(redis.call("HGET", KEYS[1], "window"))
+local current = tonumber(redis.call("HGET", KEYS[1], "current")) or 0
+local previous = tonumber(redis.call("HGET", KEYS[1], "previous")) or 0
+if current_window ~= window then
+    if current_window == window - 1 then
+        previous = current
+    else
+        previous = 0
+    end
+    current = 0
+end
+
+if previous * (1 - (position - window)) + current >= max_requests then
+    return 0
+end
+
+redis.call("HSET", KEYS[1], "window", window, "current", current + 1, "previous", previous)
+redis.call("PEXPIRE", KEYS[1], ARGV[4])
+return 1
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Rate limiter state shared through Redis.
+
+    Every check runs as a single Lua script that reads, updates, and expires
+    the client's state atomically, so each request costs one round trip and
+    concurrent replicas can't both spend the same token. Idle keys expire
+    once their state would have fully reset.
+
+    Example:
+        ```python
+        from redis.asyncio import Redis
+
+        from fastmcp.server.middleware.rate_limiting import (
+            RateLimitingMiddleware,
+            RedisRateLimitBackend,
+        )
+
+        backend = RedisRateLimitBackend(Redis.from_url("redis://localhost"))
+        mcp.add_middleware(RateLimitingMiddleware(max_requests_per_second=10, backend=backend))
+        ```
+    """
+
+    def __init__(self, redis: Redis, key_prefix: str = "fastmcp:ratelimit:"):
+        """Initialize the Redis backend.
+
+        Args:
+            redis: An async Redis client, such as `redis.asyncio.Redis`
+            key_prefix: Prefix for every key written. Give each middleware
+                that shares a Redis instance its own prefix.
+        """
+        self.redis = redis
+        self.key_prefix = key_prefix
+        self._token_bucket = redis.register_script(_TOKEN_BUCKET_SCRIPT)
+        self._sliding_window = redis.register_script(_SLIDING_WINDOW_SCRIPT)
+
+    async def consume_token(self, key: str, capacity: int, refill_rate: float) -> bool:
+        # An untouched bucket is full again after capacity / refill_rate
+        # seconds, at which point the key is indistinguishable from a new one.
+        # A bucket that never refills must never expire.
+        ttl_ms = math.ceil(capacity / refill_rate * 1000) + 1 if refill_rate > 0 else 0
+        allowed = await self._token_bucket(
+            keys=[f"{self.key_prefix}bucket:{key}"],
+            args=[capacity, repr(float(refill_rate)), repr(time.time()), ttl_ms],
+        )
+        return bool(allowed)
+
+    async def record_request(
+        self, key: str, max_requests: int, window_seconds: int
+    ) -> bool:
+        allowed = await self._sliding_window(
+            keys=[f"{self.key_prefix}window:{key}"],
+            args=[
+                max_requests,
+                repr(time.time()),
+                window_seconds,
+                # Counts stop mattering two windows after the last request.
+                window_seconds * 2000,
+            ],
+        )
+        return bool(allowed)
+
+
+def _in_memory(backend: RateLimitBackend) -> InMemoryRateLimitBackend:
+    if not isinstance(backend, InMemoryRateLimitBackend):
+        raise TypeError(
+            f"Limiter state is only inspectable with the in-memory backend, "
+            f"not {type(backend).__name__}"
+        )
+    return backend
 
 
 class RateLimitingMiddleware(Middleware):
@@ -118,6 +412,7 @@ class RateLimitingMiddleware(Middleware):
         | Callable[[MiddlewareContext], Awaitable[str]]
         | None = None,
         global_limit: bool = False,
+        backend: RateLimitBackend | None = None,
     ):
         """Initialize rate limiting middleware.
 
@@ -127,25 +422,27 @@ class RateLimitingMiddleware(Middleware):
             get_client_id: Function to extract client ID from context. Can be sync or async.
                 If None, uses global limiting
             global_limit: If True, apply limit globally; if False, per-client
+            backend: Where limiter state is kept. Defaults to process memory;
+                use `RedisRateLimitBackend` to share limits across replicas.
         """
         self.max_requests_per_second = max_requests_per_second
         self.burst_capacity = burst_capacity or int(max_requests_per_second * 2)
         self.get_client_id = get_client_id
         self.global_limit = global_limit
-
-        # Storage for rate limiters per client
-        self.limiters: dict[str, TokenBucketRateLimiter] = defaultdict(
-            lambda: TokenBucketRateLimiter(
-                self.burst_capacity, self.max_requests_per_second
-            )
+        self.backend = backend or InMemoryRateLimitBackend()
+
+    @property
+    def limiters(self) -> dict[str, TokenBucketRateLimiter]:
+        """Per-client token buckets held by the in-memory backend."""
+        return _in_memory(self.backend).token_buckets
+
+    @property
+    def global_limiter(self) -> TokenBucketRateLimiter:
+        """The shared token bucket used when `global_limit` is set."""
+        return _in_memory(self.backend).get_token_bucket(
+            GLOBAL_KEY, self.burst_capacity, self.max_requests_per_second
         )
 
-        # Global rate limiter
-        if self.global_limit:
-            self.global_limiter = TokenBucketRateLimiter(
-                self.burst_capacity, self.max_requests_per_second
-            )
-
     async def _get_client_identifier(self, context: MiddlewareContext) -> str:
         """Get client identifier for rate limiting."""
         if self.get_client_id:
@@ -153,20 +450,23 @@ class RateLimitingMiddleware(Middleware):
             if inspect.isawaitable(client_id):
                 return cast(str, await client_id)
             return client_id
-        return "global"
+        return GLOBAL_KEY
 
     async def on_request(self, context: MiddlewareContext, call_next: CallNext) -> Any:
         """Apply rate limiting to requests."""
         if self.global_limit:
             # Global rate limiting
-            allowed = await self.global_limiter.consume()
+            allowed = await self.backend.consume_token(
+                GLOBAL_KEY, self.burst_capacity, self.max_requests_per_second
+            )
             if not allowed:
                 raise RateLimitError("Global rate limit exceeded")
         else:
             # Per-client rate limiting
             client_id = await self._get_client_identifier(context)
-            limiter = self.limiters[client_id]
-            allowed = await limiter.consume()
+            allowed = await self.backend.consume_token(
+                client_id, self.burst_capacity, self.max_requests_per_second
+            )
             if not allowed:
                 raise RateLimitError(f"Rate limit exceeded for client: {client_id}")
 
@@ -176,8 +476,8 @@ class RateLimitingMiddleware(Middleware):
 class SlidingWindowRateLimitingMiddleware(Middleware):
     """Middleware that implements sliding window rate limiting.
 
-    Uses a sliding window approach which provides more precise rate limiting
-    but uses more memory to track individual request timestamps.
+    Uses a sliding window counter, which smooths out the bursts a fixed window
+    allows at its boundaries while keeping constant memory per client.
 
     Example:
         ```python
@@ -201,6 +501,7 @@ class SlidingWindowRateLimitingMiddleware(Middleware):
         get_client_id: Callable[[MiddlewareContext], str]
         | Callable[[MiddlewareContext], Awaitable[str]]
         | None = None,
+        backend: RateLimitBackend | None = None,
     ):
         """Initialize sliding window rate limiting middleware.
 
@@ -209,15 +510,18 @@ class SlidingWindowRateLimitingMiddleware(Middleware):
             window_minutes: Time window in minutes
             get_client_id: Function to extract client ID from context. Can be sync or async.
                 If None, uses global limiting
+            backend: Where limiter state is kept. Defaults to process memory;
+                use `RedisRateLimitBackend` to share limits across replicas.
         """
         self.max_requests = max_requests
         self.window_seconds = window_minutes * 60
         self.get_client_id = get_client_id
+        self.backend = backend or InMemoryRateLimitBackend()
 
-        # Storage for rate limiters per client
-        self.limiters: dict[str, SlidingWindowRateLimiter] = defaultdict(
-            lambda: SlidingWindowRateLimiter(self.max_requests, self.window_seconds)
-        )
+    @property
+    def limiters(self) -> dict[str, SlidingWindowRateLimiter]:
+        """Per-client sliding windows held by the in-memory backend."""
+        return _in_memory(self.backend).sliding_windows
 
     async def _get_client_identifier(self, context: MiddlewareContext) -> str:
         """Get client identifier for rate limiting."""
@@ -226,14 +530,15 @@ class SlidingWindowRateLimitingMiddleware(Middleware):
             if inspect.isawaitable(client_id):
                 return cast(str, await client_id)
             return client_id
-        return "global"
+        return GLOBAL_KEY
 
     async def on_request(self, context: MiddlewareContext, call_next: CallNext) -> Any:
         """Apply sliding window rate limiting to requests."""
         client_id = await self._get_client_identifier(context)
-        limiter = self.limiters[client_id]
 
-        allowed = await limiter.is_allowed()
+        allowed = await self.backend.record_request(
+            client_id, self.max_requests, self.window_seconds
+        )
         if not allowed:
             raise RateLimitError(
                 f"Rate limit exceeded: {self.max_requests} requests per "
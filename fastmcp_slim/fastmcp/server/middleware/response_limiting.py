@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from typing import Any
 
 import mcp_types as mt
 import pydantic_core
 from mcp_types import TextContent
+from pydantic import BaseModel
 
 from fastmcp.tools.base import InputRequiredToolResult, ToolResult
 
@@ -17,6 +19,104 @@ __all__ = ["ResponseLimitingMiddleware"]
 
 logger = logging.getLogger(__name__)
 
+_TEXT_SEPARATOR = "\n\n"
+
+
+def _estimate_json_size(value: Any, budget: int) -> int:
+    """Estimate the serialized JSON size of `value` in bytes.
+
+    Walks the value instead of serializing it and returns as soon as the
+    running total exceeds `budget`, so the cost is bounded by the budget
+    rather than by the size of the value. Strings are measured exactly;
+    results at or under the budget are close to, but not guaranteed to
+    equal, `pydantic_core.to_json` of the whole value.
+    """
+    if isinstance(value, str):
+        # Every character takes at least one byte, so an over-long string
+        # is over budget without looking at its contents.
+        if len(value) > budget:
+            return len(value)
+        # Serializing one string is a single pass in Rust, faster than
+        # counting escapes in Python, and exact for every control character.
+        return len(pydantic_core.to_json(value))
+    if value is None or isinstance(value, bool):
+        return 4 if value is None or value else 5
+    if isinstance(value, int | float):
+        return len(repr(value))
+    if isinstance(value, BaseModel):
+        fields = type(value).model_fields
+        items = [(fields[name].alias or name, getattr(value, name)) for name in fields]
+        items.extend((value.model_extra or {}).items())
+        return _estimate_items_size(items, budget)
+    if isinstance(value, dict):
+        return _estimate_items_size(value.items(), budget)
+    if isinstance(value, list | tuple):
+        size = 2 + max(len(value) - 1, 0)
+        for item in value:
+            size += _estimate_json_size(item, budget - size)
+            if size > budget:
+                break
+        return size
+    return len(str(value)) + 2
+
+
+def _estimate_items_size(items: Any, budget: int) -> int:
+    size = 1
+    for key, item in items:
+        # Quoted key, colon, and the comma or closing brace after the value.
+        size += len(str(key)) + 4
+        size += _estimate_json_size(item, budget - size)
+        if size > budget:
+            break
+    # An empty object still needs its closing brace.
+    return max(size, 2)
+
+
+def _fit_escaped(text: str, max_bytes: int) -> str:
+    """Shorten `text` until its JSON-escaped form fits in `max_bytes`.
+
+    Quotes, backslashes, and control characters grow when escaped (up to six
+    bytes for a `\\u00XX` escape), so text cut to `max_bytes` of UTF-8 can
+    still serialize larger than that. Every character takes at least one
+    byte, so dropping one character per excess byte always fits; that is
+    used directly when it keeps most of what a proportional cut would.
+    Dense escapes (such as a run of control characters) get a proportional
+    cut instead, measured once more.
+    """
+    size = len(pydantic_core.to_json(text)) - 2
+    if size <= max_bytes:
+        return text
+    proportional = len(text) * max_bytes // size
+    if len(text) - (size - max_bytes) < proportional * 0.9:
+        text = text[:proportional]
+        size = len(pydantic_core.to_json(text)) - 2
+        if size <= max_bytes:
+            return text
+    return text[: max(len(text) - (size - max_bytes), 0)]
+
+
+def _join_prefix(texts: Sequence[str], max_bytes: int) -> str:
+    """Join `texts` with blank lines, stopping after `max_bytes` bytes.
+
+    Only the slices needed to reach `max_bytes` are copied. The result may
+    run past `max_bytes` by up to a factor of four for multi-byte text; the
+    caller trims it to an exact byte length.
+    """
+    pieces: list[str] = []
+    size = 0
+    for i, text in enumerate(texts):
+        if size >= max_bytes:
+            break
+        if i:
+            pieces.append(_TEXT_SEPARATOR)
+            size += len(_TEXT_SEPARATOR)
+        # Each character is at least one byte, so this slice covers the
+        # remaining bytes.
+        piece = text[: max(max_bytes - size, 0)]
+        pieces.append(piece)
+        size += len(piece)
+    return "".join(pieces)
+
 
 class ResponseLimitingMiddleware(Middleware):
     """Middleware that limits the response size of tool calls.
@@ -68,16 +168,20 @@ class ResponseLimitingMiddleware(Middleware):
         self.truncation_suffix = truncation_suffix
         self.tools = set(tools) if tools is not None else None
 
+    def _target_size(self) -> int:
+        """Bytes of text that fit alongside the suffix and JSON wrapper."""
+        suffix_bytes = len(self.truncation_suffix.encode("utf-8"))
+        # Account for JSON wrapper overhead: {"content":[{"type":"text","text":"..."}]}
+        overhead = 50
+        return self.max_size - suffix_bytes - overhead
+
     def _truncate_to_result(
         self,
         text: str,
         meta: dict[str, Any] | None = None,
     ) -> ToolResult:
         """Truncate text to fit within max_size and wrap in ToolResult."""
-        suffix_bytes = len(self.truncation_suffix.encode("utf-8"))
-        # Account for JSON wrapper overhead: {"content":[{"type":"text","text":"..."}]}
-        overhead = 50
-        target_size = self.max_size - suffix_bytes - overhead
+        target_size = self._target_size()
 
         if target_size <= 0:
             # Edge case: max_size too small for even the suffix
@@ -85,13 +189,9 @@ class ResponseLimitingMiddleware(Middleware):
         else:
             # Truncate to target size, preserving UTF-8 boundaries
             encoded = text.encode("utf-8")
-            if len(encoded) <= target_size:
-                truncated = text + self.truncation_suffix
-            else:
-                truncated = (
-                    encoded[:target_size].decode("utf-8", errors="ignore")
-                    + self.truncation_suffix
-                )
+            if len(encoded) > target_size:
+                text = encoded[:target_size].decode("utf-8", errors="ignore")
+            truncated = _fit_escaped(text, target_size) + self.truncation_suffix
 
         # Preserve original meta, falling back to {} when absent. Having
         # meta set ensures to_mcp_result() returns a CallToolResult, which
@@ -128,24 +228,23 @@ class ResponseLimitingMiddleware(Middleware):
         if self.tools is not None and context.message.name not in self.tools:
             return result
 
-        # Measure serialized size
-        serialized = pydantic_core.to_json(result, fallback=str)
-        if len(serialized) <= self.max_size:
+        # Estimate size incrementally, stopping once the limit is crossed
+        if _estimate_json_size(result, self.max_size) <= self.max_size:
             return result
 
         # Over limit: extract text, truncate, return single TextContent
         logger.warning(
-            "Tool %r response exceeds size limit: %d bytes > %d bytes, truncating",
+            "Tool %r response exceeds size limit of %d bytes, truncating",
             context.message.name,
-            len(serialized),
             self.max_size,
         )
 
         texts = [b.text for b in result.content if isinstance(b, TextContent)]
-        text = (
-            "\n\n".join(texts)
-            if texts
-            else serialized.decode("utf-8", errors="replace")
-        )
+        if texts:
+            # Slice just the leading text rather than joining every block.
+            text = _join_prefix(texts, max(self._target_size(), 0))
+        else:
+            serialized = pydantic_core.to_json(result, fallback=str)
+            text = serialized.decode("utf-8", errors="replace")
 
         return self._truncate_to_result(text, meta=result.meta)
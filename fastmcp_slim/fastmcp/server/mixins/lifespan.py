@@ -195,6 +195,7 @@ class LifespanMixin:
             user_lifespan_result = await stack.enter_async_context(self._lifespan(self))
             await stack.enter_async_context(self._shared_context_lifespan())
             await stack.enter_async_context(self._extensions_lifespan())
+            await stack.enter_async_context(self._http_resource_client)
 
             self._lifespan_result = user_lifespan_result
             self._lifespan_result_set = True
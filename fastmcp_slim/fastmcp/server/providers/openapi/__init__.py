@@ -19,6 +19,7 @@ from fastmcp.server.providers.openapi.components import (
     OpenAPIResourceTemplate,
     OpenAPITool,
 )
+from fastmcp.server.providers.openapi.http_cache import OpenAPIHTTPCache
 from fastmcp.server.providers.openapi.provider import OpenAPIProvider
 from fastmcp.server.providers.openapi.routing import (
     ComponentFn,
@@ -30,6 +31,7 @@ from fastmcp.server.providers.openapi.routing import (
 __all__ = [
     "ComponentFn",
     "MCPType",
+    "OpenAPIHTTPCache",
     "OpenAPIProvider",
     "OpenAPIResource",
     "OpenAPIResourceTemplate",
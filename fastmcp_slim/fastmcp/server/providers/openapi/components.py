@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import re
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import httpx2
@@ -17,6 +18,7 @@ from fastmcp.resources import (
     ResourceTemplate,
 )
 from fastmcp.server.dependencies import get_http_headers
+from fastmcp.server.providers.openapi.http_cache import OpenAPIHTTPCache
 from fastmcp.tools.base import Tool, ToolResult
 from fastmcp.utilities.exceptions import is_request_error, is_timeout_error
 from fastmcp.utilities.logging import get_logger
@@ -283,6 +285,7 @@ class OpenAPIResource(Resource):
         mime_type: str = "application/json",
         tags: set[str] | None = None,
         arguments: dict[str, Any] | None = None,
+        http_cache: OpenAPIHTTPCache | None = None,
     ):
         super().__init__(
             uri=AnyUrl(uri),
@@ -295,6 +298,7 @@ class OpenAPIResource(Resource):
         self._route = route
         self._director = director
         self._arguments = dict(arguments or {})
+        self._http_cache = http_cache
 
     def __repr__(self) -> str:
         return f"OpenAPIResource(name={self.name!r}, uri={self.uri!r}, path={self._route.path})"
@@ -321,7 +325,11 @@ class OpenAPIResource(Resource):
             if mcp_headers:
                 request.headers.update(mcp_headers)
 
-            response = await _send_request(self._client, request)
+            send = partial(_send_request, self._client)
+            if self._http_cache is not None:
+                response = await self._http_cache.send(request, send)
+            else:
+                response = await send(request)
             _raise_for_status(response)
 
             content_type = response.headers.get("content-type", "").lower()
@@ -380,6 +388,7 @@ class OpenAPIResourceTemplate(ResourceTemplate):
         parameters: dict[str, Any],
         tags: set[str] | None = None,
         mime_type: str = _DEFAULT_MIME_TYPE,
+        http_cache: OpenAPIHTTPCache | None = None,
     ):
         super().__init__(
             uri_template=uri_template,
@@ -392,6 +401,7 @@ class OpenAPIResourceTemplate(ResourceTemplate):
         self._client = client
         self._route = route
         self._director = director
+        self._http_cache = http_cache
 
     def __repr__(self) -> str:
         return f"OpenAPIResourceTemplate(name={self.name!r}, uri_template={self.uri_template!r}, path={self._route.path})"
@@ -426,4 +436,5 @@ class OpenAPIResourceTemplate(ResourceTemplate):
             mime_type=self.mime_type,
             tags=set(self._route.tags or []),
             arguments=arguments,
+            http_cache=self._http_cache,
         )
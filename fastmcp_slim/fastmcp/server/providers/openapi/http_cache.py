@@ -0,0 +1,290 @@
+"""HTTP response cache for OpenAPI-backed resource reads."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+
+import httpx2
+from key_value.aio.adapters.pydantic import PydanticAdapter
+from key_value.aio.protocols.key_value import AsyncKeyValue
+from key_value.aio.stores.memory import MemoryStore
+from key_value.aio.wrappers.limit_size import LimitSizeWrapper
+from pydantic import Field
+
+from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.types import FastMCPBaseModel
+
+__all__ = [
+    "OpenAPIHTTPCache",
+]
+
+logger = get_logger(__name__)
+
+ONE_MB_IN_BYTES = 1024 * 1024
+
+DEFAULT_PARTITION_HEADERS: tuple[str, ...] = (
+    "authorization",
+    "proxy-authorization",
+    "cookie",
+    "x-api-key",
+)
+
+_CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+_CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+# Headers that describe the wire encoding rather than the (already decoded)
+# body we store, so they must not be replayed on a cached response.
+_UNSTORED_HEADERS = frozenset(
+    {"connection", "content-encoding", "content-length", "transfer-encoding"}
+)
+
+
+class _CachedResponse(FastMCPBaseModel):
+    """A stored upstream response plus the metadata needed to reuse it."""
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    # Base64-encoded so binary bodies survive JSON-backed stores.
+    content: str
+    etag: str | None = None
+    last_modified: str | None = None
+    expires_at: float
+    must_revalidate: bool = False
+    # Request header values named by the response's Vary header.
+    vary: dict[str, str | None] = Field(default_factory=dict)
+
+    def matches(self, request: httpx2.Request) -> bool:
+        return all(
+            request.headers.get(name) == value for name, value in self.vary.items()
+        )
+
+    def to_response(self, request: httpx2.Request) -> httpx2.Response:
+        return httpx2.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=base64.b64decode(self.content),
+            request=request,
+        )
+
+
+@dataclass
+class _CachePolicy:
+    """Normalized cache directives parsed from response headers."""
+
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+    no_store: bool
+    must_revalidate: bool
+
+
+def _parse_cache_policy(headers: Mapping[str, str], now: float) -> _CachePolicy:
+    """Derive cache behavior from Cache-Control, Expires, and validators.
+
+    Unlike CIMD documents, API responses without explicit freshness are
+    treated as immediately stale: they are only reused after a successful
+    revalidation, never served blind.
+    """
+    normalized = {k.lower(): v for k, v in headers.items()}
+    directives = {
+        part.strip().lower()
+        for part in normalized.get("cache-control", "").split(",")
+        if part.strip()
+    }
+
+    max_age: int | None = None
+    for directive in directives:
+        if directive.startswith("max-age="):
+            value = directive.removeprefix("max-age=").strip()
+            try:
+                max_age = max(0, int(value))
+            except ValueError:
+                logger.debug("Ignoring invalid Cache-Control max-age value: %s", value)
+            break
+
+    expires_at = now
+    if max_age is not None:
+        expires_at = now + max_age
+    elif "expires" in normalized:
+        try:
+            dt = parsedate_to_datetime(normalized["expires"])
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            expires_at = dt.timestamp()
+        except (TypeError, ValueError):
+            logger.debug("Ignoring invalid Expires header: %s", normalized["expires"])
+
+    return _CachePolicy(
+        etag=normalized.get("etag"),
+        last_modified=normalized.get("last-modified"),
+        expires_at=expires_at,
+        no_store="no-store" in directives,
+        must_revalidate="no-cache" in directives,
+    )
+
+
+class OpenAPIHTTPCache:
+    """Caches upstream GET responses for `OpenAPIProvider` resources.
+
+    Responses are reused while fresh according to `Cache-Control: max-age` or
+    `Expires`. Once stale, an entry carrying an `ETag` or `Last-Modified`
+    validator is revalidated with `If-None-Match`/`If-Modified-Since`, and a
+    `304 Not Modified` reply serves the stored body. `no-store` responses and
+    `Vary: *` responses are never stored, and `no-cache` forces revalidation
+    on every read.
+
+    Entries are partitioned by the values of `partition_headers` on the
+    outgoing request, so responses fetched with one caller's credentials are
+    never served to another. Bodies are kept in `storage` (an in-memory LRU of
+    `max_entries` responses by default); entries larger than `max_item_size`
+    bytes are not cached.
+    """
+
+    def __init__(
+        self,
+        storage: AsyncKeyValue | None = None,
+        *,
+        max_entries: int = 1024,
+        max_item_size: int = ONE_MB_IN_BYTES,
+        partition_headers: Iterable[str] = DEFAULT_PARTITION_HEADERS,
+    ):
+        """Initialize the cache.
+
+        Args:
+            storage: Backend for cached responses. If None, an in-memory LRU
+                store holding up to `max_entries` responses is used.
+            max_entries: Maximum number of responses kept by the default
+                in-memory store. Ignored when `storage` is given.
+            max_item_size: Maximum serialized size of a cached response.
+                Larger responses are passed through uncached. Defaults to 1MB.
+            partition_headers: Request headers whose values partition the
+                cache. Include every header that carries credentials upstream.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+
+        backend = storage or MemoryStore(max_entries_per_collection=max_entries)
+        self._store: PydanticAdapter[_CachedResponse] = PydanticAdapter(
+            # When the size limit is exceeded, the put will silently fail
+            key_value=LimitSizeWrapper(
+                key_value=backend, max_size=max_item_size, raise_on_too_large=False
+            ),
+            pydantic_model=_CachedResponse,
+            default_collection="openapi/http",
+        )
+        self._partition_headers = tuple(h.lower() for h in partition_headers)
+
+    def _cache_key(self, request: httpx2.Request) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{request.method} {request.url}".encode())
+        for name in self._partition_headers:
+            digest.update(b"\0")
+            digest.update(name.encode())
+            digest.update(b"\0")
+            for value in request.headers.get_list(name):
+                digest.update(value.encode())
+        return digest.hexdigest()
+
+    async def send(
+        self,
+        request: httpx2.Request,
+        send: Callable[[httpx2.Request], Awaitable[httpx2.Response]],
+    ) -> httpx2.Response:
+        """Serve `request` from the cache, revalidating or fetching via `send`."""
+        # Requests that already carry validators are the caller's own
+        # conditional requests; their 304s mean nothing to this cache.
+        if request.method not in _CACHEABLE_METHODS or any(
+            name in request.headers for name in _CONDITIONAL_HEADERS
+        ):
+            return await send(request)
+
+        key = self._cache_key(request)
+        now = time.time()
+
+        cached = await self._store.get(key=key)
+        if cached is not None and not cached.matches(request):
+            cached = None
+
+        if cached is not None:
+            if not cached.must_revalidate and now < cached.expires_at:
+                return cached.to_response(request)
+            if cached.etag:
+                request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request.headers["If-Modified-Since"] = cached.last_modified
+
+        response = await send(request)
+
+        if response.status_code == 304 and cached is not None:
+            policy = _parse_cache_policy(response.headers, now)
+            if policy.no_store:
+                await self._store.delete(key=key)
+            else:
+                # A 304 refreshes freshness and may rotate validators; the
+                # stored body stays authoritative.
+                await self._store.put(
+                    key=key,
+                    value=cached.model_copy(
+                        update={
+                            "etag": policy.etag or cached.etag,
+                            "last_modified": policy.last_modified
+                            or cached.last_modified,
+                            "expires_at": policy.expires_at,
+                            "must_revalidate": policy.must_revalidate,
+                        }
+                    ),
+                )
+            return cached.to_response(request)
+
+        if response.status_code == 200:
+            await self._store_response(key, request, response, now)
+        elif cached is not None:
+            await self._store.delete(key=key)
+        return response
+
+    async def _store_response(
+        self,
+        key: str,
+        request: httpx2.Request,
+        response: httpx2.Response,
+        now: float,
+    ) -> None:
+        policy = _parse_cache_policy(response.headers, now)
+        vary = [
+            name.strip().lower()
+            for name in response.headers.get("vary", "").split(",")
+            if name.strip()
+        ]
+        has_validator = policy.etag is not None or policy.last_modified is not None
+        is_fresh = now < policy.expires_at and not policy.must_revalidate
+
+        # An entry that can be neither served nor revalidated is dead weight.
+        if policy.no_store or "*" in vary or not (is_fresh or has_validator):
+            await self._store.delete(key=key)
+            return
+
+        await self._store.put(
+            key=key,
+            value=_CachedResponse(
+                status_code=response.status_code,
+                headers=[
+                    (name, value)
+                    for name, value in response.headers.multi_items()
+                    if name.lower() not in _UNSTORED_HEADERS
+                ],
+                content=base64.b64encode(response.content).decode("ascii"),
+                etag=policy.etag,
+                last_modified=policy.last_modified,
+                expires_at=policy.expires_at,
+                must_revalidate=policy.must_revalidate,
+                vary={name: request.headers.get(name) for name in vary},
+            ),
+            # Without a validator the entry is useless once stale, so let the
+            # backend expire it.
+            ttl=None if has_validator else policy.expires_at - now,
+        )
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import warnings
-from collections import Counter
+from collections import Counter, OrderedDict
 from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Literal, cast
 
 import httpx2
@@ -14,6 +16,7 @@ from jsonschema_path import SchemaPath
 from fastmcp._warnings import FastMCPDeprecationWarning
 from fastmcp.prompts import Prompt
 from fastmcp.resources import Resource, ResourceTemplate
+from fastmcp.resources.template import match_uri_template
 from fastmcp.server.providers.base import Provider
 from fastmcp.server.providers.openapi.components import (
     OpenAPIResource,
@@ -22,6 +25,7 @@ from fastmcp.server.providers.openapi.components import (
     _extract_mime_type_from_route,
     _slugify,
 )
+from fastmcp.server.providers.openapi.http_cache import OpenAPIHTTPCache
 from fastmcp.server.providers.openapi.routing import (
     DEFAULT_ROUTE_MAPPINGS,
     ComponentFn,
@@ -35,8 +39,11 @@ from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.openapi import (
     HTTPRoute,
+    JsonSchema,
     extract_output_schema_from_responses,
+    load_or_parse_http_routes,
     parse_openapi_to_http_routes,
+    route_key,
 )
 from fastmcp.utilities.openapi.director import RequestDirector
 from fastmcp.utilities.versions import VersionSpec, version_sort_key
@@ -58,11 +65,33 @@ def _is_legacy_httpx_client(client: object) -> bool:
     )
 
 
+@dataclass
+class _IndexedRoute:
+    """A route assigned to a component, before its component is built."""
+
+    route: HTTPRoute
+    name: str
+    tags: set[str]
+
+
+def _template_uri(route: HTTPRoute, template_name: str) -> str:
+    """Build the resource URI template for a route's path parameters."""
+    path_params = sorted(p.name for p in route.parameters if p.location == "path")
+    uri_template = f"resource://{template_name}"
+    if path_params:
+        uri_template += "/" + "/".join(f"{{{p}}}" for p in path_params)
+    return uri_template
+
+
 class OpenAPIProvider(Provider):
     """Provider that creates MCP components from an OpenAPI specification.
 
-    Components are created eagerly during initialization by parsing the OpenAPI
-    spec. Each component makes HTTP calls to the described API endpoints.
+    By default components are created eagerly during initialization by parsing
+    the OpenAPI spec. With `lazy=True`, the spec's routes are parsed and indexed
+    by name during initialization, and each component (with its input and
+    output schemas) is built the first time it is listed or looked up. At most
+    `lazy_cache_size` looked-up components and as many listed ones are kept.
+    Each component makes HTTP calls to the described API endpoints.
 
     Example:
         ```python
@@ -89,6 +118,10 @@ class OpenAPIProvider(Provider):
         mcp_names: dict[str, str] | None = None,
         tags: set[str] | None = None,
         validate_output: bool = True,
+        lazy: bool = False,
+        lazy_cache_size: int | None = 1024,
+        route_cache_dir: str | Path | None = None,
+        http_cache: OpenAPIHTTPCache | None = None,
     ):
         """Initialize provider by parsing OpenAPI spec and creating components.
 
@@ -109,9 +142,28 @@ class OpenAPIProvider(Provider):
                 extracted from the OpenAPI spec for response validation. If
                 False, a permissive schema is used instead, allowing any
                 response structure while still returning structured JSON.
+            lazy: If True, only index the spec's routes by name during
+                initialization, and build each component when it is listed or
+                looked up. Useful for very large specs where clients only use
+                a handful of operations. `mcp_component_fn` runs each time
+                a component is built and must not rename it.
+            lazy_cache_size: Maximum number of components built by lookups
+                kept in lazy mode, evicting the least recently used. Listings
+                keep up to as many of the components they build in a separate
+                store, so they do not churn the lookup cache. None means
+                unbounded.
+            route_cache_dir: Optional directory for a persistent cache of the
+                parsed spec. Entries are keyed by a hash of the spec content and
+                the fastmcp version; a valid entry replaces parsing at start-up.
+            http_cache: Optional cache for upstream GET responses behind
+                resources and resource templates. Honors Cache-Control and
+                revalidates stale entries with ETag/Last-Modified.
         """
         super().__init__()
 
+        if lazy_cache_size is not None and lazy_cache_size <= 0:
+            raise ValueError("lazy_cache_size must be a positive integer or None")
+
         self._owns_client = client is None
         if client is None:
             client = self._create_default_client(openapi_spec)
@@ -126,6 +178,7 @@ class OpenAPIProvider(Provider):
         self._client = client
         self._mcp_component_fn = mcp_component_fn
         self._validate_output = validate_output
+        self._http_cache = http_cache
 
         # Keep track of names to detect collisions
         self._used_names: dict[str, Counter[str]] = {
@@ -135,11 +188,26 @@ class OpenAPIProvider(Provider):
             "prompt": Counter(),
         }
 
-        # Pre-created component storage
+        # Pre-created component storage (eager mode)
         self._tools: dict[str, OpenAPITool] = {}
         self._resources: dict[str, OpenAPIResource] = {}
         self._templates: dict[str, OpenAPIResourceTemplate] = {}
 
+        # Route index keyed by component name/URI (lazy mode), plus an LRU of
+        # components built from it.
+        self._lazy = lazy
+        self._lazy_cache_size = lazy_cache_size
+        self._tool_index: dict[str, _IndexedRoute] = {}
+        self._resource_index: dict[str, _IndexedRoute] = {}
+        self._template_index: dict[str, _IndexedRoute] = {}
+        self._materialized: OrderedDict[tuple[str, str], FastMCPComponent] = (
+            OrderedDict()
+        )
+        # Components built by a listing, kept apart from the LRU so a listing
+        # doesn't evict looked-up components. Filled up to `lazy_cache_size`
+        # and never evicted, so repeated listings keep the same prefix cached.
+        self._listed: dict[tuple[str, str], FastMCPComponent] = {}
+
         # Create openapi-core Spec and RequestDirector
         try:
             self._spec = SchemaPath.from_dict(cast(Any, openapi_spec))
@@ -148,12 +216,31 @@ class OpenAPIProvider(Provider):
             logger.exception("Failed to initialize RequestDirector")
             raise ValueError(f"Invalid OpenAPI specification: {e}") from e
 
-        http_routes = parse_openapi_to_http_routes(openapi_spec)
+        # Output schemas restored from the route cache, keyed by route_key.
+        self._cached_output_schemas: dict[str, JsonSchema | None] = {}
+        self._openapi_spec = openapi_spec
+        self._route_cache_dir = route_cache_dir
+        self._route_maps = (route_maps or []) + DEFAULT_ROUTE_MAPPINGS
+        self._route_map_fn = route_map_fn
+        self._mcp_names = mcp_names
+        self._extra_tags = tags
+        self._index_routes()
+
+    def _index_routes(self) -> None:
+        """Parse the spec's routes and create (eager) or index (lazy) components."""
+        if self._route_cache_dir is not None:
+            parsed = load_or_parse_http_routes(
+                self._openapi_spec, self._route_cache_dir
+            )
+            http_routes = parsed.routes
+            self._cached_output_schemas = parsed.output_schemas
+        else:
+            http_routes = parse_openapi_to_http_routes(self._openapi_spec)
 
-        # Process routes
-        route_maps = (route_maps or []) + DEFAULT_ROUTE_MAPPINGS
+        route_map_fn = self._route_map_fn
+        lazy = self._lazy
         for route in http_routes:
-            route_map = _determine_route_type(route, route_maps)
+            route_map = _determine_route_type(route, self._route_maps)
             route_type = route_map.mcp_type
 
             if route_map_fn is not None:
@@ -171,15 +258,36 @@ class OpenAPIProvider(Provider):
                         f"Using default values."
                     )
 
-            component_name = self._generate_default_name(route, mcp_names)
-            route_tags = set(route.tags) | route_map.mcp_tags | (tags or set())
-
+            component_name = self._generate_default_name(route, self._mcp_names)
+            route_tags = (
+                set(route.tags) | route_map.mcp_tags | (self._extra_tags or set())
+            )
             if route_type == MCPType.TOOL:
-                self._create_openapi_tool(route, component_name, tags=route_tags)
+                if lazy:
+                    name = self._get_unique_name(component_name, "tool")
+                    self._tool_index[name] = _IndexedRoute(route, name, route_tags)
+                else:
+                    self._create_openapi_tool(route, component_name, tags=route_tags)
             elif route_type == MCPType.RESOURCE:
-                self._create_openapi_resource(route, component_name, tags=route_tags)
+                if lazy:
+                    name = self._get_unique_name(component_name, "resource")
+                    self._resource_index[f"resource://{name}"] = _IndexedRoute(
+                        route, name, route_tags
+                    )
+                else:
+                    self._create_openapi_resource(
+                        route, component_name, tags=route_tags
+                    )
             elif route_type == MCPType.RESOURCE_TEMPLATE:
-                self._create_openapi_template(route, component_name, tags=route_tags)
+                if lazy:
+                    name = self._get_unique_name(component_name, "resource_template")
+                    self._template_index[_template_uri(route, name)] = _IndexedRoute(
+                        route, name, route_tags
+                    )
+                else:
+                    self._create_openapi_template(
+                        route, component_name, tags=route_tags
+                    )
             elif route_type == MCPType.EXCLUDE:
                 logger.debug(f"Excluding route: {route.method} {route.path}")
 
@@ -253,12 +361,28 @@ class OpenAPIProvider(Provider):
         tags: set[str],
     ) -> None:
         """Create and register an OpenAPITool."""
-        combined_schema = route.flat_param_schema
-        output_schema = extract_output_schema_from_responses(
-            route.responses,
-            route.response_schemas,
-            route.openapi_version,
+        tool = self._build_openapi_tool(
+            route, self._get_unique_name(name, "tool"), tags
         )
+        self._tools[tool.name] = tool
+
+    def _build_openapi_tool(
+        self,
+        route: HTTPRoute,
+        tool_name: str,
+        tags: set[str],
+    ) -> OpenAPITool:
+        """Build an OpenAPITool with an already-unique name."""
+        combined_schema = route.flat_param_schema
+        key = route_key(route)
+        if key in self._cached_output_schemas:
+            output_schema = self._cached_output_schemas[key]
+        else:
+            output_schema = extract_output_schema_from_responses(
+                route.responses,
+                route.response_schemas,
+                route.openapi_version,
+            )
 
         if not self._validate_output and output_schema is not None:
             # Use a permissive schema that accepts any object, preserving
@@ -271,7 +395,6 @@ class OpenAPIProvider(Provider):
                 permissive["x-fastmcp-wrap-result"] = True
             output_schema = permissive
 
-        tool_name = self._get_unique_name(name, "tool")
         base_description = (
             route.description
             or route.summary
@@ -296,7 +419,7 @@ class OpenAPIProvider(Provider):
             except Exception as e:
                 logger.warning(f"Error in component_fn for tool {tool_name}: {e}")
 
-        self._tools[tool.name] = tool
+        return tool
 
     def _create_openapi_resource(
         self,
@@ -305,7 +428,18 @@ class OpenAPIProvider(Provider):
         tags: set[str],
     ) -> None:
         """Create and register an OpenAPIResource."""
-        resource_name = self._get_unique_name(name, "resource")
+        resource = self._build_openapi_resource(
+            route, self._get_unique_name(name, "resource"), tags
+        )
+        self._resources[str(resource.uri)] = resource
+
+    def _build_openapi_resource(
+        self,
+        route: HTTPRoute,
+        resource_name: str,
+        tags: set[str],
+    ) -> OpenAPIResource:
+        """Build an OpenAPIResource with an already-unique name."""
         resource_uri = f"resource://{resource_name}"
         base_description = (
             route.description or route.summary or f"Represents {route.path}"
@@ -320,6 +454,7 @@ class OpenAPIProvider(Provider):
             description=base_description,
             mime_type=_extract_mime_type_from_route(route),
             tags=set(route.tags or []) | tags,
+            http_cache=self._http_cache,
         )
 
         if self._mcp_component_fn is not None:
@@ -331,7 +466,7 @@ class OpenAPIProvider(Provider):
                     f"Error in component_fn for resource {resource_uri}: {e}"
                 )
 
-        self._resources[str(resource.uri)] = resource
+        return resource
 
     def _create_openapi_template(
         self,
@@ -340,12 +475,19 @@ class OpenAPIProvider(Provider):
         tags: set[str],
     ) -> None:
         """Create and register an OpenAPIResourceTemplate."""
-        template_name = self._get_unique_name(name, "resource_template")
+        template = self._build_openapi_template(
+            route, self._get_unique_name(name, "resource_template"), tags
+        )
+        self._templates[template.uri_template] = template
 
-        path_params = sorted(p.name for p in route.parameters if p.location == "path")
-        uri_template_str = f"resource://{template_name}"
-        if path_params:
-            uri_template_str += "/" + "/".join(f"{{{p}}}" for p in path_params)
+    def _build_openapi_template(
+        self,
+        route: HTTPRoute,
+        template_name: str,
+        tags: set[str],
+    ) -> OpenAPIResourceTemplate:
+        """Build an OpenAPIResourceTemplate with an already-unique name."""
+        uri_template_str = _template_uri(route, template_name)
 
         base_description = (
             route.description or route.summary or f"Template for {route.path}"
@@ -383,6 +525,7 @@ class OpenAPIProvider(Provider):
             parameters=template_params_schema,
             tags=set(route.tags or []) | tags,
             mime_type=_extract_mime_type_from_route(route),
+            http_cache=self._http_cache,
         )
 
         if self._mcp_component_fn is not None:
@@ -394,7 +537,62 @@ class OpenAPIProvider(Provider):
                     f"Error in component_fn for template {uri_template_str}: {e}"
                 )
 
-        self._templates[template.uri_template] = template
+        return template
+
+    def _materialize(
+        self,
+        kind: Literal["tool", "resource", "resource_template"],
+        key: str,
+        entry: _IndexedRoute,
+        *,
+        listing: bool = False,
+    ) -> Any:
+        """Return the built component for an indexed route (lazy mode).
+
+        Components built for a lookup are kept in an LRU bounded by
+        `lazy_cache_size`; an evicted component is simply rebuilt on its next
+        use. A listing (`listing=True`) needs every component of its kind and
+        would churn the whole LRU on each call, so the components it builds go
+        to a separate store instead, kept until it holds `lazy_cache_size`
+        entries. Components past that are rebuilt by each listing.
+        """
+        cache_key = (kind, key)
+        component = self._listed.get(cache_key)
+        if component is not None:
+            return component
+        keep_listed = listing and (
+            self._lazy_cache_size is None or len(self._listed) < self._lazy_cache_size
+        )
+        component = self._materialized.get(cache_key)
+        if component is not None:
+            if keep_listed:
+                self._listed[cache_key] = self._materialized.pop(cache_key)
+            elif not listing:
+                self._materialized.move_to_end(cache_key)
+            return component
+
+        if kind == "tool":
+            component = self._build_openapi_tool(entry.route, entry.name, entry.tags)
+        elif kind == "resource":
+            component = self._build_openapi_resource(
+                entry.route, entry.name, entry.tags
+            )
+        else:
+            component = self._build_openapi_template(
+                entry.route, entry.name, entry.tags
+            )
+
+        if listing:
+            if keep_listed:
+                self._listed[cache_key] = component
+            return component
+        self._materialized[cache_key] = component
+        if (
+            self._lazy_cache_size is not None
+            and len(self._materialized) > self._lazy_cache_size
+        ):
+            self._materialized.popitem(last=False)
+        return component
 
     # -------------------------------------------------------------------------
     # Provider interface
@@ -402,13 +600,22 @@ class OpenAPIProvider(Provider):
 
     async def _list_tools(self) -> Sequence[Tool]:
         """Return all tools created from the OpenAPI spec."""
+        if self._lazy:
+            return [
+                self._materialize("tool", name, entry, listing=True)
+                for name, entry in self._tool_index.items()
+            ]
         return list(self._tools.values())
 
     async def _get_tool(
         self, name: str, version: VersionSpec | None = None
     ) -> Tool | None:
         """Get a tool by name."""
-        tool = self._tools.get(name)
+        if self._lazy:
+            entry = self._tool_index.get(name)
+            tool = self._materialize("tool", name, entry) if entry else None
+        else:
+            tool = self._tools.get(name)
         if tool is None:
             return None
         if version is not None and not version.matches(tool.version):
@@ -417,13 +624,22 @@ class OpenAPIProvider(Provider):
 
     async def _list_resources(self) -> Sequence[Resource]:
         """Return all resources created from the OpenAPI spec."""
+        if self._lazy:
+            return [
+                self._materialize("resource", uri, entry, listing=True)
+                for uri, entry in self._resource_index.items()
+            ]
         return list(self._resources.values())
 
     async def _get_resource(
         self, uri: str, version: VersionSpec | None = None
     ) -> Resource | None:
         """Get a resource by URI."""
-        resource = self._resources.get(uri)
+        if self._lazy:
+            entry = self._resource_index.get(uri)
+            resource = self._materialize("resource", uri, entry) if entry else None
+        else:
+            resource = self._resources.get(uri)
         if resource is None:
             return None
         if version is not None and not version.matches(resource.version):
@@ -432,13 +648,31 @@ class OpenAPIProvider(Provider):
 
     async def _list_resource_templates(self) -> Sequence[ResourceTemplate]:
         """Return all resource templates created from the OpenAPI spec."""
+        if self._lazy:
+            return [
+                self._materialize(
+                    "resource_template", uri_template, entry, listing=True
+                )
+                for uri_template, entry in self._template_index.items()
+            ]
         return list(self._templates.values())
 
     async def _get_resource_template(
         self, uri: str, version: VersionSpec | None = None
     ) -> ResourceTemplate | None:
         """Get a resource template that matches the given URI."""
-        matching = [t for t in self._templates.values() if t.matches(uri) is not None]
+        if self._lazy:
+            # Match against the indexed URI templates so only the candidates
+            # are built.
+            matching = [
+                self._materialize("resource_template", uri_template, entry)
+                for uri_template, entry in self._template_index.items()
+                if match_uri_template(uri, uri_template) is not None
+            ]
+        else:
+            matching = [
+                t for t in self._templates.values() if t.matches(uri) is not None
+            ]
         if not matching:
             return None
         if version is not None:
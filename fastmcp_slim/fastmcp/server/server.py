@@ -56,6 +56,7 @@ from fastmcp.prompts import Prompt
 from fastmcp.prompts.base import PromptResult
 from fastmcp.prompts.function_prompt import FunctionPrompt
 from fastmcp.resources.base import Resource, ResourceResult
+from fastmcp.resources.http_client import HttpResourceClient
 from fastmcp.resources.security import (
     DEFAULT_RESOURCE_SECURITY,
     INHERIT_SECURITY,
@@ -71,7 +72,10 @@ from fastmcp.server.low_level import LowLevelServer
 from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
 from fastmcp.server.middleware.middleware import (
     MiddlewarePhase,
+    _ChainStep,
     _dispatch_phase,
+    build_call_chain,
+    compile_middleware_chain,
     mark_interior_dispatched,
 )
 from fastmcp.server.mixins import LifespanMixin, MCPOperationsMixin, TransportMixin
@@ -307,7 +311,11 @@ class FastMCP(
         cache_scope: Literal["public", "private"] | None = None,
         tasks: bool | None = None,
         session_state_store: AsyncKeyValue | None = None,
+        http_resource_client: HttpResourceClient | None = None,
         client_log_level: mcp_types.LoggingLevel | None = None,
+        client_log_queue_size: int | None = None,
+        progress_min_interval: float | None = None,
+        progress_min_delta: float | None = None,
         experimental_capabilities: dict[str, dict[str, Any]] | None = None,
         **kwargs: Any,
     ):
@@ -331,6 +339,11 @@ class FastMCP(
         self._state_storage: AsyncKeyValue | None = session_state_store
         self.__state_store: PydanticAdapter[StateValue] | None = None
 
+        # Pooled client for HttpResource reads, held open for the lifespan
+        self._http_resource_client: HttpResourceClient = (
+            http_resource_client or HttpResourceClient()
+        )
+
         # Create LocalProvider for local components
         self._local_provider: LocalProvider = LocalProvider(
             on_duplicate=self._on_duplicate
@@ -456,6 +469,34 @@ class FastMCP(
         # session object.
         self._client_log_levels: dict[str, mcp_types.LoggingLevel] = {}
 
+        # Bound for the per-request asynchronous client log queue; None keeps
+        # log delivery synchronous. Drops across all requests are counted in
+        # client_log_messages_dropped.
+        self.client_log_queue_size: int | None = (
+            client_log_queue_size
+            if client_log_queue_size is not None
+            else fastmcp.settings.client_log_queue_size
+        )
+        if self.client_log_queue_size is not None and self.client_log_queue_size <= 0:
+            raise ValueError("client_log_queue_size must be a positive integer")
+        self.client_log_messages_dropped: int = 0
+
+        # Per-request coalescing thresholds for Context.report_progress.
+        self.progress_min_interval: float = (
+            progress_min_interval
+            if progress_min_interval is not None
+            else fastmcp.settings.progress_min_interval
+        )
+        self.progress_min_delta: float = (
+            progress_min_delta
+            if progress_min_delta is not None
+            else fastmcp.settings.progress_min_delta
+        )
+        if self.progress_min_interval < 0 or self.progress_min_delta < 0:
+            raise ValueError(
+                "progress_min_interval and progress_min_delta must be non-negative"
+            )
+
         self.experimental_capabilities: dict[str, dict[str, Any]] = (
             experimental_capabilities or {}
         )
@@ -467,6 +508,12 @@ class FastMCP(
         self._completion_handler: CompletionHandler | None = None
 
         self.middleware: list[Middleware] = list(middleware or [])
+        # Compiled middleware chains keyed by (method, type, phase), valid for
+        # the middleware stack captured in the snapshot.
+        self._middleware_snapshot: tuple[Middleware, ...] = ()
+        self._middleware_chains: dict[
+            tuple[str | None, str, MiddlewarePhase], tuple[_ChainStep, ...]
+        ] = {}
 
         # Registered server extensions (SEP-2133), keyed by reverse-DNS
         # identifier. Populated by add_extension; consumed by the low-level
@@ -542,6 +589,11 @@ class FastMCP(
         """
         return self._local_provider
 
+    @property
+    def http_resource_client(self) -> HttpResourceClient:
+        """The pooled, caching client that `HttpResource` reads go through."""
+        return self._http_resource_client
+
     async def _run_middleware(
         self,
         context: MiddlewareContext[Any],
@@ -558,24 +610,47 @@ class FastMCP(
         ContextVar rather than the middleware call signature, so user middleware
         overriding the documented ``__call__(context, call_next)`` is unaffected.
         """
-        chain = call_next
-        for mw in reversed(self.middleware):
-            next_chain: CallNext[Any, Any] = chain
-
-            async def wrapped(
-                context: MiddlewareContext[Any],
-                mw: Middleware = mw,
-                call_next: CallNext[Any, Any] = next_chain,
-            ) -> Any:
-                return await mw(context, call_next)
-
-            chain = cast(CallNext[Any, Any], wrapped)
+        steps = self._compiled_middleware(context.method, context.type, phase)
+        if not steps:
+            return await call_next(context)
+        chain = build_call_chain(steps, call_next)
         token = _dispatch_phase.set(phase)
         try:
             return await chain(context)
         finally:
             _dispatch_phase.reset(token)
 
+    def _compiled_middleware(
+        self,
+        method: str | None,
+        message_type: Literal["request", "notification"],
+        phase: MiddlewarePhase,
+    ) -> tuple[_ChainStep, ...]:
+        """Return the compiled middleware steps for a kind of message.
+
+        Compiled chains are reused until the middleware stack changes. The
+        stack is compared by identity on each call (rather than only
+        invalidated by ``add_middleware``) because ``self.middleware`` is a
+        public list that is also mutated and reassigned directly.
+        """
+        snapshot = tuple(self.middleware)
+        previous = self._middleware_snapshot
+        # Element identity, not ``==``: a middleware may define ``__eq__``, and
+        # equal-but-distinct instances must not reuse hooks bound to the old ones.
+        if len(snapshot) != len(previous) or any(
+            new is not old for new, old in zip(snapshot, previous, strict=True)
+        ):
+            self._middleware_snapshot = snapshot
+            self._middleware_chains.clear()
+        key = (method, message_type, phase)
+        steps = self._middleware_chains.get(key)
+        if steps is None:
+            steps = compile_middleware_chain(
+                self.middleware, method, message_type, phase
+            )
+            self._middleware_chains[key] = steps
+        return steps
+
     async def _dispatch_component_middleware(
         self,
         context: MiddlewareContext[Any],
@@ -597,6 +672,7 @@ class FastMCP(
 
     def add_middleware(self, middleware: Middleware) -> None:
         self.middleware.append(middleware)
+        self._middleware_chains.clear()
 
     def add_extension(self, extension: ServerExtension) -> None:
         """Register a server extension (SEP-2133).
@@ -27,6 +27,7 @@ Example::
     mcp.add_transform(RegexSearchTransform())
 """
 
+import hashlib
 from abc import abstractmethod
 from collections.abc import Awaitable, Callable, Sequence
 from typing import Annotated, Any
@@ -58,6 +59,51 @@ def _extract_searchable_text(tool: Tool) -> str:
     return " ".join(parts)
 
 
+def _tool_fingerprint(tool: Tool) -> str:
+    """SHA256 hash of a tool's searchable text, for change detection."""
+    return hashlib.sha256(_extract_searchable_text(tool).encode()).hexdigest()
+
+
+class _CatalogTracker:
+    """Track which tools changed between successive views of a catalog.
+
+    Tools are identified by key (name and version) and fingerprinted by a
+    hash of their searchable text. `sync` reports only the tools added or
+    changed and the keys removed since the previous call, so a search index
+    can be patched instead of rebuilt.
+
+    Fingerprints are recomputed from each tool's content on every sync, so a
+    tool edited in place is picked up like any other change.
+    """
+
+    def __init__(self) -> None:
+        self.tools: dict[str, Tool] = {}
+        self._fingerprints: dict[str, str] = {}
+
+    def sync(self, tools: Sequence[Tool]) -> tuple[list[Tool], list[str]]:
+        """Adopt `tools` as the current catalog.
+
+        Returns the tools whose fingerprint is new or changed, and the keys
+        of tools no longer present.
+        """
+        current: dict[str, Tool] = {}
+        fingerprints: dict[str, str] = {}
+        changed: dict[str, Tool] = {}
+        for tool in tools:
+            fingerprint = _tool_fingerprint(tool)
+            key = tool.key
+            current[key] = tool
+            fingerprints[key] = fingerprint
+            if self._fingerprints.get(key) != fingerprint:
+                changed[key] = tool
+            else:
+                changed.pop(key, None)
+
+        removed = [key for key in self._fingerprints if key not in current]
+        self.tools, self._fingerprints = current, fingerprints
+        return list(changed.values()), removed
+
+
 def serialize_tools_for_output_json(tools: Sequence[Tool]) -> list[dict[str, Any]]:
     """Serialize tools to the same dict format as ``list_tools`` output."""
     return [
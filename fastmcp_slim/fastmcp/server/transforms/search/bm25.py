@@ -1,15 +1,16 @@
 """BM25-based search transform."""
 
-import hashlib
+import heapq
 import math
 import re
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Annotated, Any
 
 from fastmcp.server.context import Context
 from fastmcp.server.transforms.search.base import (
     BaseSearchTransform,
     SearchResultSerializer,
+    _CatalogTracker,
     _extract_searchable_text,
 )
 from fastmcp.tools.base import Tool
@@ -21,73 +22,107 @@ def _tokenize(text: str) -> list[str]:
 
 
 class _BM25Index:
-    """Self-contained BM25 Okapi index."""
+    """Self-contained BM25 Okapi index.
+
+    Stores a posting list of `{document: term frequency}` per term, so a query
+    only visits documents that contain at least one of its terms. Documents
+    can be added and removed individually; per-document length norms are
+    recomputed once on the next query after the corpus changes.
+    """
 
     def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
         self.k1 = k1
         self.b = b
-        self._doc_tokens: list[list[str]] = []
-        self._doc_lengths: list[int] = []
-        self._avg_dl: float = 0.0
-        self._df: dict[str, int] = {}
-        self._tf: list[dict[str, int]] = []
-        self._n: int = 0
+        self._postings: dict[str, dict[int, int]] = {}
+        self._doc_tf: dict[int, dict[str, int]] = {}
+        self._doc_lengths: dict[int, int] = {}
+        self._total_length: int = 0
+        # k1 * (1 - b + b * dl / avgdl), the length-dependent part of the
+        # BM25 denominator. None when the corpus changed since last computed.
+        self._norms: dict[int, float] | None = {}
 
     def build(self, documents: list[str]) -> None:
-        self._doc_tokens = [_tokenize(doc) for doc in documents]
-        self._doc_lengths = [len(tokens) for tokens in self._doc_tokens]
-        self._n = len(documents)
-        self._avg_dl = sum(self._doc_lengths) / self._n if self._n else 0.0
-
-        self._df = {}
-        self._tf = []
-        for tokens in self._doc_tokens:
-            tf: dict[str, int] = {}
-            seen: set[str] = set()
-            for token in tokens:
-                tf[token] = tf.get(token, 0) + 1
-                if token not in seen:
-                    self._df[token] = self._df.get(token, 0) + 1
-                    seen.add(token)
-            self._tf.append(tf)
-
-    def query(self, text: str, top_k: int) -> list[int]:
-        """Return indices of top_k documents sorted by BM25 score."""
+        """Replace the corpus, identifying documents by their list index."""
+        self._postings = {}
+        self._doc_tf = {}
+        self._doc_lengths = {}
+        self._total_length = 0
+        self._norms = {}
+        for i, doc in enumerate(documents):
+            self.add(i, doc)
+
+    def add(self, doc_id: int, text: str) -> None:
+        """Index `text` as `doc_id`, replacing any document with that id."""
+        self.remove(doc_id)
+        tokens = _tokenize(text)
+        tf: dict[str, int] = {}
+        for token in tokens:
+            tf[token] = tf.get(token, 0) + 1
+        for token, count in tf.items():
+            self._postings.setdefault(token, {})[doc_id] = count
+        self._doc_tf[doc_id] = tf
+        self._doc_lengths[doc_id] = len(tokens)
+        self._total_length += len(tokens)
+        self._norms = None
+
+    def remove(self, doc_id: int) -> None:
+        """Drop `doc_id` from the index if present."""
+        tf = self._doc_tf.pop(doc_id, None)
+        if tf is None:
+            return
+        for token in tf:
+            postings = self._postings[token]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[token]
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        self._norms = None
+
+    def _length_norms(self) -> dict[int, float]:
+        if self._norms is None:
+            n = len(self._doc_lengths)
+            avg_dl = self._total_length / n if n else 0.0
+            self._norms = {
+                i: self.k1 * (1 - self.b + self.b * dl / avg_dl) if avg_dl else self.k1
+                for i, dl in self._doc_lengths.items()
+            }
+        return self._norms
+
+    def query(
+        self, text: str, top_k: int, order: Mapping[int, int] | None = None
+    ) -> list[int]:
+        """Return ids of top_k documents sorted by BM25 score.
+
+        Ties rank documents earlier in `order` (a position per document id)
+        first, or lower ids first when no order is given.
+        """
         query_tokens = _tokenize(text)
-        if not query_tokens or not self._n:
+        n = len(self._doc_lengths)
+        if not query_tokens or not n or top_k <= 0:
             return []
 
-        scores: list[float] = [0.0] * self._n
+        norms = self._length_norms()
+        scores: dict[int, float] = {}
+        k1_plus_1 = self.k1 + 1
         for token in query_tokens:
-            if token not in self._df:
+            postings = self._postings.get(token)
+            if postings is None:
                 continue
-            idf = math.log(
-                (self._n - self._df[token] + 0.5) / (self._df[token] + 0.5) + 1.0
-            )
-            for i in range(self._n):
-                tf = self._tf[i].get(token, 0)
-                if tf == 0:
-                    continue
-                dl = self._doc_lengths[i]
-                numerator = tf * (self.k1 + 1)
-                denominator = tf + self.k1 * (1 - self.b + self.b * dl / self._avg_dl)
-                scores[i] += idf * numerator / denominator
-
-        ranked = sorted(range(self._n), key=lambda i: scores[i], reverse=True)
-        return [i for i in ranked[:top_k] if scores[i] > 0]
-
+            df = len(postings)
+            idf = math.log((n - df + 0.5) / (df + 0.5) + 1.0)
+            for i, tf in postings.items():
+                scores[i] = scores.get(i, 0.0) + idf * tf * k1_plus_1 / (tf + norms[i])
 
-def _catalog_hash(tools: Sequence[Tool]) -> str:
-    """SHA256 hash of sorted tool searchable text for staleness detection."""
-    key = "|".join(sorted(_extract_searchable_text(t) for t in tools))
-    return hashlib.sha256(key.encode()).hexdigest()
+        position = order.__getitem__ if order is not None else int
+        ranked = heapq.nlargest(top_k, scores, key=lambda i: (scores[i], -position(i)))
+        return [i for i in ranked if scores[i] > 0]
 
 
 class BM25SearchTransform(BaseSearchTransform):
     """Search transform using BM25 Okapi relevance ranking.
 
-    Maintains an in-memory index that is lazily rebuilt when the tool
-    catalog changes (detected via a hash of tool names).
+    Maintains an in-memory index that is patched on each search with only
+    the tools added, changed, or removed since the previous one.
     """
 
     def __init__(
@@ -107,8 +142,11 @@ class BM25SearchTransform(BaseSearchTransform):
             search_result_serializer=search_result_serializer,
         )
         self._index = _BM25Index()
-        self._indexed_tools: Sequence[Tool] = ()
-        self._last_hash: str = ""
+        self._catalog = _CatalogTracker()
+        # Index document ids by tool key, assigned in first-seen order.
+        self._doc_ids: dict[str, int] = {}
+        self._doc_keys: dict[int, str] = {}
+        self._next_doc_id: int = 0
 
     def _make_search_tool(self) -> Tool:
         transform = self
@@ -129,16 +167,25 @@ class BM25SearchTransform(BaseSearchTransform):
         return Tool.from_function(fn=search_tools, name=self._search_tool_name)
 
     async def _search(self, tools: Sequence[Tool], query: str) -> Sequence[Tool]:
-        current_hash = _catalog_hash(tools)
-        if current_hash != self._last_hash:
-            documents = [_extract_searchable_text(t) for t in tools]
-            new_index = _BM25Index(self._index.k1, self._index.b)
-            new_index.build(documents)
-            self._index, self._indexed_tools, self._last_hash = (
-                new_index,
-                tools,
-                current_hash,
-            )
-
-        indices = self._index.query(query, self._max_results)
-        return [self._indexed_tools[i] for i in indices]
+        changed, removed = self._catalog.sync(tools)
+        for key in removed:
+            doc_id = self._doc_ids.pop(key)
+            del self._doc_keys[doc_id]
+            self._index.remove(doc_id)
+        for tool in changed:
+            doc_id = self._doc_ids.get(tool.key)
+            if doc_id is None:
+                doc_id = self._next_doc_id
+                self._next_doc_id += 1
+                self._doc_ids[tool.key] = doc_id
+                self._doc_keys[doc_id] = tool.key
+            self._index.add(doc_id, _extract_searchable_text(tool))
+
+        # Rank ties in catalog order; document ids follow first-seen order,
+        # which drifts from it as tools are removed and re-added.
+        order = {
+            self._doc_ids[key]: position
+            for position, key in enumerate(self._catalog.tools)
+        }
+        indices = self._index.query(query, self._max_results, order)
+        return [self._catalog.tools[self._doc_keys[i]] for i in indices]
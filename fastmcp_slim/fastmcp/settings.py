@@ -231,6 +231,59 @@ class Settings(BaseSettings):
         ),
     ] = None
 
+    client_log_queue_size: Annotated[
+        int | None,
+        Field(
+            description=inspect.cleandoc(
+                """
+                When set, `Context` log messages are delivered to MCP clients
+                asynchronously: each call enqueues the message and returns
+                without waiting on the transport, and a background sender
+                drains the queue before the request completes. The value bounds
+                the queue per request; when it is full the oldest message is
+                dropped. When None (default), each log call awaits its own
+                send.
+                """
+            ),
+            gt=0,
+        ),
+    ] = None
+
+    progress_min_interval: Annotated[
+        float,
+        Field(
+            description=inspect.cleandoc(
+                """
+                Minimum time in seconds between progress updates sent by
+                `Context.report_progress` within a single request. Updates
+                arriving sooner are coalesced: only the most recent one is kept,
+                and a background timer sends it once the interval has elapsed
+                (if it also satisfies progress_min_delta; otherwise it is sent
+                when the request finishes). Updates that change the message or
+                total, or that reach the total, are always sent immediately.
+                Defaults to 0 (no time-based coalescing).
+                """
+            ),
+            ge=0,
+        ),
+    ] = 0.0
+
+    progress_min_delta: Annotated[
+        float,
+        Field(
+            description=inspect.cleandoc(
+                """
+                Minimum change in progress value required before
+                `Context.report_progress` sends another update within a single
+                request. Smaller changes are coalesced like updates that arrive
+                before `progress_min_interval` has elapsed. Defaults to 0 (no
+                delta-based coalescing).
+                """
+            ),
+            ge=0,
+        ),
+    ] = 0.0
+
     strict_input_validation: Annotated[
         bool,
         Field(
@@ -267,6 +320,32 @@ class Settings(BaseSettings):
         ),
     ] = False
 
+    ssrf_dns_cache_ttl: Annotated[
+        float,
+        Field(
+            description=inspect.cleandoc(
+                """
+                Seconds to cache hostname resolutions for SSRF-protected fetches.
+                Resolved addresses are still checked against the IP blocklist on
+                every fetch. Set to 0 to resolve on every fetch.
+                """
+            ),
+        ),
+    ] = 60.0
+
+    ssrf_dns_negative_cache_ttl: Annotated[
+        float,
+        Field(
+            description=inspect.cleandoc(
+                """
+                Seconds to cache failed hostname resolutions for SSRF-protected
+                fetches, so repeated fetches of an unresolvable host fail fast.
+                Set to 0 to disable negative caching.
+                """
+            ),
+        ),
+    ] = 5.0
+
     server_dependencies: list[str] = Field(
         default_factory=list,
         description="List of dependencies to install in the server environment",
@@ -4,7 +4,7 @@ import inspect
 from collections.abc import Callable
 from contextvars import ContextVar
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Annotated, Any, Literal, cast
 
 import mcp_types
@@ -283,6 +283,176 @@ def _apply_meta_override(
     return merged
 
 
+def _drops_structured_content(output_schema: dict[str, Any] | None) -> bool:
+    """Whether a tool with this output schema strips a forwarded result's
+    structured content. Non-object explicit schemas disable it."""
+    return (
+        output_schema is not None
+        and output_schema.get("type") != "object"
+        and not output_schema.get("x-fastmcp-wrap-result")
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _ForwardingPlan:
+    """Precomputed mapping from a transformed tool's arguments to its target's.
+
+    Built once per transform so a call only has to walk the provided
+    arguments instead of rebuilding name sets and scanning ``transform_args``.
+    The target is the parent tool, or the root of a chain of forwarding-only
+    transforms once plans have been fused with ``compose``. A fused plan also
+    carries the defaults and required arguments of the layers it skips.
+    """
+
+    target: Tool
+    new_to_old: dict[str, str]
+    required: frozenset[str]
+    constants: dict[str, Any]
+    factories: tuple[tuple[str, Callable[[], Any]], ...]
+    defaults: dict[str, Any] = field(default_factory=dict)
+    default_factories: tuple[tuple[str, Callable[[], Any]], ...] = ()
+    required_targets: frozenset[str] = frozenset()
+
+    def map_arguments(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Validate transformed-name arguments and map them to target names."""
+        new_to_old = self.new_to_old
+        parent_args: dict[str, Any] = {}
+        unknown_args: list[str] = []
+        for new_name, value in arguments.items():
+            old_name = new_to_old.get(new_name)
+            if old_name is None:
+                unknown_args.append(new_name)
+            else:
+                parent_args[old_name] = value
+
+        if unknown_args:
+            raise TypeError(
+                f"Got unexpected keyword argument(s): {', '.join(sorted(unknown_args))}"
+            )
+        if not self.required <= arguments.keys():
+            missing_args = self.required - arguments.keys()
+            raise TypeError(
+                f"Missing required argument(s): {', '.join(sorted(missing_args))}"
+            )
+
+        # Hidden parameters: constant values and per-call factories
+        if self.constants:
+            parent_args.update(self.constants)
+        for old_name, factory in self.factories:
+            parent_args[old_name] = factory()
+
+        # Defaults and required arguments of fused intermediate layers
+        if self.defaults:
+            parent_args = {**self.defaults, **parent_args}
+        for old_name, factory in self.default_factories:
+            if old_name not in parent_args:
+                parent_args[old_name] = factory()
+        if not self.required_targets <= parent_args.keys():
+            missing_args = self.required_targets - parent_args.keys()
+            raise TypeError(
+                f"Missing required argument(s): {', '.join(sorted(missing_args))}"
+            )
+        return parent_args
+
+    def compose(
+        self, parent_run: _RunPlan, parent: _ForwardingPlan
+    ) -> _ForwardingPlan | None:
+        """Fuse this plan with a forwarding-only parent's into one hop.
+
+        ``self`` maps onto the parent's arguments; ``parent_run`` holds the
+        defaults the parent's ``run`` fills in and ``parent`` maps those onto
+        the parent's target. Returns ``None`` if the plans don't line up, for
+        example because the parent's schema was replaced after construction.
+        """
+        to_target = parent.new_to_old
+        try:
+            new_to_old = {new: to_target[old] for new, old in self.new_to_old.items()}
+            constants = {to_target[old]: v for old, v in self.constants.items()}
+            factories = [(to_target[old], f) for old, f in self.factories]
+            defaults = {to_target[old]: v for old, v in parent_run.static.items()}
+            default_factories = [(to_target[old], f) for old, f in parent_run.factories]
+            required_targets = {to_target[old] for old in parent.required}
+        except KeyError:
+            return None
+
+        # The parent fills its defaults before the layers beyond it fill
+        # theirs, and rejects missing required arguments in between, so
+        # later defaults only apply to names the parent left open.
+        taken = defaults.keys() | {name for name, _ in default_factories}
+        taken |= required_targets
+        defaults.update(
+            (name, value)
+            for name, value in parent.defaults.items()
+            if name not in taken
+        )
+        default_factories.extend(
+            (name, f) for name, f in parent.default_factories if name not in taken
+        )
+
+        return _ForwardingPlan(
+            target=parent.target,
+            new_to_old=new_to_old,
+            required=self.required,
+            constants={**constants, **parent.constants},
+            factories=(*factories, *parent.factories),
+            defaults=defaults,
+            default_factories=tuple(default_factories),
+            required_targets=frozenset(required_targets | parent.required_targets),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _RunPlan:
+    """What ``TransformedTool.run`` needs to know about its schema and function.
+
+    Holds the defaults to fill in for missing arguments and whether ``fn`` is
+    a coroutine function. ``parameters`` and ``fn`` are the values the plan was
+    built from, so a copy of the tool with either replaced rebuilds its plan
+    instead of reusing a stale one.
+    """
+
+    parameters: dict[str, Any]
+    fn: Callable[..., Any]
+    fn_is_async: bool
+    static: dict[str, Any]
+    factories: tuple[tuple[str, Callable[[], Any]], ...]
+
+    @classmethod
+    def build(
+        cls,
+        parameters: dict[str, Any],
+        fn: Callable[..., Any],
+        transform_args: dict[str, ArgTransform],
+    ) -> _RunPlan:
+        # Map each exposed name to its default_factory, if any. Factories are
+        # called on every run rather than using the cached schema value.
+        factories_by_name: dict[str, Callable[[], Any]] = {}
+        for orig_name, transform in transform_args.items():
+            transform_name = (
+                transform.name if transform.name is not NotSet else orig_name
+            )
+            if callable(transform.default_factory):
+                factories_by_name.setdefault(transform_name, transform.default_factory)
+
+        static: dict[str, Any] = {}
+        factories: list[tuple[str, Callable[[], Any]]] = []
+        for param_name, param_schema in parameters.get("properties", {}).items():
+            if "default" not in param_schema:
+                continue
+            factory = factories_by_name.get(param_name)
+            if factory is not None:
+                factories.append((param_name, factory))
+            else:
+                static[param_name] = param_schema["default"]
+        return cls(
+            parameters=parameters,
+            fn=fn,
+            fn_is_async=is_coroutine_function(fn),
+            static=static,
+            factories=tuple(factories),
+        )
+
+
 class TransformedTool(Tool):
     """A tool that is transformed from another tool.
 
@@ -312,6 +482,26 @@ class TransformedTool(Tool):
     ]  # Always present, handles arg transformation
     transform_args: dict[str, ArgTransform]
 
+    forwarding_plan: Annotated[
+        SkipJsonSchema[_ForwardingPlan | None], Field(exclude=True, repr=False)
+    ] = None
+    # Built on first run. A regular field rather than a private attribute
+    # because private attribute reads are slow on models with extra="allow".
+    run_plan: Annotated[
+        SkipJsonSchema[_RunPlan | None], Field(exclude=True, repr=False)
+    ] = None
+
+    def _get_run_plan(self) -> _RunPlan:
+        plan = self.run_plan
+        if (
+            plan is None
+            or plan.parameters is not self.parameters
+            or plan.fn is not self.fn
+        ):
+            plan = _RunPlan.build(self.parameters, self.fn, self.transform_args)
+            self.run_plan = plan
+        return plan
+
     async def run(self, arguments: dict[str, Any]) -> ToolResult:
         """Run the tool with context set for forward() functions.
 
@@ -328,38 +518,16 @@ class TransformedTool(Tool):
 
         # Fill in missing arguments with schema defaults to ensure
         # ArgTransform defaults take precedence over function defaults
-        arguments = arguments.copy()
-        properties = self.parameters.get("properties", {})
-
-        for param_name, param_schema in properties.items():
-            if param_name not in arguments and "default" in param_schema:
-                # Check if this parameter has a default_factory from transform_args
-                # We need to call the factory for each run, not use the cached schema value
-                has_factory_default = False
-                if self.transform_args:
-                    # Find the original parameter name that maps to this param_name
-                    for orig_name, transform in self.transform_args.items():
-                        transform_name = (
-                            transform.name
-                            if transform.name is not NotSet
-                            else orig_name
-                        )
-                        if (
-                            transform_name == param_name
-                            and transform.default_factory is not NotSet
-                        ):
-                            # Type check to ensure default_factory is callable
-                            if callable(transform.default_factory):
-                                arguments[param_name] = transform.default_factory()
-                                has_factory_default = True
-                                break
-
-                if not has_factory_default:
-                    arguments[param_name] = param_schema["default"]
+        plan = self._get_run_plan()
+        if plan.static or plan.factories:
+            arguments = {**plan.static, **arguments}
+            for param_name, factory in plan.factories:
+                if param_name not in arguments:
+                    arguments[param_name] = factory()
 
         token = _current_tool.set(self)
         try:
-            if is_coroutine_function(self.fn):
+            if plan.fn_is_async:
                 result = await self.fn(**arguments)
             else:
                 result = await call_sync_fn_in_threadpool(self.fn, **arguments)
@@ -378,18 +546,12 @@ class TransformedTool(Tool):
 
             # If transform function returns ToolResult, respect our output_schema setting
             if isinstance(result, ToolResult):
-                if self.output_schema is None:
-                    return result
-                elif self.output_schema.get(
-                    "type"
-                ) != "object" and not self.output_schema.get("x-fastmcp-wrap-result"):
-                    # Non-object explicit schemas disable structured content
+                if _drops_structured_content(self.output_schema):
                     return ToolResult(
                         content=result.content,
                         structured_content=None,
                     )
-                else:
-                    return result
+                return result
 
             return self.convert_result(result)
         finally:
@@ -500,7 +662,9 @@ class TransformedTool(Tool):
             )
 
         # Always create the forwarding transform
-        schema, forwarding_fn = cls._create_forwarding_transform(tool, transform_args)
+        schema, forwarding_fn, forwarding_plan = cls._create_forwarding_transform(
+            tool, transform_args
+        )
 
         # Handle output schema
         if output_schema is NotSet:
@@ -607,6 +771,7 @@ class TransformedTool(Tool):
             fn=final_fn,
             return_type=parsed_fn.return_type if parsed_fn is not None else None,
             forwarding_fn=forwarding_fn,
+            forwarding_plan=forwarding_plan,
             parent_tool=tool,
             name=final_name,
             version=final_version,
@@ -628,7 +793,7 @@ class TransformedTool(Tool):
         cls,
         parent_tool: Tool,
         transform_args: dict[str, ArgTransform] | None,
-    ) -> tuple[dict[str, Any], Callable[..., Any]]:
+    ) -> tuple[dict[str, Any], Callable[..., Any], _ForwardingPlan]:
         """Create schema and forwarding function that encapsulates all transformation logic.
 
         This method builds a new JSON schema for the transformed tool and creates a
@@ -639,10 +804,15 @@ class TransformedTool(Tool):
             parent_tool: The original tool to transform.
             transform_args: Dictionary defining how to transform each argument.
 
+        If the parent tool only forwards to its own parent, its forwarding is
+        fused into this one, so calls skip the parent's ``run`` and go straight
+        to the first tool in the chain that does real work.
+
         Returns:
             A tuple containing:
             - The new JSON schema for the transformed tool as a dictionary
             - Async function that validates and forwards calls to the parent tool
+            - The forwarding plan that function executes
         """
 
         # Build transformed schema and mapping
@@ -654,7 +824,8 @@ class TransformedTool(Tool):
         new_props = {}
         new_required = set()
         new_to_old = {}
-        hidden_defaults = {}  # Track hidden parameters with constant values
+        hidden_constants = {}  # Hidden parameters with constant values
+        hidden_factories = []  # Hidden parameters with per-call factories
 
         for old_name, old_schema in parent_props.items():
             # Check if parameter is in transform_args
@@ -677,9 +848,10 @@ class TransformedTool(Tool):
                         f"and no default or default_factory provided in ArgTransform. Either provide a default "
                         f"or default_factory in ArgTransform or don't hide required parameters."
                     )
-                if has_user_default:
-                    # Store info for later factory calling or direct value
-                    hidden_defaults[old_name] = transform
+                if transform.default is not NotSet:
+                    hidden_constants[old_name] = transform.default
+                elif callable(transform.default_factory):
+                    hidden_factories.append((old_name, transform.default_factory))
                 # Skip adding to schema (not exposed to clients)
                 continue
 
@@ -725,43 +897,41 @@ class TransformedTool(Tool):
             schema["$defs"] = parent_defs
             schema = compress_schema(schema)
 
+        plan = _ForwardingPlan(
+            target=parent_tool,
+            new_to_old=new_to_old,
+            required=frozenset(new_required),
+            constants=hidden_constants,
+            factories=tuple(hidden_factories),
+        )
+        plan = cls._fuse_with_parent(plan, parent_tool)
+
         # Create forwarding function that closes over everything it needs
         async def _forward(**kwargs: Any):
-            # Validate arguments
-            valid_args = set(new_props.keys())
-            provided_args = set(kwargs.keys())
-            unknown_args = provided_args - valid_args
-
-            if unknown_args:
-                raise TypeError(
-                    f"Got unexpected keyword argument(s): {', '.join(sorted(unknown_args))}"
-                )
-
-            # Check required arguments
-            missing_args = new_required - provided_args
-            if missing_args:
-                raise TypeError(
-                    f"Missing required argument(s): {', '.join(sorted(missing_args))}"
-                )
-
-            # Map arguments to parent names
-            parent_args = {}
-            for new_name, value in kwargs.items():
-                old_name = new_to_old.get(new_name, new_name)
-                parent_args[old_name] = value
+            return await plan.target.run(plan.map_arguments(kwargs))
 
-            # Add hidden defaults (constant values for hidden parameters)
-            for old_name, transform in hidden_defaults.items():
-                if transform.default is not NotSet:
-                    parent_args[old_name] = transform.default
-                elif transform.default_factory is not NotSet:
-                    # Type check to ensure default_factory is callable
-                    if callable(transform.default_factory):
-                        parent_args[old_name] = transform.default_factory()
+        return schema, _forward, plan
 
-            return await parent_tool.run(parent_args)
+    @staticmethod
+    def _fuse_with_parent(plan: _ForwardingPlan, parent_tool: Tool) -> _ForwardingPlan:
+        """Skip *parent_tool* if running it would only forward the call.
 
-        return schema, _forward
+        That holds for a plain ``TransformedTool`` without a custom function
+        whose output schema passes forwarded results through unchanged.
+        """
+        if (
+            isinstance(parent_tool, TransformedTool)
+            and type(parent_tool).run is TransformedTool.run
+            and parent_tool.fn is parent_tool.forwarding_fn
+            and parent_tool.forwarding_plan is not None
+            and not _drops_structured_content(parent_tool.output_schema)
+        ):
+            fused = plan.compose(
+                parent_tool._get_run_plan(), parent_tool.forwarding_plan
+            )
+            if fused is not None:
+                return fused
+        return plan
 
     @staticmethod
     def _apply_single_transform(
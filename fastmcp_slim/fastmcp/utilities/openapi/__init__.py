@@ -14,6 +14,14 @@ from .models import (
 # Import from parser
 from .parser import parse_openapi_to_http_routes
 
+# Import from cache
+from .cache import (
+    ParsedRoutes,
+    load_or_parse_http_routes,
+    route_key,
+    routes_cache_key,
+)
+
 # Import from formatters
 from .formatters import (
     format_array_parameter,
@@ -44,6 +52,7 @@ __all__ = [
     "JsonSchema",
     "ParameterInfo",
     "ParameterLocation",
+    "ParsedRoutes",
     "RequestBodyInfo",
     "ResponseInfo",
     "_combine_schemas",
@@ -57,5 +66,8 @@ __all__ = [
     "format_description_with_responses",
     "format_json_for_description",
     "generate_example_from_schema",
+    "load_or_parse_http_routes",
     "parse_openapi_to_http_routes",
+    "route_key",
+    "routes_cache_key",
 ]
@@ -0,0 +1,107 @@
+"""Persistent on-disk cache of parsed OpenAPI routes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from pydantic import Field, ValidationError
+
+import fastmcp
+from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.types import FastMCPBaseModel
+
+from .models import HTTPRoute, JsonSchema
+from .parser import parse_openapi_to_http_routes
+from .schemas import extract_output_schema_from_responses
+
+logger = get_logger(__name__)
+
+
+class ParsedRoutes(FastMCPBaseModel):
+    """Parsed routes plus the tool output schemas derived from them."""
+
+    routes: list[HTTPRoute]
+    # Keyed by `route_key`; derived with extract_output_schema_from_responses.
+    output_schemas: dict[str, JsonSchema | None] = Field(default_factory=dict)
+
+
+def route_key(route: HTTPRoute) -> str:
+    """Identify a route within its spec."""
+    return f"{route.method} {route.path}"
+
+
+def routes_cache_key(openapi_dict: dict[str, Any]) -> str:
+    """Return the cache key for a spec: a hash of its content and the fastmcp version.
+
+    Including the version invalidates every entry on upgrade, since the parsed
+    route format (and the schemas derived into it) may change between releases.
+    """
+    digest = hashlib.sha256()
+    digest.update(fastmcp.__version__.encode())
+    digest.update(b"\0")
+    digest.update(
+        json.dumps(
+            openapi_dict, sort_keys=True, separators=(",", ":"), default=str
+        ).encode()
+    )
+    return digest.hexdigest()
+
+
+def load_or_parse_http_routes(
+    openapi_dict: dict[str, Any], cache_dir: str | Path
+) -> ParsedRoutes:
+    """Parse an OpenAPI spec into HTTPRoutes, reusing a cached result when valid.
+
+    Parsed routes (including the precomputed flat parameter schemas tools take
+    as input) and each route's output schema are stored as JSON in `cache_dir`,
+    one file per spec content and fastmcp version. A missing, stale, or
+    unreadable entry falls back to a full parse and rewrites the entry.
+    """
+    cache_path = (
+        Path(cache_dir) / f"openapi-routes-{routes_cache_key(openapi_dict)}.json"
+    )
+
+    try:
+        parsed = ParsedRoutes.model_validate_json(cache_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except (OSError, ValidationError) as e:
+        logger.debug(f"Ignoring unreadable OpenAPI route cache {cache_path}: {e}")
+    else:
+        logger.debug(f"Loaded {len(parsed.routes)} OpenAPI routes from {cache_path}")
+        return parsed
+
+    routes = parse_openapi_to_http_routes(openapi_dict)
+    parsed = ParsedRoutes(
+        routes=routes,
+        output_schemas={
+            route_key(route): extract_output_schema_from_responses(
+                route.responses, route.response_schemas, route.openapi_version
+            )
+            for route in routes
+        },
+    )
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and rename so concurrent starts never see
+        # a partially written entry.
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(parsed.model_dump_json(by_alias=True).encode())
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        logger.warning(f"Failed to write OpenAPI route cache {cache_path}: {e}")
+
+    return parsed
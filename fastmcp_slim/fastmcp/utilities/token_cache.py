@@ -1,9 +1,11 @@
 """In-memory cache for token verification results.
 
 Provides a generic TTL-based cache for ``AccessToken`` objects, designed to
-reduce repeated network calls during opaque-token verification.  Only
-*successful* verifications should be cached; errors and failures must be
-retried on every request.
+reduce repeated network calls during opaque-token verification.  Successful
+verifications are cached for the configured TTL.  Definitive rejections (for
+example ``active=false`` from an introspection endpoint) can optionally be
+cached for a much shorter TTL with ``set_rejected``; transient failures such
+as HTTP errors and timeouts must be retried on every request.
 
 Example:
     ```python
@@ -12,6 +14,7 @@ Example:
     cache = TokenCache(ttl_seconds=300, max_size=10000)
 
     # On cache miss, call the upstream verifier and store the result.
+    # A hit returns ``None`` when the token was recently rejected.
     hit, token = cache.get(raw_token)
     if not hit:
         token = await _call_upstream(raw_token)
@@ -22,8 +25,10 @@ Example:
 
 from __future__ import annotations
 
+import dataclasses
 import hashlib
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 
 from fastmcp.server.auth.auth import AccessToken
@@ -37,12 +42,34 @@ _CLEANUP_INTERVAL = 60  # seconds between periodic sweeps
 
 @dataclass
 class _CacheEntry:
-    """A cached token result with its absolute expiration timestamp."""
+    """A cached token result with its absolute expiration timestamp.
 
-    result: AccessToken
+    ``result`` is ``None`` for a cached rejection.
+    """
+
+    result: AccessToken | None
     expires_at: float
 
 
+@dataclass
+class TokenCacheStats:
+    """Counters describing how a ``TokenCache`` has been used.
+
+    Attributes:
+        hits: Lookups answered with a cached ``AccessToken``.
+        negative_hits: Lookups answered with a cached rejection.
+        misses: Lookups that found nothing usable and fell through to the
+            upstream verifier.
+        evictions: Live entries dropped to make room for new ones.  Expired
+            entries removed during cleanup are not counted.
+    """
+
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
 class TokenCache:
     """TTL-based in-memory cache for ``AccessToken`` objects.
 
@@ -50,7 +77,10 @@ class TokenCache:
     - SHA-256 hashed cache keys (fixed size, regardless of token length).
     - Per-entry TTL that respects both the configured ``ttl_seconds`` and the
       token's own ``expires_at`` claim (whichever is sooner).
-    - Bounded size with FIFO eviction when the cache is full.
+    - Bounded size with least-recently-used eviction when the cache is full.
+    - Optional short-lived negative cache for rejected tokens, kept separate
+      from successful results so a flood of invalid tokens cannot evict them.
+    - Hit, miss, and eviction counters via ``stats``.
     - Periodic cleanup of expired entries to prevent unbounded growth.
     - Defensive deep copies on both store and retrieve to prevent
       callers from mutating cached values.
@@ -64,6 +94,7 @@ class TokenCache:
         *,
         ttl_seconds: int | None = None,
         max_size: int | None = None,
+        negative_ttl_seconds: int | None = None,
     ) -> None:
         """Initialise the cache.
 
@@ -72,7 +103,12 @@ class TokenCache:
                 ``None`` or ``0`` disables caching entirely.
             max_size: Upper bound on the number of entries.  When the limit is
                 reached, expired entries are swept first; if still full the
-                oldest entry is evicted.  Defaults to 10 000.
+                least recently used entry is evicted.  Defaults to 10 000.
+                Applies separately to successful and rejected tokens.
+            negative_ttl_seconds: How long rejected tokens recorded with
+                ``set_rejected`` are remembered, in seconds.  ``None`` or
+                ``0`` (the default) disables negative caching.  Never
+                longer than ``ttl_seconds``.
         """
         if ttl_seconds is not None and ttl_seconds < 0:
             raise ValueError(
@@ -80,9 +116,17 @@ class TokenCache:
             )
         if max_size is not None and max_size < 0:
             raise ValueError(f"max_cache_size must be non-negative, got {max_size}")
+        if negative_ttl_seconds is not None and negative_ttl_seconds < 0:
+            raise ValueError(
+                "negative_cache_ttl_seconds must be non-negative, "
+                f"got {negative_ttl_seconds}"
+            )
         self._ttl = ttl_seconds or 0
+        self._negative_ttl = min(negative_ttl_seconds or 0, self._ttl)
         self._max_size = max_size if max_size is not None else DEFAULT_MAX_CACHE_SIZE
-        self._entries: dict[str, _CacheEntry] = {}
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._rejected: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._stats = TokenCacheStats()
         self._last_cleanup = time.monotonic()
 
     @property
@@ -90,54 +134,81 @@ class TokenCache:
         """Return whether caching is active."""
         return self._ttl > 0 and self._max_size > 0
 
+    @property
+    def stats(self) -> TokenCacheStats:
+        """Return a snapshot of the cache counters."""
+        return dataclasses.replace(self._stats)
+
     # -- public API ----------------------------------------------------------
 
     def get(self, token: str) -> tuple[bool, AccessToken | None]:
         """Look up a cached verification result.
 
         Returns:
-            ``(True, AccessToken)`` on a cache hit, ``(False, None)`` on a miss
-            or when caching is disabled.  The returned ``AccessToken`` is a deep
+            ``(True, AccessToken)`` on a cache hit, ``(True, None)`` when the
+            token was recently rejected, and ``(False, None)`` on a miss or
+            when caching is disabled.  The returned ``AccessToken`` is a deep
             copy that is safe to mutate.
         """
         if not self.enabled:
             return (False, None)
 
         cache_key = self._hash_token(token)
-        entry = self._entries.get(cache_key)
+        now = time.time()
 
-        if entry is None:
-            return (False, None)
+        entry = self._lookup(self._entries, cache_key, now)
+        if entry is not None and entry.result is not None:
+            self._stats.hits += 1
+            return (True, entry.result.model_copy(deep=True))
 
-        if entry.expires_at < time.time():
-            del self._entries[cache_key]
-            return (False, None)
+        if self._rejected and self._lookup(self._rejected, cache_key, now):
+            self._stats.negative_hits += 1
+            return (True, None)
 
-        return (True, entry.result.model_copy(deep=True))
+        self._stats.misses += 1
+        return (False, None)
 
     def set(self, token: str, result: AccessToken) -> None:
         """Store a *successful* verification result.
 
-        Only successful verifications should be cached.  Failures (inactive
-        tokens, missing scopes, HTTP errors, timeouts) must **not** be cached
-        so that transient problems do not produce sticky false negatives.
+        Only successful verifications should be stored here.  Use
+        ``set_rejected`` for definitive rejections; transient failures (HTTP
+        errors, timeouts) must **not** be cached so that they do not produce
+        sticky false negatives.
         """
         if not self.enabled:
             return
 
         cache_key = self._hash_token(token)
 
-        self._maybe_cleanup()
-        if cache_key not in self._entries:
-            self._enforce_size_limit()
-
         expires_at = time.time() + self._ttl
         if result.expires_at:
             expires_at = min(expires_at, float(result.expires_at))
 
-        self._entries[cache_key] = _CacheEntry(
-            result=result.model_copy(deep=True),
-            expires_at=expires_at,
+        self._rejected.pop(cache_key, None)
+        self._store(
+            self._entries,
+            cache_key,
+            _CacheEntry(result=result.model_copy(deep=True), expires_at=expires_at),
+        )
+
+    def set_rejected(self, token: str) -> None:
+        """Remember that *token* was rejected for ``negative_ttl_seconds``.
+
+        Intended for definitive answers from the upstream verifier, such as
+        an introspection response with ``active=false``, so that clients
+        replaying an invalid token do not reach the upstream on every request.
+        A no-op when negative caching is disabled.
+        """
+        if not self.enabled or self._negative_ttl <= 0:
+            return
+
+        cache_key = self._hash_token(token)
+        self._entries.pop(cache_key, None)
+        self._store(
+            self._rejected,
+            cache_key,
+            _CacheEntry(result=None, expires_at=time.time() + self._negative_ttl),
         )
 
     # -- internals -----------------------------------------------------------
@@ -147,14 +218,45 @@ class TokenCache:
         """Return the SHA-256 hex digest of *token*."""
         return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
+    @staticmethod
+    def _lookup(
+        entries: OrderedDict[str, _CacheEntry], cache_key: str, now: float
+    ) -> _CacheEntry | None:
+        """Return the live entry for *cache_key*, marking it recently used."""
+        entry = entries.get(cache_key)
+        if entry is None:
+            return None
+        if entry.expires_at < now:
+            del entries[cache_key]
+            return None
+        entries.move_to_end(cache_key)
+        return entry
+
+    def _store(
+        self,
+        entries: OrderedDict[str, _CacheEntry],
+        cache_key: str,
+        entry: _CacheEntry,
+    ) -> None:
+        """Insert *entry* as the most recently used, evicting if full."""
+        self._maybe_cleanup()
+        if cache_key in entries:
+            entries.move_to_end(cache_key)
+        else:
+            self._enforce_size_limit(entries)
+        entries[cache_key] = entry
+
     def _cleanup_expired(self) -> None:
         """Remove all entries whose TTL has elapsed."""
         now = time.time()
-        expired = [k for k, v in self._entries.items() if v.expires_at < now]
-        for key in expired:
-            del self._entries[key]
-        if expired:
-            logger.debug("Cleaned up %d expired cache entries", len(expired))
+        removed = 0
+        for entries in (self._entries, self._rejected):
+            expired = [k for k, v in entries.items() if v.expires_at < now]
+            for key in expired:
+                del entries[key]
+            removed += len(expired)
+        if removed:
+            logger.debug("Cleaned up %d expired cache entries", removed)
 
     def _maybe_cleanup(self) -> None:
         """Run ``_cleanup_expired`` at most once per cleanup interval."""
@@ -163,11 +265,11 @@ class TokenCache:
             self._cleanup_expired()
             self._last_cleanup = now
 
-    def _enforce_size_limit(self) -> None:
-        """Ensure there is room for at least one new entry."""
-        if len(self._entries) < self._max_size:
+    def _enforce_size_limit(self, entries: OrderedDict[str, _CacheEntry]) -> None:
+        """Ensure *entries* has room for at least one new entry."""
+        if len(entries) < self._max_size:
             return
         self._cleanup_expired()
-        if len(self._entries) >= self._max_size:
-            oldest_key = next(iter(self._entries))
-            del self._entries[oldest_key]
+        while len(entries) >= self._max_size:
+            entries.popitem(last=False)
+            self._stats.evictions += 1
@@ -0,0 +1,214 @@
+"""Adaptive worker concurrency for FastMCP background tasks.
+
+A Docket worker takes at most ``concurrency`` tasks at a time and re-reads that
+limit on every pass of its loop, so it can be changed while the worker runs.
+``ConcurrencyController`` samples the queue through a ``QueueDepthSource`` and
+moves the limit between configured bounds: it grows while due tasks wait longer
+than the target latency, and shrinks after the queue has stayed empty for a few
+samples. The current limit and backlog are published as OpenTelemetry gauges.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Protocol
+
+from opentelemetry import metrics
+
+from fastmcp.utilities.logging import get_logger
+
+if TYPE_CHECKING:
+    from docket import Docket, Worker
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class QueueSample:
+    """One observation of the task queue."""
+
+    backlog: int
+    """Due tasks that no worker has picked up yet."""
+
+    oldest_wait: float
+    """Seconds the oldest of those tasks has been waiting (0 if none)."""
+
+
+class QueueDepthSource(Protocol):
+    async def sample(self) -> QueueSample: ...
+
+
+class DocketQueueDepth:
+    """Read the backlog of a Docket queue from its Redis stream.
+
+    Due tasks sit in the stream until a worker reads them through the consumer
+    group. Entries past the group's last-delivered ID are the backlog, and the
+    first one's stream ID timestamps when it became due. Tasks that are overdue
+    but not yet moved out of the schedule also count toward the backlog.
+    """
+
+    def __init__(self, docket: Docket):
+        self.docket = docket
+
+    async def sample(self) -> QueueSample:
+        docket = self.docket
+        now = time.time()
+        async with docket.redis() as redis:
+            async with redis.pipeline() as pipeline:
+                pipeline.zcount(docket.queue_key, 0, now)
+                pipeline.xlen(docket.stream_key)
+                overdue, length = await pipeline.execute()
+            if not length:
+                return QueueSample(backlog=overdue, oldest_wait=0.0)
+
+            pending, last_delivered = 0, "0-0"
+            for group in await redis.xinfo_groups(docket.stream_key):
+                if _text(group["name"]) == docket.worker_group_name:
+                    pending = group["pending"]
+                    last_delivered = _text(group["last-delivered-id"])
+
+            backlog = max(length - pending, 0)
+            oldest_wait = 0.0
+            if backlog:
+                # XRANGE's exclusive "(" bound isn't supported by every backend,
+                # so start from the ID right after the last delivered one.
+                ms, seq = last_delivered.split("-")
+                first = await redis.xrange(
+                    docket.stream_key, f"{ms}-{int(seq) + 1}", "+", count=1
+                )
+                if first:
+                    enqueued = int(_text(first[0][0]).split("-")[0]) / 1000
+                    oldest_wait = max(now - enqueued, 0.0)
+
+        return QueueSample(backlog=backlog + overdue, oldest_wait=oldest_wait)
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class ConcurrencyController:
+    """Grow or shrink a worker's concurrency to follow its queue.
+
+    Each sample is turned into a new limit by ``observe()``:
+
+    - When due tasks have waited at least ``target_latency``, the limit grows
+      by the backlog, at most doubling per sample.
+    - When the queue has been empty for ``scale_down_after`` consecutive
+      samples, the limit drops by a quarter (at least one).
+    - Otherwise the limit holds.
+
+    The result is always clamped to ``[min_concurrency, max_concurrency]``.
+    Lowering the limit never interrupts running tasks; the worker just takes
+    fewer new ones until it is back under the limit.
+    """
+
+    def __init__(
+        self,
+        worker: Worker,
+        source: QueueDepthSource,
+        *,
+        min_concurrency: int,
+        max_concurrency: int,
+        target_latency: timedelta = timedelta(seconds=1),
+        interval: timedelta = timedelta(seconds=1),
+        scale_down_after: int = 3,
+    ):
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError(
+                "Expected 1 <= min_concurrency <= max_concurrency, got "
+                f"min_concurrency={min_concurrency}, max_concurrency={max_concurrency}"
+            )
+        self.worker = worker
+        self.source = source
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.target_latency = target_latency
+        self.interval = interval
+        self.scale_down_after = scale_down_after
+        self.backlog = 0
+        self.oldest_wait = 0.0
+        self._idle_samples = 0
+        worker.concurrency = self._clamp(worker.concurrency)
+
+    @property
+    def concurrency(self) -> int:
+        return self.worker.concurrency
+
+    def _clamp(self, concurrency: int) -> int:
+        return min(max(concurrency, self.min_concurrency), self.max_concurrency)
+
+    def observe(self, sample: QueueSample) -> int:
+        """Record `sample`, apply the resulting limit to the worker, and return it."""
+        self.backlog = sample.backlog
+        self.oldest_wait = sample.oldest_wait
+        current = self.worker.concurrency
+        target = current
+
+        if sample.backlog == 0:
+            self._idle_samples += 1
+            if self._idle_samples >= self.scale_down_after:
+                self._idle_samples = 0
+                target = current - max(current // 4, 1)
+        else:
+            self._idle_samples = 0
+            if sample.oldest_wait >= self.target_latency.total_seconds():
+                target = current + min(sample.backlog, current)
+
+        target = self._clamp(target)
+        if target != current:
+            logger.info(
+                f"Worker {self.worker.name}: concurrency {current} -> {target} "
+                f"(backlog {sample.backlog}, oldest wait {sample.oldest_wait:.2f}s)"
+            )
+            self.worker.concurrency = target
+        return target
+
+    async def run(self) -> None:
+        """Sample the queue every `interval` until cancelled."""
+        _controllers.add(self)
+        try:
+            while True:
+                try:
+                    sample = await self.source.sample()
+                except Exception as e:
+                    logger.warning(f"Failed to sample task queue depth: {e}")
+                else:
+                    self.observe(sample)
+                await asyncio.sleep(self.interval.total_seconds())
+        finally:
+            _controllers.discard(self)
+
+
+_controllers: weakref.WeakSet[ConcurrencyController] = weakref.WeakSet()
+
+
+def _observe(attribute: str) -> Iterable[metrics.Observation]:
+    for controller in list(_controllers):
+        yield metrics.Observation(
+            getattr(controller, attribute),
+            {
+                "docket.name": controller.worker.docket.name,
+                "docket.worker": controller.worker.name,
+            },
+        )
+
+
+_meter = metrics.get_meter("fastmcp_tasks")
+_meter.create_observable_gauge(
+    "fastmcp_tasks_worker_concurrency",
+    callbacks=[lambda _options: _observe("concurrency")],
+    description="Current concurrency limit of an autoscaled task worker",
+    unit="1",
+)
+_meter.create_observable_gauge(
+    "fastmcp_tasks_worker_backlog",
+    callbacks=[lambda _options: _observe("backlog")],
+    description="Due tasks waiting for a worker, as last sampled by the autoscaler",
+    unit="1",
+)
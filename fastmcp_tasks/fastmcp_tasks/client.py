@@ -24,7 +24,12 @@ capability ad, the server never tasks, and this extension is inert.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Sequence
+import contextvars
+import heapq
+import itertools
+import random
+import weakref
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any, cast
 
 import mcp_types
@@ -63,8 +68,18 @@ logger = get_logger(__name__)
 #: sending `0` cannot spin the client in a tight loop.
 MIN_POLL_INTERVAL = 0.02
 
+#: Each poll delay is stretched by a random fraction of up to this much, so tasks
+#: started together drift apart instead of polling in lockstep.
+POLL_JITTER = 0.25
+
+#: Upper bound on concurrent `tasks/get` requests a session's tracker sends.
+MAX_POLLS_IN_FLIGHT = 32
+
 _TERMINAL_STATES = frozenset({"completed", "failed", "cancelled"})
 
+# Polls falling due within this window of each other go out on the same wakeup.
+_POLL_COALESCE = 0.005
+
 
 # ---------------------------------------------------------------------------
 # Wire senders (tasks/get, tasks/update, tasks/cancel) over a ClientSession
@@ -165,6 +180,223 @@ def _next_poll_delay(
     return min(backoff, ceiling), min(backoff * 2, ceiling)
 
 
+def _jittered(delay: float) -> float:
+    """`delay` stretched by a random fraction of up to `POLL_JITTER`.
+
+    Jitter only lengthens the delay, so a poll never comes sooner than the
+    server's advertised interval allows.
+    """
+    return delay * (1 + random.uniform(0, POLL_JITTER))
+
+
+# ---------------------------------------------------------------------------
+# The session task tracker: one poll scheduler for every task on a session
+# ---------------------------------------------------------------------------
+
+
+class _Watch:
+    """One task being polled, and the callers waiting on it."""
+
+    def __init__(self, task_id: str, context: contextvars.Context) -> None:
+        self.task_id = task_id
+        # The first waiter's context, so polls nest under its client span.
+        self.context = context
+        # Each waiter's predicate, future, and loop-time deadline (None if
+        # unbounded).
+        self.waiters: list[
+            tuple[
+                Callable[[ClientGetTaskResult], bool],
+                asyncio.Future[ClientGetTaskResult],
+                float | None,
+            ]
+        ] = []
+        self.backoff = MIN_POLL_INTERVAL
+        self.due: float | None = None
+        self.poll: asyncio.Task[None] | None = None
+
+    def read_timeout(self, now: float) -> float | None:
+        """How long a poll may wait: until the last waiter's deadline passes."""
+        deadlines = [deadline for _, _, deadline in self.waiters]
+        if not deadlines or None in deadlines:
+            return None
+        return max(max(d for d in deadlines if d is not None) - now, 0.0)
+
+
+class TaskTracker:
+    """Polls every outstanding task on a session from a single scheduler.
+
+    Waiting on many tasks at once used to run one polling loop per task. The
+    tracker instead keeps a due time per task and wakes once for whatever has
+    come due, so a client awaiting hundreds of tasks has one sleeping scheduler
+    and at most `max_in_flight` `tasks/get` requests on the wire. Each task keeps
+    its own backoff (`_next_poll_delay`, capped by the server's advertised
+    `pollIntervalMs`) with jitter, and callers waiting on the same task share
+    its polls rather than issuing their own. A poll's read timeout runs to the
+    latest deadline among its waiters, and a poll nobody waits on any more is
+    cancelled, so a stalled request never outlives its callers.
+
+    The scheduler runs only while something is being waited on. Use
+    `task_tracker()` to get the tracker for a session.
+    """
+
+    def __init__(
+        self, session: ClientSession, *, max_in_flight: int = MAX_POLLS_IN_FLIGHT
+    ) -> None:
+        # Weak, so the session-keyed registry does not keep its session alive.
+        self._session = weakref.ref(session)
+        self._watches: dict[str, _Watch] = {}
+        self._due: list[tuple[float, int, _Watch]] = []
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._scheduler: asyncio.Task[None] | None = None
+        self._polls: set[asyncio.Task[None]] = set()
+
+    @property
+    def outstanding(self) -> int:
+        """Number of tasks currently being polled."""
+        return len(self._watches)
+
+    async def wait(
+        self,
+        task_id: str,
+        until: Callable[[ClientGetTaskResult], bool],
+        timeout: float | None = None,
+    ) -> ClientGetTaskResult:
+        """Poll `task_id` until a `tasks/get` response satisfies `until`.
+
+        A task nobody was waiting on is polled right away; joining a task that is
+        already tracked waits for its next scheduled poll. Raises `TimeoutError`
+        if `timeout` seconds pass first, and re-raises a failed poll's error.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ClientGetTaskResult] = loop.create_future()
+        deadline = None if timeout is None else loop.time() + timeout
+        waiter = (until, future, deadline)
+        watch = self._watches.get(task_id)
+        if watch is None:
+            watch = _Watch(task_id, contextvars.copy_context())
+            self._watches[task_id] = watch
+            self._schedule(watch, loop.time())
+        watch.waiters.append(waiter)
+        if self._scheduler is None or self._scheduler.done():
+            self._scheduler = asyncio.create_task(self._run())
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError as exc:
+            # Normalize to the builtin, which is distinct on Python 3.10.
+            raise TimeoutError(
+                f"Task {task_id} did not reach the awaited state within {timeout}s"
+            ) from exc
+        finally:
+            if waiter in watch.waiters:
+                watch.waiters.remove(waiter)
+            if not watch.waiters:
+                self._forget(watch)
+
+    def _schedule(self, watch: _Watch, due: float) -> None:
+        watch.due = due
+        heapq.heappush(self._due, (due, next(self._sequence), watch))
+        self._wakeup.set()
+
+    def _forget(self, watch: _Watch) -> None:
+        if self._watches.get(watch.task_id) is watch:
+            del self._watches[watch.task_id]
+            self._wakeup.set()
+        # Free the in-flight slot held by a poll whose callers all left.
+        poll = watch.poll
+        if poll is not None and poll is not asyncio.current_task():
+            poll.cancel()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._watches:
+            self._wakeup.clear()
+            now = loop.time()
+            while self._due and self._due[0][0] <= now + _POLL_COALESCE:
+                due, _, watch = heapq.heappop(self._due)
+                # Skip entries superseded by a reschedule or a dropped watch.
+                if watch.due == due and self._watches.get(watch.task_id) is watch:
+                    watch.due = None
+                    watch.context.run(self._start_poll, watch)
+            timeout = self._due[0][0] - now if self._due else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        self._due.clear()
+
+    def _start_poll(self, watch: _Watch) -> None:
+        poll = watch.poll = asyncio.create_task(self._poll(watch))
+        self._polls.add(poll)
+        poll.add_done_callback(self._polls.discard)
+
+    async def _poll(self, watch: _Watch) -> None:
+        loop = asyncio.get_running_loop()
+        poll_deadline: float | None = None
+        try:
+            session = self._session()
+            if session is None:
+                raise RuntimeError("The client session has closed")
+            async with self._in_flight:
+                read_timeout = watch.read_timeout(loop.time())
+                if read_timeout is not None:
+                    poll_deadline = loop.time() + read_timeout
+                current = await _send_get(session, watch.task_id, read_timeout)
+        except Exception as exc:
+            if self._watches.get(watch.task_id) is not watch:
+                return
+            # Waiters that joined mid-poll with a later deadline than this
+            # poll's timeout get a fresh poll rather than its error.
+            failed = [
+                w
+                for w in watch.waiters
+                if poll_deadline is None or (w[2] is not None and w[2] <= poll_deadline)
+            ]
+            for _, future, _ in failed:
+                if not future.done():
+                    future.set_exception(exc)
+            watch.waiters = [w for w in watch.waiters if w not in failed]
+            if watch.waiters:
+                self._schedule(watch, loop.time())
+            else:
+                self._forget(watch)
+            return
+        finally:
+            if watch.poll is asyncio.current_task():
+                watch.poll = None
+        if self._watches.get(watch.task_id) is not watch:
+            return
+
+        for until, future, _ in watch.waiters:
+            if not future.done() and until(current):
+                future.set_result(current)
+        watch.waiters = [w for w in watch.waiters if not w[1].done()]
+        if not watch.waiters:
+            self._forget(watch)
+            return
+        delay, watch.backoff = _next_poll_delay(current.poll_interval_ms, watch.backoff)
+        self._schedule(watch, loop.time() + _jittered(delay))
+
+
+_trackers: weakref.WeakKeyDictionary[ClientSession, TaskTracker] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def task_tracker(session: ClientSession) -> TaskTracker:
+    """The `TaskTracker` for `session`, created on first use."""
+    tracker = _trackers.get(session)
+    if tracker is None:
+        tracker = _trackers[session] = TaskTracker(session)
+    return tracker
+
+
+def _needs_driving(result: ClientGetTaskResult) -> bool:
+    return result.status in _TERMINAL_STATES or result.status == "input_required"
+
+
 # ---------------------------------------------------------------------------
 # In-task input: answer a parked task's requests via the elicitation handler
 # ---------------------------------------------------------------------------
@@ -253,21 +485,22 @@ async def _drive_to_terminal(
 ) -> ClientGetTaskResult:
     """Poll `tasks/get` until the task reaches a terminal state.
 
-    `working` sleeps and polls again; `input_required` answers the outstanding
-    requests through the elicitation handler and re-enters; a terminal state
-    (completed / failed / cancelled) is returned. Shared by the transparent
-    resolver and `ToolTask.result()`.
+    Polling goes through the session's `TaskTracker`, so concurrent drives
+    share one scheduler. `input_required` answers the outstanding requests
+    through the elicitation handler and re-enters (polling again right away); a
+    terminal state (completed / failed / cancelled) is returned. Shared by the
+    transparent resolver and `ToolTask.result()`.
 
     `timeout_seconds`, when set, is one deadline for the *entire* drive — not a
     per-request timeout. The synchronous path aborts a `tools/call` once total
-    execution exceeds the call's timeout, so the tasked path must too: each poll
-    and sleep is bounded by the time remaining, and a `TimeoutError` is raised
-    once the deadline passes. `None` drives to completion unbounded (the default
-    for `ToolTask.result()`, whose caller bounds waiting via `wait(timeout=...)`).
+    execution exceeds the call's timeout, so the tasked path must too: each wait
+    is bounded by the time remaining, and a `TimeoutError` is raised once the
+    deadline passes. `None` drives to completion unbounded (the default for
+    `ToolTask.result()`, whose caller bounds waiting via `wait(timeout=...)`).
     """
     loop = asyncio.get_event_loop()
     deadline = None if timeout_seconds is None else loop.time() + timeout_seconds
-    backoff = MIN_POLL_INTERVAL
+    tracker = task_tracker(session)
 
     def remaining() -> float | None:
         return None if deadline is None else deadline - loop.time()
@@ -278,26 +511,21 @@ async def _drive_to_terminal(
             raise TimeoutError(
                 f"Task {task_id} did not finish within {timeout_seconds}s"
             )
-
-        current = await _send_get(session, task_id, budget)
+        try:
+            current = await tracker.wait(task_id, _needs_driving, budget)
+        except TimeoutError as exc:
+            raise TimeoutError(
+                f"Task {task_id} did not finish within {timeout_seconds}s"
+            ) from exc
         if current.status in _TERMINAL_STATES:
             return current
-        if current.status == "input_required":
-            await _answer_input_requests(
-                session,
-                task_id,
-                current.input_requests or {},
-                elicitation_callback,
-                remaining(),
-            )
-            backoff = MIN_POLL_INTERVAL
-            continue
-        # working
-        delay, backoff = _next_poll_delay(current.poll_interval_ms, backoff)
-        budget = remaining()
-        if budget is not None:
-            delay = min(delay, budget)
-        await asyncio.sleep(delay)
+        await _answer_input_requests(
+            session,
+            task_id,
+            current.input_requests or {},
+            elicitation_callback,
+            remaining(),
+        )
 
 
 def _inlined_call_tool_result(result: dict[str, Any] | None) -> CallToolResult:
@@ -443,37 +671,19 @@ class ToolTask:
         should use `result()`. `wait(state="input_required")` lets a caller
         observe the parked state and answer it manually.
         """
-        loop = asyncio.get_event_loop()
-        deadline = loop.time() + timeout
-        backoff = MIN_POLL_INTERVAL
-        while True:
-            remaining = deadline - loop.time()
-            if remaining <= 0:
-                raise TimeoutError(
-                    f"Task {self.task_id} did not reach "
-                    f"{state or 'a terminal state'} within {timeout}s"
-                )
-            # Bound the request itself by the remaining deadline: a stalled
-            # `tasks/get` must not block past the caller's timeout waiting for
-            # the session-wide default before the deadline is next checked.
-            current = await _send_get(
-                self._session, self.task_id, read_timeout_seconds=remaining
-            )
-            if state is not None:
-                if current.status == state:
-                    return current
-            elif current.status in _TERMINAL_STATES:
-                return current
-            remaining = deadline - loop.time()
-            if remaining <= 0:
-                raise TimeoutError(
-                    f"Task {self.task_id} did not reach "
-                    f"{state or 'a terminal state'} within {timeout}s"
-                )
-            delay, backoff = _next_poll_delay(current.poll_interval_ms, backoff)
-            # Never sleep past the deadline, so `wait` returns on time rather
-            # than up to one poll interval late.
-            await asyncio.sleep(min(delay, remaining))
+
+        def until(result: ClientGetTaskResult) -> bool:
+            if state is None:
+                return result.status in _TERMINAL_STATES
+            return result.status == state
+
+        try:
+            return await task_tracker(self._session).wait(self.task_id, until, timeout)
+        except TimeoutError as exc:
+            raise TimeoutError(
+                f"Task {self.task_id} did not reach "
+                f"{state or 'a terminal state'} within {timeout}s"
+            ) from exc
 
     async def result(self) -> FastMCPCallToolResult:
         """Drive the task to completion and return its parsed result.
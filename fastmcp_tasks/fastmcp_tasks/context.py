@@ -257,7 +257,7 @@ class TaskContextSnapshot:
         read it (#4747).
         """
         key = _snapshot_redis_key(docket, task_scope, task_id)
-        payload = snapshot_codec().encode(self.to_json())
+        payload = await snapshot_codec().encode_async(self.to_json())
         async with docket.redis() as redis:
             await redis.set(key, payload, ex=ttl_seconds)
 
@@ -362,7 +362,7 @@ async def restore_task_snapshot(key: str = TaskKey()) -> None:
                 "The task's context snapshot is missing (its TTL may have "
                 "expired), so the submitting caller cannot be recovered."
             )
-        snapshot = TaskContextSnapshot.from_json(codec.decode(raw))
+        snapshot = TaskContextSnapshot.from_json(await codec.decode_async(raw))
         _remember_snapshot(task_id, snapshot)
         # Restore the ambient request context (auth token, headers) so core's
         # get_access_token()/get_http_headers() see the submitting caller inside
@@ -8,14 +8,22 @@ distributed backend therefore keeps bearer credentials in Redis, where a
 Setting ``FASTMCP_TASKS_ENCRYPTION_KEY`` turns the stored snapshot into a
 Fernet token. The same key must reach every server and worker on the queue,
 because the process that restores a snapshot is rarely the one that captured it.
+The key also encrypts stored task results (see ``fastmcp_tasks.result_store``),
+which go through the codec's binary methods.
 """
 
 from __future__ import annotations
 
+import hashlib
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
 from functools import lru_cache
 from typing import ClassVar
 
+import anyio.to_thread
+
 from fastmcp.utilities.logging import get_logger
 from fastmcp_tasks.settings import tasks_settings
 
@@ -36,6 +44,15 @@ _SHORT_KEY_WARNING_LENGTH = 12
 # collide with a legitimately unencrypted value.
 _FERNET_PREFIX = "gAAAAA"
 
+# Encrypting or decrypting a payload at least this large moves to a worker
+# thread in the async methods. Fernet costs roughly 5ms per MB, which is long
+# enough to stall every other request on the event loop.
+THREAD_OFFLOAD_THRESHOLD = 64 * 1024
+
+# Bounds of each EncryptedCodec's cache of decrypted payloads.
+_PLAINTEXT_CACHE_ENTRIES = 128
+_PLAINTEXT_CACHE_BYTES = 64 * 1024 * 1024
+
 
 class SnapshotDecryptionError(Exception):
     """A stored snapshot is encrypted but cannot be read by this process.
@@ -65,6 +82,37 @@ class SnapshotCodec(ABC):
     def decode(self, stored: str | bytes) -> str:
         """Return the serialized snapshot a stored value holds."""
 
+    @abstractmethod
+    def encode_bytes(self, data: bytes) -> bytes:
+        """Return the stored form of a binary payload, such as a task result."""
+
+    @abstractmethod
+    def decode_bytes(self, stored: bytes) -> bytes:
+        """Return the binary payload a stored value holds."""
+
+    async def encode_async(self, payload: str) -> str:
+        """`encode`, in a worker thread when the payload is large."""
+        if self.protected and len(payload) >= THREAD_OFFLOAD_THRESHOLD:
+            return await anyio.to_thread.run_sync(self.encode, payload)
+        return self.encode(payload)
+
+    async def decode_async(self, stored: str | bytes) -> str:
+        """`decode`, in a worker thread when the value is large."""
+        return (await self.decode_many([stored]))[0]
+
+    async def decode_many(self, stored: Sequence[str | bytes]) -> list[str]:
+        """`decode` each value, with one worker-thread hop for the large ones.
+
+        Values are decoded independently; the first that fails raises.
+        """
+        if not self.protected or not any(
+            len(value) >= THREAD_OFFLOAD_THRESHOLD for value in stored
+        ):
+            return [self.decode(value) for value in stored]
+        return await anyio.to_thread.run_sync(
+            lambda: [self.decode(value) for value in stored]
+        )
+
 
 class PlaintextCodec(SnapshotCodec):
     """Stores snapshots as-is; the contract when no encryption key is set.
@@ -90,6 +138,12 @@ class PlaintextCodec(SnapshotCodec):
             )
         return text
 
+    def encode_bytes(self, data: bytes) -> bytes:
+        return data
+
+    def decode_bytes(self, stored: bytes) -> bytes:
+        return stored
+
 
 class EncryptedCodec(SnapshotCodec):
     """Encrypts snapshot payloads with a key derived from material.
@@ -98,11 +152,25 @@ class EncryptedCodec(SnapshotCodec):
     proves it is random, so it is always treated as low-entropy: the Fernet key
     comes from PBKDF2, never from HKDF. The stretch costs about a second, paid
     once per process (see ``_codec_for``).
+
+    The same stored value is often decrypted repeatedly: every ``tasks/get`` on
+    a completed task reads its result, and every leg of a re-entered task
+    restores its snapshot. Decrypted payloads are kept in a small LRU keyed by
+    the SHA-256 of the stored value, which is several times cheaper than
+    verifying and decrypting it again. A hit requires the exact bytes that were
+    authenticated before, so it cannot admit a forged value. Set
+    ``cache_entries=0`` to disable the cache.
     """
 
     protected = True
 
-    def __init__(self, material: str) -> None:
+    def __init__(
+        self,
+        material: str,
+        *,
+        cache_entries: int = _PLAINTEXT_CACHE_ENTRIES,
+        cache_bytes: int = _PLAINTEXT_CACHE_BYTES,
+    ) -> None:
         from cryptography.fernet import Fernet
 
         from fastmcp.server.auth.jwt_issuer import derive_jwt_key
@@ -122,10 +190,34 @@ class EncryptedCodec(SnapshotCodec):
         key = derive_jwt_key(low_entropy_material=material, salt=_SNAPSHOT_KEY_SALT)
 
         self._fernet = Fernet(key=key)
+        self._cache = _PlaintextCache(cache_entries, cache_bytes)
+
+    def _encrypt(self, data: bytes) -> bytes:
+        token = self._fernet.encrypt(data)
+        # The writer is often the next reader (an embedded worker's result,
+        # read back by tasks/get in the same process).
+        self._cache.put(token, data)
+        return token
+
+    def _decrypt(self, token: bytes, subject: str) -> bytes:
+        from cryptography.fernet import InvalidToken
+
+        cached = self._cache.get(token)
+        if cached is not None:
+            return cached
+        try:
+            data = self._fernet.decrypt(token)
+        except InvalidToken as e:
+            raise SnapshotDecryptionError(
+                f"The stored {subject} could not be decrypted with the "
+                "configured FASTMCP_TASKS_ENCRYPTION_KEY."
+            ) from e
+        self._cache.put(token, data)
+        return data
 
     def encode(self, payload: str) -> str:
         """Return the encrypted form of a serialized snapshot."""
-        return self._fernet.encrypt(payload.encode()).decode()
+        return self._encrypt(payload.encode()).decode()
 
     def decode(self, stored: str | bytes) -> str:
         """Return the serialized snapshot a stored value holds.
@@ -133,16 +225,67 @@ class EncryptedCodec(SnapshotCodec):
         Raises ``SnapshotDecryptionError`` if the value was not produced by this
         key, including when it is unencrypted.
         """
-        from cryptography.fernet import InvalidToken
-
         raw = stored.encode() if isinstance(stored, str) else stored
-        try:
-            return self._fernet.decrypt(raw).decode()
-        except InvalidToken as e:
-            raise SnapshotDecryptionError(
-                "The stored task snapshot could not be decrypted with the "
-                "configured FASTMCP_TASKS_ENCRYPTION_KEY."
-            ) from e
+        return self._decrypt(raw, "task snapshot").decode()
+
+    def encode_bytes(self, data: bytes) -> bytes:
+        """Return the encrypted form of a binary payload."""
+        return self._encrypt(data)
+
+    def decode_bytes(self, stored: bytes) -> bytes:
+        """Return the binary payload a stored value holds.
+
+        Raises ``SnapshotDecryptionError`` if the value was not produced by this
+        key.
+        """
+        return self._decrypt(stored, "task payload")
+
+
+class _PlaintextCache:
+    """Thread-safe LRU of decrypted payloads, bounded by count and total size.
+
+    Keys are SHA-256 digests of the stored value, so the cache holds no
+    ciphertext. Codecs are shared process-wide and the async paths decrypt in
+    worker threads, hence the lock.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[bytes, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, token: bytes) -> bytes | None:
+        if not self.max_entries:
+            return None
+        digest = hashlib.sha256(token).digest()
+        with self._lock:
+            data = self._entries.get(digest)
+            if data is not None:
+                self._entries.move_to_end(digest)
+            return data
+
+    def put(self, token: bytes, data: bytes) -> None:
+        # One payload may take at most a quarter of the budget, so a single
+        # huge result cannot flush everything else.
+        if not self.max_entries or len(data) > self.max_bytes // 4:
+            return
+        digest = hashlib.sha256(token).digest()
+        with self._lock:
+            previous = self._entries.pop(digest, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[digest] = data
+            self._size += len(data)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
 
 
 _PLAINTEXT_CODEC = PlaintextCodec()
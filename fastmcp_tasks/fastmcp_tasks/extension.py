@@ -65,6 +65,7 @@ if TYPE_CHECKING:
 
     from fastmcp.server.context import Context
     from fastmcp.server.extensions import ToolCallContinuation, ToolCallOutcome
+    from fastmcp_tasks.result_store import BlobStore
 
 logger = get_logger(__name__)
 
@@ -90,15 +91,20 @@ class TasksExtension(ServerExtension):
         name: str | None = None,
         worker_name: str | None = None,
         concurrency: int | None = None,
+        min_concurrency: int | None = None,
+        max_concurrency: int | None = None,
         redelivery_timeout: timedelta | None = None,
         reconnection_delay: timedelta | None = None,
         minimum_check_interval: timedelta | None = None,
+        result_blob_store: BlobStore | None = None,
     ) -> None:
         overrides: dict[str, Any] = {
             "url": url,
             "name": name,
             "worker_name": worker_name,
             "concurrency": concurrency,
+            "min_concurrency": min_concurrency,
+            "max_concurrency": max_concurrency,
             "redelivery_timeout": redelivery_timeout,
             "reconnection_delay": reconnection_delay,
             "minimum_check_interval": minimum_check_interval,
@@ -106,6 +112,7 @@ class TasksExtension(ServerExtension):
         self._settings = DocketSettings(
             **{k: v for k, v in overrides.items() if v is not None}
         )
+        self._result_blob_store = result_blob_store
 
     @property
     def docket_settings(self) -> DocketSettings:
@@ -286,7 +293,9 @@ class TasksExtension(ServerExtension):
 
         _install_worker_hooks()
         try:
-            async with docket_lifespan(self.server, self._settings):
+            async with docket_lifespan(
+                self.server, self._settings, self._result_blob_store
+            ):
                 yield
         finally:
             _release_worker_hooks()
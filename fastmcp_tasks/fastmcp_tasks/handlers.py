@@ -376,7 +376,7 @@ async def tasks_update(
         # A cancelled task never re-enters: clearing outstanding on cancel makes
         # translate return None already, but check explicitly so a cancel that
         # races between this update's lookup and lock acquisition still wins.
-        if await is_cancelled(docket, task_scope, task_id):
+        if await is_cancelled(docket, task_scope, task_id, authoritative=True):
             return UpdateTaskResult()
 
         matched = await translate_responses(
@@ -30,6 +30,9 @@ import asyncio
 import json
 import logging
 import secrets
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager, suppress
 from typing import TYPE_CHECKING, Any, cast
 
 import mcp_types
@@ -37,7 +40,7 @@ import mcp_types
 from fastmcp_tasks.keys import task_redis_prefix
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import AsyncIterator, Iterable
 
     from docket import Docket
 
@@ -426,6 +429,144 @@ def _cancelled_key(docket: Docket, task_scope: str | None, task_id: str) -> str:
     return docket.key(f"{_prefix(docket, task_scope, task_id)}:cancelled")
 
 
+def _cancellations_channel(docket: Docket) -> str:
+    """Pub/sub channel announcing each newly cancelled task's marker key."""
+    return docket.key("fastmcp:tasks:cancelled")
+
+
+# Bound on how many task ids a process remembers in each direction. Older
+# entries fall back to a Redis read, so this caps memory, not correctness.
+_CANCELLATION_CACHE_SIZE = 10_000
+
+# Backoff between attempts to restore a dropped cancellation subscription.
+_RESUBSCRIBE_MIN_SECONDS = 0.5
+_RESUBSCRIBE_MAX_SECONDS = 30.0
+
+
+class CancellationListener:
+    """Process-local view of task cancellations, kept current by pub/sub.
+
+    ``mark_cancelled`` publishes each marker key on a per-docket channel; the
+    listener records every key it hears, so ``is_cancelled`` answers a
+    cancelled task without a Redis round trip. While subscribed it also
+    remembers tasks a Redis read found *not* cancelled: any later cancellation
+    is pushed, so those answers stay valid until the subscription drops.
+
+    Pushes arrive asynchronously, so a cached "not cancelled" can trail a
+    cancellation made elsewhere by the channel's delivery latency. Callers that
+    must observe a cancellation serialized before them (``tasks/update`` under
+    the update lock) pass ``authoritative=True`` to ``is_cancelled``.
+    """
+
+    def __init__(self, docket: Docket, max_entries: int = _CANCELLATION_CACHE_SIZE):
+        self._docket = docket
+        self._max_entries = max_entries
+        self._cancelled: OrderedDict[str, None] = OrderedDict()
+        self._not_cancelled: OrderedDict[str, None] = OrderedDict()
+        self._subscribed = False
+        self._retry_delay = _RESUBSCRIBE_MIN_SECONDS
+        # Bumped whenever the subscription drops, so a Redis read that started
+        # before a gap in coverage isn't cached as still-valid.
+        self.generation = 0
+
+    def lookup(self, key: str, *, allow_negative: bool) -> bool | None:
+        """The cached answer for a marker key, or None if Redis must be read."""
+        if key in self._cancelled:
+            return True
+        if allow_negative and self._subscribed and key in self._not_cancelled:
+            self._not_cancelled.move_to_end(key)
+            return False
+        return None
+
+    def record(self, key: str, cancelled: bool, generation: int) -> None:
+        """Remember the result of a Redis read that started at ``generation``."""
+        if cancelled:
+            self._remember(self._cancelled, key)
+            self._not_cancelled.pop(key, None)
+        elif (
+            self._subscribed
+            and generation == self.generation
+            and key not in self._cancelled
+        ):
+            self._remember(self._not_cancelled, key)
+
+    def _remember(self, entries: OrderedDict[str, None], key: str) -> None:
+        entries[key] = None
+        entries.move_to_end(key)
+        while len(entries) > self._max_entries:
+            entries.popitem(last=False)
+
+    def _lost_subscription(self) -> None:
+        self._subscribed = False
+        self._not_cancelled.clear()
+        self.generation += 1
+
+    async def run(self) -> None:
+        """Subscribe and record pushed cancellations until cancelled.
+
+        A dropped subscription is logged and re-established with exponential
+        backoff. Until it is back, lookups fall through to Redis.
+        """
+        while True:
+            try:
+                await self._listen()
+            except Exception:
+                logger.warning(
+                    "Cancellation subscription failed; resubscribing in %.1fs",
+                    self._retry_delay,
+                    exc_info=True,
+                )
+            else:
+                logger.warning(
+                    "Cancellation subscription ended; resubscribing in %.1fs",
+                    self._retry_delay,
+                )
+            await asyncio.sleep(self._retry_delay)
+            self._retry_delay = min(self._retry_delay * 2, _RESUBSCRIBE_MAX_SECONDS)
+
+    async def _listen(self) -> None:
+        try:
+            async with self._docket.redis() as redis:
+                pubsub = redis.pubsub()
+                try:
+                    await pubsub.subscribe(_cancellations_channel(self._docket))
+                    async for message in pubsub.listen():
+                        if message["type"] == "subscribe":
+                            # Only now is every later publish guaranteed to
+                            # reach us, so cached negatives become trustworthy.
+                            self._subscribed = True
+                            self._retry_delay = _RESUBSCRIBE_MIN_SECONDS
+                        elif message["type"] == "message":
+                            key = _decode(message["data"])
+                            if key is not None:
+                                self.record(key, True, self.generation)
+                finally:
+                    await pubsub.aclose()
+        finally:
+            self._lost_subscription()
+
+
+_listeners: weakref.WeakKeyDictionary[Docket, CancellationListener] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@asynccontextmanager
+async def listen_for_cancellations(docket: Docket) -> AsyncIterator[None]:
+    """Run a ``CancellationListener`` for ``docket`` while the context is open."""
+    listener = CancellationListener(docket)
+    _listeners[docket] = listener
+    task = asyncio.create_task(listener.run())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        if _listeners.get(docket) is listener:
+            del _listeners[docket]
+
+
 async def mark_cancelled(
     docket: Docket, task_scope: str | None, task_id: str, ttl_seconds: int
 ) -> None:
@@ -436,17 +577,45 @@ async def mark_cancelled(
     ``docket.cancel`` on that execution is a no-op. This durable marker lets
     ``tasks/get`` report ``cancelled`` and ``tasks/update`` refuse to resume,
     regardless of the underlying execution state. Expires with the task's TTL.
+
+    The marker key is also published so other processes' listeners learn of
+    the cancellation without polling.
     """
+    key = _cancelled_key(docket, task_scope, task_id)
     async with docket.redis() as redis:
-        await redis.set(
-            _cancelled_key(docket, task_scope, task_id), b"1", ex=max(1, ttl_seconds)
-        )
+        await redis.set(key, b"1", ex=max(1, ttl_seconds))
+        await redis.publish(_cancellations_channel(docket), key)
+    if (listener := _listeners.get(docket)) is not None:
+        listener.record(key, True, listener.generation)
+
+
+async def is_cancelled(
+    docket: Docket,
+    task_scope: str | None,
+    task_id: str,
+    *,
+    authoritative: bool = False,
+) -> bool:
+    """Whether the task was logically cancelled (see ``mark_cancelled``).
 
+    Answered from the process's ``CancellationListener`` when it can be. Pass
+    ``authoritative=True`` to always confirm a "not cancelled" against Redis,
+    for callers that must see a cancellation serialized before them.
+    """
+    key = _cancelled_key(docket, task_scope, task_id)
+    listener = _listeners.get(docket)
+    generation = 0
+    if listener is not None:
+        cached = listener.lookup(key, allow_negative=not authoritative)
+        if cached is not None:
+            return cached
+        generation = listener.generation
 
-async def is_cancelled(docket: Docket, task_scope: str | None, task_id: str) -> bool:
-    """Whether the task was logically cancelled (see ``mark_cancelled``)."""
     async with docket.redis() as redis:
-        return bool(await redis.exists(_cancelled_key(docket, task_scope, task_id)))
+        cancelled = bool(await redis.exists(key))
+    if listener is not None:
+        listener.record(key, cancelled, generation)
+    return cancelled
 
 
 # How long the per-task update lock lives if its holder dies mid-update. A
@@ -459,6 +628,13 @@ def _update_lock_key(docket: Docket, task_scope: str | None, task_id: str) -> st
     return docket.key(f"{_prefix(docket, task_scope, task_id)}:update_lock")
 
 
+def _update_lock_released_key(
+    docket: Docket, task_scope: str | None, task_id: str
+) -> str:
+    """Redis list holding at most one token, pushed each time the lock is freed."""
+    return docket.key(f"{_prefix(docket, task_scope, task_id)}:update_lock:released")
+
+
 async def acquire_update_lock(
     docket: Docket, task_scope: str | None, task_id: str
 ) -> bool:
@@ -485,7 +661,6 @@ async def acquire_update_lock_blocking(
     task_id: str,
     *,
     timeout: float = 5.0,
-    poll: float = 0.02,
 ) -> bool:
     """Wait for the per-task update lock, up to ``timeout`` seconds.
 
@@ -494,23 +669,40 @@ async def acquire_update_lock_blocking(
     next one. A single update is fast (milliseconds), so contention is brief;
     returns False if the lock is still held at the deadline (a wedged holder),
     letting the caller proceed best-effort rather than hang.
+
+    Rather than polling, a waiter blocks in ``BLPOP`` on the lock's release
+    list and retries only when ``release_update_lock`` pushes a token. Each
+    token wakes one waiter; one that loses the retry to a newcomer blocks
+    again until that holder releases. A token left behind when nobody was
+    waiting costs the next waiter one extra retry.
     """
-    loop = asyncio.get_event_loop()
+    lock_key = _update_lock_key(docket, task_scope, task_id)
+    released_key = _update_lock_released_key(docket, task_scope, task_id)
+    loop = asyncio.get_running_loop()
     deadline = loop.time() + timeout
-    while True:
-        if await acquire_update_lock(docket, task_scope, task_id):
-            return True
-        if loop.time() >= deadline:
-            return False
-        await asyncio.sleep(poll)
+    async with docket.redis() as redis:
+        while True:
+            if await redis.set(lock_key, b"1", nx=True, ex=_UPDATE_LOCK_TTL_SECONDS):
+                return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            await redis.blpop([released_key], timeout=remaining)
 
 
 async def release_update_lock(
     docket: Docket, task_scope: str | None, task_id: str
 ) -> None:
-    """Release the per-task update lock."""
+    """Release the per-task update lock and wake one waiter."""
+    released_key = _update_lock_released_key(docket, task_scope, task_id)
     async with docket.redis() as redis:
-        await redis.delete(_update_lock_key(docket, task_scope, task_id))
+        # One MULTI/EXEC round trip (pipelines are transactional by default).
+        async with redis.pipeline() as pipeline:
+            # Replace rather than append, so unconsumed tokens never pile up.
+            pipeline.delete(_update_lock_key(docket, task_scope, task_id), released_key)
+            pipeline.rpush(released_key, b"1")  # ty: ignore[unresolved-attribute]
+            pipeline.expire(released_key, _UPDATE_LOCK_TTL_SECONDS)
+            await pipeline.execute()
 
 
 async def load_pending_input(
@@ -6,7 +6,8 @@ this once per runtime tree at the root and defers on mounted children, and
 ``SharedContext`` plus the server ContextVar are established before extension
 lifespans run — so this no longer manages either. It starts Docket and a Worker
 when there are task-enabled components, registers those components' callables,
-and runs the worker (with the snapshot-restore dependency) until shutdown.
+and runs the worker (with the snapshot-restore dependency) until shutdown,
+alongside an adaptive concurrency controller when ``max_concurrency`` is set.
 """
 
 from __future__ import annotations
@@ -20,6 +21,7 @@ from fastmcp.utilities.logging import get_logger
 
 if TYPE_CHECKING:
     from fastmcp.server.server import FastMCP
+    from fastmcp_tasks.result_store import BlobStore
     from fastmcp_tasks.settings import DocketSettings
 
 logger = get_logger(__name__)
@@ -27,18 +29,23 @@ logger = get_logger(__name__)
 
 @asynccontextmanager
 async def docket_lifespan(
-    server: FastMCP, settings: DocketSettings
+    server: FastMCP,
+    settings: DocketSettings,
+    result_blob_store: BlobStore | None = None,
 ) -> AsyncIterator[None]:
     """Manage the Docket instance and Worker for background task execution.
 
     Sets ``server._docket`` / ``server._worker`` for the duration and registers
     each task-enabled component's callable, then runs the worker until the
-    context exits. A no-op if pydocket is unavailable or the server declares no
-    task-enabled components.
+    context exits. Docket's result storage is wrapped in a ``TaskResultStore``
+    that offloads large results to ``result_blob_store`` (or a file store in
+    ``FASTMCP_TASKS_RESULT_BLOB_DIR``). A no-op if pydocket is unavailable or
+    the server declares no task-enabled components.
     """
     from docket import Depends, Docket, Worker
 
     import fastmcp
+    from fastmcp_tasks.autoscale import ConcurrencyController, DocketQueueDepth
     from fastmcp_tasks.components import register_component_with_docket
     from fastmcp_tasks.context import restore_task_snapshot
     from fastmcp_tasks.dependencies import (
@@ -46,6 +53,9 @@ async def docket_lifespan(
         _current_worker,
         is_docket_available,
     )
+    from fastmcp_tasks.input_store import listen_for_cancellations
+    from fastmcp_tasks.result_store import FileBlobStore, TaskResultStore
+    from fastmcp_tasks.settings import tasks_settings
 
     if not is_docket_available():
         yield
@@ -66,8 +76,19 @@ async def docket_lifespan(
         yield
         return
 
-    async with Docket(name=settings.name, url=settings.url) as docket:
+    async with (
+        Docket(name=settings.name, url=settings.url) as docket,
+        listen_for_cancellations(docket),
+    ):
         server._docket = docket
+        if result_blob_store is None and tasks_settings.result_blob_dir is not None:
+            result_blob_store = FileBlobStore(tasks_settings.result_blob_dir)
+        docket.result_storage = TaskResultStore(
+            docket.result_storage,
+            compression_threshold=tasks_settings.result_compression_threshold,
+            offload_threshold=tasks_settings.result_offload_threshold,
+            blob_store=result_blob_store,
+        )
         for component in task_components:
             register_component_with_docket(component, docket)
 
@@ -90,16 +111,28 @@ async def docket_lifespan(
                 server._worker = worker
                 worker_token = _current_worker.set(worker)
                 try:
-                    worker_task = asyncio.create_task(worker.run_forever())
+                    worker_tasks = [asyncio.create_task(worker.run_forever())]
+                    if settings.max_concurrency is not None:
+                        controller = ConcurrencyController(
+                            worker,
+                            DocketQueueDepth(docket),
+                            min_concurrency=settings.min_concurrency,
+                            max_concurrency=settings.max_concurrency,
+                            target_latency=settings.autoscale_target_latency,
+                            interval=settings.autoscale_interval,
+                        )
+                        worker_tasks.append(asyncio.create_task(controller.run()))
                     try:
                         yield
                     finally:
                         # End-and-reenter never parks a worker on input, so a
                         # task waiting for input holds no worker slot: cancelling
                         # run_forever drains promptly regardless of task state.
-                        worker_task.cancel()
-                        with suppress(asyncio.CancelledError):
-                            await worker_task
+                        for task in worker_tasks:
+                            task.cancel()
+                        for task in worker_tasks:
+                            with suppress(asyncio.CancelledError):
+                                await task
                 finally:
                     _current_worker.reset(worker_token)
                     server._worker = None
@@ -0,0 +1,385 @@
+"""Storage policy for task results.
+
+Docket pickles a finished task's return value and writes it to its result
+storage, a key-value store in the Docket backend, as ``{"data": <base64>}``.
+``tasks/get`` reads the whole value back on every poll of a completed task, so a
+tool returning tens of megabytes keeps that much in Redis for the task's TTL and
+moves it on every read.
+
+``TaskResultStore`` wraps that storage. Results of at least
+``compression_threshold`` bytes are compressed with zlib; with
+``FASTMCP_TASKS_ENCRYPTION_KEY`` set, every result is encrypted; and a stored
+form of at least ``offload_threshold`` bytes goes to a ``BlobStore`` with only a
+reference left in the backend. Values it did not write (small plaintext results,
+or results written before the policy existed) pass through unchanged.
+"""
+
+from __future__ import annotations
+
+import base64
+import functools
+import os
+import re
+import time
+import uuid
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, SupportsFloat
+
+import anyio.to_thread
+from key_value.aio.protocols.key_value import AsyncKeyValue
+from key_value.aio.wrappers.base import BaseWrapper
+
+from fastmcp_tasks.encryption import (
+    THREAD_OFFLOAD_THRESHOLD,
+    SnapshotCodec,
+    SnapshotDecryptionError,
+    snapshot_codec,
+)
+
+# Marks a value this policy wrote; its value is the format version.
+_ENVELOPE_KEY = "__fastmcp_result__"
+_ENVELOPE_VERSION = 1
+
+_ZLIB = "zlib"
+_FERNET = "fernet"
+
+# Large results are compressed on every task completion, so favor speed: level
+# 1 already shrinks typical JSON-heavy results severalfold.
+_COMPRESSION_LEVEL = 1
+
+
+class TaskResultUnavailableError(Exception):
+    """A stored result refers to a blob that no longer exists.
+
+    Raised when the blob store lost the payload (expired early, deleted, or a
+    process configured with a different blob directory). Reporting the task
+    as completed with no result would be wrong, so the read fails instead.
+    """
+
+
+class BlobStore(ABC):
+    """Holds task results too large to keep in the Docket backend."""
+
+    @abstractmethod
+    async def put(self, data: bytes, *, ttl: float | None = None) -> str:
+        """Store `data` and return a reference to it."""
+
+    @abstractmethod
+    async def get(self, ref: str) -> bytes | None:
+        """Return the data stored under `ref`, or None if it is gone."""
+
+    @abstractmethod
+    async def delete(self, ref: str) -> None:
+        """Remove the data stored under `ref`, if any."""
+
+
+_FILE_REF = re.compile(r"^(\d+)-[0-9a-f]{32}$")
+
+# Expired blobs are removed on a later write, at most this often.
+_SWEEP_INTERVAL_SECONDS = 60.0
+
+
+class FileBlobStore(BlobStore):
+    """Stores blobs as files in one directory.
+
+    A reference is ``<expiry>-<uuid>`` and names the file directly, so expired
+    blobs can be found and removed without opening them. Files are written to a
+    temporary name and renamed into place, so a reader never sees a partial
+    blob. Every process sharing a task queue must point at the same directory.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self._last_sweep = 0.0
+
+    def _path(self, ref: str) -> Path:
+        # The reference comes back from the Docket backend; never let it name
+        # anything outside the directory.
+        if not _FILE_REF.match(ref):
+            raise ValueError(f"Invalid blob reference: {ref!r}")
+        return self.directory / ref
+
+    async def put(self, data: bytes, *, ttl: float | None = None) -> str:
+        expires = int(time.time() + ttl) if ttl is not None else 0
+        ref = f"{expires}-{uuid.uuid4().hex}"
+        await anyio.to_thread.run_sync(self._write, self._path(ref), data)
+        if time.monotonic() - self._last_sweep >= _SWEEP_INTERVAL_SECONDS:
+            self._last_sweep = time.monotonic()
+            await anyio.to_thread.run_sync(self.sweep)
+        return ref
+
+    def _write(self, path: Path, data: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(".partial")
+        partial.write_bytes(data)
+        os.replace(partial, path)
+
+    async def get(self, ref: str) -> bytes | None:
+        path = self._path(ref)
+        if _expired(ref, time.time()):
+            await self.delete(ref)
+            return None
+        try:
+            return await anyio.to_thread.run_sync(path.read_bytes)
+        except FileNotFoundError:
+            return None
+
+    async def delete(self, ref: str) -> None:
+        await anyio.to_thread.run_sync(
+            functools.partial(self._path(ref).unlink, missing_ok=True)
+        )
+
+    def sweep(self) -> int:
+        """Delete expired blobs and return how many were removed."""
+        now = time.time()
+        removed = 0
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return 0
+        for entry in entries:
+            if _FILE_REF.match(entry.name) and _expired(entry.name, now):
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    continue
+                removed += 1
+        return removed
+
+
+def _expired(ref: str, now: float) -> bool:
+    expires = int(ref.split("-", 1)[0])
+    return expires != 0 and expires <= now
+
+
+class TaskResultStore(BaseWrapper):
+    """Compresses, encrypts, and offloads task results around Docket's storage.
+
+    A value the policy transforms is stored as an envelope::
+
+        {"__fastmcp_result__": 1, "encoding": ["zlib", "fernet"], "data": "..."}
+
+    with ``"blob": <ref>`` in place of ``"data"`` once offloaded. ``encoding``
+    lists the steps applied, in order, to the pickled result.
+    """
+
+    def __init__(
+        self,
+        key_value: AsyncKeyValue,
+        *,
+        compression_threshold: int = 64 * 1024,
+        offload_threshold: int = 1024 * 1024,
+        blob_store: BlobStore | None = None,
+        codec: SnapshotCodec | None = None,
+    ) -> None:
+        self.key_value = key_value
+        self.compression_threshold = compression_threshold
+        self.offload_threshold = offload_threshold
+        self.blob_store = blob_store
+        self._codec = codec
+        super().__init__()
+
+    @property
+    def codec(self) -> SnapshotCodec:
+        """The explicit codec, or the one for the currently configured key."""
+        return self._codec if self._codec is not None else snapshot_codec()
+
+    def _pack(self, data: str, codec: SnapshotCodec) -> tuple[list[str], bytes]:
+        """Compress and encrypt a result; the steps applied and the payload."""
+        payload = base64.b64decode(data)
+        encoding: list[str] = []
+        if len(payload) >= self.compression_threshold:
+            compressed = zlib.compress(payload, _COMPRESSION_LEVEL)
+            if len(compressed) < len(payload):
+                payload = compressed
+                encoding.append(_ZLIB)
+        if codec.protected:
+            payload = codec.encode_bytes(payload)
+            encoding.append(_FERNET)
+        return encoding, payload
+
+    @staticmethod
+    def _unpack(
+        encoding: list[str], payload: bytes, codec: SnapshotCodec
+    ) -> dict[str, Any]:
+        """Undo `_pack`, returning the value Docket wrote."""
+        for step in reversed(encoding):
+            if step == _FERNET:
+                if not codec.protected:
+                    raise SnapshotDecryptionError(
+                        "A stored task result is encrypted, but this process has "
+                        "no FASTMCP_TASKS_ENCRYPTION_KEY configured."
+                    )
+                payload = codec.decode_bytes(payload)
+            elif step == _ZLIB:
+                payload = zlib.decompress(payload)
+            else:
+                raise ValueError(f"Unknown task result encoding {step!r}")
+        return {"data": base64.b64encode(payload).decode("ascii")}
+
+    async def _encode(
+        self, value: Mapping[str, Any], ttl: SupportsFloat | None
+    ) -> Mapping[str, Any]:
+        data = value.get("data")
+        if _ENVELOPE_KEY in value or not isinstance(data, str):
+            return value
+
+        codec = self.codec
+        if len(data) >= THREAD_OFFLOAD_THRESHOLD:
+            encoding, payload = await anyio.to_thread.run_sync(self._pack, data, codec)
+        else:
+            encoding, payload = self._pack(data, codec)
+        if not encoding:
+            return value
+
+        envelope: dict[str, Any] = {
+            _ENVELOPE_KEY: _ENVELOPE_VERSION,
+            "encoding": encoding,
+        }
+        if self.blob_store is not None and len(payload) >= self.offload_threshold:
+            envelope["blob"] = await self.blob_store.put(
+                payload, ttl=float(ttl) if ttl is not None else None
+            )
+        elif encoding[-1] == _FERNET:
+            # A Fernet token is already URL-safe base64 text.
+            envelope["data"] = payload.decode("ascii")
+        else:
+            envelope["data"] = base64.b64encode(payload).decode("ascii")
+        return envelope
+
+    async def _load(self, envelope: dict[str, Any]) -> bytes:
+        """The packed payload an envelope holds or refers to."""
+        if "blob" in envelope:
+            if self.blob_store is None:
+                raise TaskResultUnavailableError(
+                    "This task's result was offloaded to a blob store, but this "
+                    "process has none configured."
+                )
+            payload = await self.blob_store.get(envelope["blob"])
+            if payload is None:
+                raise TaskResultUnavailableError(
+                    f"This task's result blob {envelope['blob']!r} is missing."
+                )
+            return payload
+        if envelope["encoding"][-1] == _FERNET:
+            return envelope["data"].encode("ascii")
+        return base64.b64decode(envelope["data"])
+
+    async def _decode_many(
+        self, values: Sequence[dict[str, Any] | None]
+    ) -> list[dict[str, Any] | None]:
+        """Decode a batch of stored values with at most one worker-thread hop."""
+        packed = {
+            i: (value["encoding"], await self._load(value))
+            for i, value in enumerate(values)
+            if value is not None and _ENVELOPE_KEY in value
+        }
+        if not packed:
+            return list(values)
+
+        codec = self.codec
+
+        def unpack_all() -> dict[int, dict[str, Any]]:
+            return {
+                i: self._unpack(encoding, payload, codec)
+                for i, (encoding, payload) in packed.items()
+            }
+
+        if sum(len(payload) for _, payload in packed.values()) >= (
+            THREAD_OFFLOAD_THRESHOLD
+        ):
+            unpacked = await anyio.to_thread.run_sync(unpack_all)
+        else:
+            unpacked = unpack_all()
+        return [unpacked.get(i, value) for i, value in enumerate(values)]
+
+    async def _decode(self, value: dict[str, Any] | None) -> dict[str, Any] | None:
+        return (await self._decode_many([value]))[0]
+
+    async def get(
+        self, key: str, *, collection: str | None = None
+    ) -> dict[str, Any] | None:
+        return await self._decode(
+            await self.key_value.get(key=key, collection=collection)
+        )
+
+    async def get_many(
+        self, keys: Sequence[str], *, collection: str | None = None
+    ) -> list[dict[str, Any] | None]:
+        """Read and decode several results with at most one worker-thread hop.
+
+        Docket itself reads results one at a time through `get`, so this only
+        helps callers that read results in bulk, not `tasks/get`.
+        """
+        values = await self.key_value.get_many(keys=keys, collection=collection)
+        return await self._decode_many(values)
+
+    async def ttl(
+        self, key: str, *, collection: str | None = None
+    ) -> tuple[dict[str, Any] | None, float | None]:
+        value, ttl = await self.key_value.ttl(key=key, collection=collection)
+        return await self._decode(value), ttl
+
+    async def ttl_many(
+        self, keys: Sequence[str], *, collection: str | None = None
+    ) -> list[tuple[dict[str, Any] | None, float | None]]:
+        results = await self.key_value.ttl_many(keys=keys, collection=collection)
+        values = await self._decode_many([value for value, _ in results])
+        return [(value, ttl) for value, (_, ttl) in zip(values, results)]
+
+    async def put(
+        self,
+        key: str,
+        value: Mapping[str, Any],
+        *,
+        collection: str | None = None,
+        ttl: SupportsFloat | None = None,
+    ) -> None:
+        await self.key_value.put(
+            key=key,
+            value=await self._encode(value, ttl),
+            collection=collection,
+            ttl=ttl,
+        )
+
+    async def put_many(
+        self,
+        keys: Sequence[str],
+        values: Sequence[Mapping[str, Any]],
+        *,
+        collection: str | None = None,
+        ttl: SupportsFloat | None = None,
+    ) -> None:
+        await self.key_value.put_many(
+            keys=keys,
+            values=[await self._encode(value, ttl) for value in values],
+            collection=collection,
+            ttl=ttl,
+        )
+
+    async def delete(self, key: str, *, collection: str | None = None) -> bool:
+        await self._delete_blobs([key], collection)
+        return await self.key_value.delete(key=key, collection=collection)
+
+    async def delete_many(
+        self, keys: Sequence[str], *, collection: str | None = None
+    ) -> int:
+        await self._delete_blobs(keys, collection)
+        return await self.key_value.delete_many(keys=keys, collection=collection)
+
+    async def _delete_blobs(self, keys: Sequence[str], collection: str | None) -> None:
+        """Delete the blobs the stored values under ``keys`` refer to.
+
+        Whether a value was offloaded is only known by reading it, so with a
+        blob store configured every delete costs one extra backend read (one
+        batched read for ``delete_many``), even for results kept inline.
+        """
+        if self.blob_store is None:
+            return
+        values = await self.key_value.get_many(keys=keys, collection=collection)
+        for value in values:
+            if value is not None and "blob" in value and _ENVELOPE_KEY in value:
+                await self.blob_store.delete(value["blob"])
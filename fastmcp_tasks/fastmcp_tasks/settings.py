@@ -11,6 +11,7 @@ from __future__ import annotations
 import inspect
 import os
 from datetime import timedelta
+from pathlib import Path
 from typing import Annotated
 
 from pydantic import Field, SecretStr
@@ -85,6 +86,59 @@ class DocketSettings(BaseSettings):
         ),
     ] = 10
 
+    min_concurrency: Annotated[
+        int,
+        Field(
+            description=inspect.cleandoc(
+                """
+                Lower bound for adaptive concurrency. Only used when
+                max_concurrency is set.
+                """
+            ),
+            ge=1,
+        ),
+    ] = 1
+
+    max_concurrency: Annotated[
+        int | None,
+        Field(
+            description=inspect.cleandoc(
+                """
+                Upper bound for adaptive concurrency. When set, the worker starts
+                at `concurrency` and adjusts it between min_concurrency and this
+                bound: it grows while due tasks wait in the queue longer than
+                autoscale_target_latency and shrinks while the queue is empty.
+                If unset (the default), concurrency is fixed.
+                """
+            ),
+            ge=1,
+        ),
+    ] = None
+
+    autoscale_interval: Annotated[
+        timedelta,
+        Field(
+            description=inspect.cleandoc(
+                """
+                How often the adaptive concurrency controller samples the
+                queue depth.
+                """
+            ),
+        ),
+    ] = timedelta(seconds=1)
+
+    autoscale_target_latency: Annotated[
+        timedelta,
+        Field(
+            description=inspect.cleandoc(
+                """
+                How long a due task may wait in the queue before the adaptive
+                concurrency controller adds capacity.
+                """
+            ),
+        ),
+    ] = timedelta(seconds=1)
+
     redelivery_timeout: Annotated[
         timedelta,
         Field(
@@ -149,7 +203,8 @@ class TasksSettings(BaseSettings):
                 Every server and worker sharing a task queue must set the same
                 key; a worker that cannot decrypt a snapshot fails the task
                 rather than running it as an anonymous caller. When unset, the
-                snapshot is stored as plaintext JSON. The Fernet key is derived
+                snapshot is stored as plaintext JSON. The key also encrypts
+                stored task results. The Fernet key is derived
                 from this value with PBKDF2, so any non-empty string works, but
                 use at least 32 random characters.
                 """
@@ -157,6 +212,49 @@ class TasksSettings(BaseSettings):
         ),
     ] = None
 
+    result_compression_threshold: Annotated[
+        int,
+        Field(
+            description=inspect.cleandoc(
+                """
+                Task results whose serialized form is at least this many bytes
+                are compressed with zlib before they are stored.
+                """
+            ),
+            ge=0,
+        ),
+    ] = 64 * 1024
+
+    result_offload_threshold: Annotated[
+        int,
+        Field(
+            description=inspect.cleandoc(
+                """
+                Stored task results (after compression and encryption) of at
+                least this many bytes are written to the blob store, and the
+                Docket backend keeps only a reference. Has no effect unless a
+                blob store is configured (result_blob_dir, or
+                TasksExtension(result_blob_store=...)).
+                """
+            ),
+            ge=0,
+        ),
+    ] = 1024 * 1024
+
+    result_blob_dir: Annotated[
+        Path | None,
+        Field(
+            description=inspect.cleandoc(
+                """
+                Directory for offloaded task results. Every server and worker
+                sharing a task queue must see the same directory (a shared
+                volume when they run on different hosts), because the process
+                that reads a result is rarely the one that wrote it.
+                """
+            ),
+        ),
+    ] = None
+
 
 tasks_settings = TasksSettings()
 
@@ -185,8 +283,8 @@ class TasksClientSettings(BaseSettings):
                 advertise its own pollIntervalMs: in that case the client starts
                 polling fast (~20ms) and doubles up to this ceiling, so quick tasks
                 resolve promptly while long-running tasks don't hammer the server.
-                When the server advertises a pollIntervalMs, that interval is honored
-                exactly and this setting is ignored. Must be positive.
+                When the server advertises a pollIntervalMs, it is the ceiling
+                instead and this setting is ignored. Must be positive.
                 """
             ),
             gt=0,
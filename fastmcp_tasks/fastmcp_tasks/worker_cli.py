@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import signal
+import subprocess
 import sys
 from typing import TYPE_CHECKING, Annotated
 
@@ -51,6 +53,60 @@ def resolve_docket_settings(server: FastMCP) -> DocketSettings:
     return extension.docket_settings
 
 
+def override_worker_settings(
+    server: FastMCP, **overrides: int | None
+) -> DocketSettings:
+    """Apply the CLI's worker options to `server`'s tasks extension.
+
+    Options left as None keep the extension's configured value. Returns the
+    settings the worker will start with.
+    """
+    settings = resolve_docket_settings(server)
+    updates = {k: v for k, v in overrides.items() if v is not None}
+    if updates:
+        from fastmcp_tasks.extension import TasksExtension
+
+        extension = server._extensions[TASKS_EXTENSION_ID]
+        assert isinstance(extension, TasksExtension)
+        settings = settings.model_copy(update=updates)
+        extension._settings = settings
+    return settings
+
+
+def worker_process_command(
+    server_spec: str | None,
+    min_concurrency: int | None = None,
+    max_concurrency: int | None = None,
+) -> list[str]:
+    """The command line that starts one more worker process with the same options."""
+    command = [sys.executable, "-m", "fastmcp_tasks.worker_cli", "worker"]
+    if server_spec is not None:
+        command.append(server_spec)
+    if min_concurrency is not None:
+        command += ["--min-concurrency", str(min_concurrency)]
+    if max_concurrency is not None:
+        command += ["--max-concurrency", str(max_concurrency)]
+    return command
+
+
+def stop_worker_processes(processes: list[subprocess.Popen[bytes]]) -> None:
+    """Ask additional worker processes to shut down, killing any that hang."""
+    for process in processes:
+        if process.poll() is None:
+            # SIGINT lets the child exit its lifespan cleanly; Windows has no
+            # way to deliver it to a single process, so terminate there.
+            if sys.platform == "win32":
+                process.terminate()
+            else:
+                process.send_signal(signal.SIGINT)
+    for process in processes:
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
 def check_distributed_backend(settings: DocketSettings) -> None:
     """Check if Docket is configured with a distributed backend.
 
@@ -93,6 +149,25 @@ def worker(
             help="Python file to run, optionally with :object suffix, or None to auto-detect fastmcp.json"
         ),
     ] = None,
+    *,
+    min_concurrency: Annotated[
+        int | None,
+        cyclopts.Parameter(
+            help="Lower bound for adaptive concurrency (overrides FASTMCP_DOCKET_MIN_CONCURRENCY)"
+        ),
+    ] = None,
+    max_concurrency: Annotated[
+        int | None,
+        cyclopts.Parameter(
+            help="Upper bound for adaptive concurrency; enables autoscaling (overrides FASTMCP_DOCKET_MAX_CONCURRENCY)"
+        ),
+    ] = None,
+    processes: Annotated[
+        int,
+        cyclopts.Parameter(
+            help="Number of worker processes to run; each one autoscales independently"
+        ),
+    ] = 1,
 ) -> None:
     """Start an additional worker to process background tasks.
 
@@ -100,9 +175,15 @@ def worker(
     any other running workers. Configure via environment variables
     (FASTMCP_DOCKET_*).
 
+    With --max-concurrency, the worker samples the queue and adjusts its
+    concurrency between --min-concurrency and --max-concurrency. With
+    --processes N, N-1 more worker processes are started with the same
+    options and stopped when this one exits.
+
     Example:
         fastmcp tasks worker server.py
         fastmcp tasks worker examples/tasks/server.py
+        fastmcp tasks worker server.py --max-concurrency 50 --processes 4
     """
     # Load server to get task functions
     try:
@@ -116,7 +197,9 @@ def worker(
     # Validate against the server's actual registered extension, not an
     # env-only guess — a constructor-configured Redis URL isn't visible
     # until the server (and its extension) has loaded.
-    settings = resolve_docket_settings(server)
+    settings = override_worker_settings(
+        server, min_concurrency=min_concurrency, max_concurrency=max_concurrency
+    )
     check_distributed_backend(settings)
 
     async def run_worker():
@@ -127,17 +210,29 @@ def worker(
             )
             console.print(f"  Docket: {settings.name}")
             console.print(f"  Backend: {settings.url}")
-            console.print(f"  Concurrency: {settings.concurrency}")
+            if settings.max_concurrency is None:
+                console.print(f"  Concurrency: {settings.concurrency}")
+            else:
+                console.print(
+                    f"  Concurrency: {settings.concurrency} "
+                    f"(adaptive, {settings.min_concurrency}-{settings.max_concurrency})"
+                )
+            if processes > 1:
+                console.print(f"  Processes: {processes}")
 
             # Server's lifespan has started its worker - just camp here forever
             while True:
                 await asyncio.sleep(3600)
 
+    command = worker_process_command(server_spec, min_concurrency, max_concurrency)
+    children = [subprocess.Popen(command) for _ in range(processes - 1)]
     try:
         asyncio.run(run_worker())
     except KeyboardInterrupt:
         console.print("\n[yellow]Worker stopped[/yellow]")
         sys.exit(0)
+    finally:
+        stop_worker_processes(children)
 
 
 if __name__ == "__main__":
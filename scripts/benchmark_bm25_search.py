@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+"""Benchmark BM25 tool search latency against catalog size.
+
+Builds synthetic tool catalogs of increasing size and times queries whose
+terms match a fixed number of tools, plus a broad query whose matches grow
+with the catalog. With an inverted index, the fixed-match query should stay
+flat as the catalog grows while the broad query scales with its postings.
+The summary line compares the fixed-match latency at the largest and smallest
+sizes; a full scan would grow with the size ratio.
+
+Usage:
+    uv run python scripts/benchmark_bm25_search.py
+    uv run python scripts/benchmark_bm25_search.py --sizes 1000 10000 50000
+    uv run python scripts/benchmark_bm25_search.py --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+from collections.abc import Sequence
+from typing import TypedDict
+
+from fastmcp.server.transforms.search.bm25 import _BM25Index
+
+_VERBS = ["get", "list", "create", "update", "delete", "search", "sync", "export"]
+_NOUNS = [
+    "user",
+    "order",
+    "invoice",
+    "ticket",
+    "project",
+    "report",
+    "file",
+    "message",
+    "customer",
+    "payment",
+]
+# Appears in exactly this many tools regardless of catalog size.
+_RARE_MATCHES = 10
+
+
+class Result(TypedDict):
+    catalog_size: int
+    build_ms: float
+    rare_query_us: float
+    broad_query_us: float
+    broad_matches: int
+
+
+def make_catalog(size: int, seed: int = 0) -> list[str]:
+    """Return searchable text for `size` synthetic tools."""
+    rng = random.Random(seed)
+    documents = []
+    for i in range(size):
+        verb, noun = rng.choice(_VERBS), rng.choice(_NOUNS)
+        words = [f"{verb}_{noun}_{i}", verb, noun, f"service{i % 97}", f"field{i}"]
+        if i % (size // _RARE_MATCHES) == 0:
+            words.append("quarantine")
+        documents.append(" ".join(words))
+    return documents
+
+
+def time_query(index: _BM25Index, query: str, repeat: int) -> float:
+    """Return the median latency of `query` in microseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        index.query(query, 5)
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples)
+
+
+def run(sizes: Sequence[int], repeat: int) -> list[Result]:
+    results: list[Result] = []
+    for size in sizes:
+        documents = make_catalog(size)
+        started = time.perf_counter()
+        index = _BM25Index()
+        index.build(documents)
+        build_ms = (time.perf_counter() - started) * 1e3
+        results.append(
+            Result(
+                catalog_size=size,
+                build_ms=build_ms,
+                rare_query_us=time_query(index, "quarantine", repeat),
+                broad_query_us=time_query(index, "invoice", repeat),
+                broad_matches=sum("invoice" in doc for doc in documents),
+            )
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1_000, 10_000], metavar="N"
+    )
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="print raw JSON")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"{'tools':>8} {'build ms':>10} {'rare query us':>14} "
+        f"{'broad query us':>15} {'broad matches':>14}"
+    )
+    for r in results:
+        print(
+            f"{r['catalog_size']:>8} {r['build_ms']:>10.1f} "
+            f"{r['rare_query_us']:>14.1f} {r['broad_query_us']:>15.1f} "
+            f"{r['broad_matches']:>14}"
+        )
+    if len(results) > 1:
+        smallest, largest = results[0], results[-1]
+        growth = largest["rare_query_us"] / smallest["rare_query_us"]
+        size_ratio = largest["catalog_size"] / smallest["catalog_size"]
+        print(
+            f"\nrare query: {growth:.1f}x slower at {size_ratio:.0f}x the catalog size"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""Benchmark DirectoryResource reads on a large file tree.
+
+Builds a temporary tree of N files spread across subdirectories and times a
+recursive `DirectoryResource.read()` three ways: "glob" is the previous
+implementation (`AsyncPath.rglob` plus an async `is_file()` per hit), "cold"
+is the first read of a fresh resource (one `os.scandir` walk in a worker
+thread), and "warm" is a repeat read that only stats the directories.
+
+Usage:
+    uv run python scripts/benchmark_directory_resource.py
+    uv run python scripts/benchmark_directory_resource.py --files 10000 50000
+    uv run python scripts/benchmark_directory_resource.py --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+from typing import TypedDict
+
+from anyio import Path as AsyncPath
+
+from fastmcp.resources import DirectoryResource
+
+_FILES_PER_DIR = 100
+
+
+class Result(TypedDict):
+    files: int
+    directories: int
+    glob_ms: float
+    cold_ms: float
+    warm_ms: float
+
+
+def make_tree(root: Path, files: int) -> int:
+    """Create `files` empty files in two-level subdirectories of `root`."""
+    directories = 0
+    for i in range(0, files, _FILES_PER_DIR):
+        directory = root / f"group{i // 10_000}" / f"batch{i}"
+        directory.mkdir(parents=True)
+        directories += 1
+        for j in range(i, min(i + _FILES_PER_DIR, files)):
+            (directory / f"file{j}.txt").touch()
+    # Age the directories past the racy-mtime window so warm reads can trust
+    # the cached listing, as they would on a tree that isn't being written.
+    past = time.time() - 60
+    for path, _, _ in os.walk(root):
+        os.utime(path, (past, past))
+    return directories
+
+
+async def glob_listing(root: Path) -> list[str]:
+    path = AsyncPath(root)
+    return [
+        str(Path(p).relative_to(root))
+        async for p in path.rglob("*")
+        if await p.is_file()
+    ]
+
+
+async def time_ms(fn: Callable[[], Awaitable[object]], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - started) * 1e3)
+    return statistics.median(samples)
+
+
+async def run(sizes: Sequence[int], repeat: int) -> list[Result]:
+    results: list[Result] = []
+    for files in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp).resolve()
+            directories = make_tree(root, files)
+
+            def fresh() -> DirectoryResource:
+                return DirectoryResource(uri="dir://bench", path=root, recursive=True)
+
+            warm = fresh()
+            await warm.read()
+            results.append(
+                Result(
+                    files=files,
+                    directories=directories,
+                    glob_ms=await time_ms(lambda: glob_listing(root), repeat),
+                    cold_ms=await time_ms(lambda: fresh().read(), repeat),
+                    warm_ms=await time_ms(warm.read, repeat),
+                )
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, nargs="+", default=[50_000], metavar="N")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print raw JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.files, args.repeat))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'files':>8} {'dirs':>6} {'glob ms':>10} {'cold ms':>10} {'warm ms':>10}")
+    for r in results:
+        print(
+            f"{r['files']:>8} {r['directories']:>6} {r['glob_ms']:>10.1f} "
+            f"{r['cold_ms']:>10.1f} {r['warm_ms']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
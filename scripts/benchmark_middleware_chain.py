@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""Benchmark per-call overhead of the FastMCP middleware chain.
+
+Stacks N pass-through middlewares that each override a single hook
+(``on_call_tool``) and times ``FastMCP._run_middleware`` for a ``tools/call``
+message around a no-op handler, isolating the chain from tool execution.
+The overhead column is the per-call cost above the zero-middleware baseline.
+
+Usage:
+    uv run python scripts/benchmark_middleware_chain.py
+    uv run python scripts/benchmark_middleware_chain.py --counts 0 5 20 50
+    uv run python scripts/benchmark_middleware_chain.py --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Sequence
+from typing import Any, TypedDict
+
+from fastmcp import FastMCP
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+
+class Result(TypedDict):
+    middlewares: int
+    per_call_us: float
+    overhead_us: float
+
+
+class PassThrough(Middleware):
+    async def on_call_tool(
+        self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Any:
+        return await call_next(context)
+
+
+def make_server(count: int) -> FastMCP:
+    mcp = FastMCP("middleware benchmark", dereference_schemas=False)
+    for _ in range(count):
+        mcp.add_middleware(PassThrough())
+    return mcp
+
+
+async def handler(context: MiddlewareContext[Any]) -> None:
+    return None
+
+
+async def time_calls(mcp: FastMCP, calls: int, rounds: int) -> float:
+    """Return the median per-call latency in microseconds."""
+    context = MiddlewareContext(message=None, method="tools/call")
+    await mcp._run_middleware(context, handler)  # warm caches
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(calls):
+            await mcp._run_middleware(context, handler)
+        samples.append((time.perf_counter() - started) / calls * 1e6)
+    return statistics.median(samples)
+
+
+async def run(counts: Sequence[int], calls: int, rounds: int) -> list[Result]:
+    timings = {
+        count: await time_calls(make_server(count), calls, rounds) for count in counts
+    }
+    baseline = timings.get(0, min(timings.values()))
+    return [
+        Result(
+            middlewares=count,
+            per_call_us=timing,
+            overhead_us=timing - baseline,
+        )
+        for count, timing in timings.items()
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[0, 5, 20])
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print raw JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.counts, args.calls, args.rounds))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'middlewares':>12} {'per call us':>12} {'overhead us':>12}")
+    for r in results:
+        print(
+            f"{r['middlewares']:>12} {r['per_call_us']:>12.1f} "
+            f"{r['overhead_us']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
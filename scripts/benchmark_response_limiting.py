@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""Benchmark ResponseLimitingMiddleware on large tool results.
+
+Times `on_call_tool` around a handler that returns a prebuilt text result of
+each size, once with a limit above the result size and once with the default
+1MB limit below it. The "full dump" column is the cost of serializing the
+result with `pydantic_core.to_json`, which is what measuring the size used
+to cost before truncation even started.
+
+Usage:
+    uv run python scripts/benchmark_response_limiting.py
+    uv run python scripts/benchmark_response_limiting.py --sizes 1 50 200
+    uv run python scripts/benchmark_response_limiting.py --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import time
+from collections.abc import Sequence
+from types import SimpleNamespace
+from typing import Any, TypedDict
+
+import pydantic_core
+from mcp_types import TextContent
+
+from fastmcp.server.middleware import MiddlewareContext
+from fastmcp.server.middleware.response_limiting import ResponseLimitingMiddleware
+from fastmcp.tools.base import ToolResult
+
+_MB = 1_000_000
+_BLOCKS = 10
+
+
+class Result(TypedDict):
+    result_mb: int
+    limit: str
+    full_dump_ms: float
+    middleware_ms: float
+
+
+def make_result(size: int) -> ToolResult:
+    """Return a result of roughly `size` bytes split across text blocks."""
+    line = 'log line with some "quoted" text and a tab\t é\n'
+    block = line * (size // _BLOCKS // len(line.encode()))
+    return ToolResult(
+        content=[TextContent(type="text", text=block) for _ in range(_BLOCKS)]
+    )
+
+
+def median_ms(fn: Any, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e3)
+    return statistics.median(samples)
+
+
+async def time_middleware(
+    middleware: ResponseLimitingMiddleware, result: ToolResult, repeat: int
+) -> float:
+    """Return the median latency of `on_call_tool` in milliseconds."""
+    context: MiddlewareContext[Any] = MiddlewareContext(
+        message=SimpleNamespace(name="bench"), method="tools/call"
+    )
+
+    async def call_next(context: MiddlewareContext[Any]) -> ToolResult:
+        return result
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await middleware.on_call_tool(context, call_next)
+        samples.append((time.perf_counter() - started) * 1e3)
+    return statistics.median(samples)
+
+
+async def run(sizes_mb: Sequence[int], repeat: int) -> list[Result]:
+    results: list[Result] = []
+    for size_mb in sizes_mb:
+        result = make_result(size_mb * _MB)
+        full_dump = median_ms(
+            lambda result=result: pydantic_core.to_json(result, fallback=str), repeat
+        )
+        for label, max_size in [("under", size_mb * _MB * 2), ("over", _MB)]:
+            middleware = ResponseLimitingMiddleware(max_size=max_size)
+            results.append(
+                Result(
+                    result_mb=size_mb,
+                    limit=label,
+                    full_dump_ms=full_dump,
+                    middleware_ms=await time_middleware(middleware, result, repeat),
+                )
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 50], metavar="MB")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print raw JSON")
+    args = parser.parse_args()
+    # Silence the per-call truncation warning.
+    logging.getLogger("fastmcp.server.middleware.response_limiting").setLevel(
+        logging.ERROR
+    )
+
+    results = asyncio.run(run(args.sizes, args.repeat))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'result MB':>10} {'limit':>6} {'full dump ms':>13} {'middleware ms':>14}")
+    for r in results:
+        print(
+            f"{r['result_mb']:>10} {r['limit']:>6} "
+            f"{r['full_dump_ms']:>13.2f} {r['middleware_ms']:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""Benchmark decoding an encrypted task snapshot.
+
+Encrypts one snapshot of the given size and decodes it N times with an
+`EncryptedCodec` whose plaintext cache is disabled ("uncached", one Fernet
+decrypt per call) and with the default cache ("cached", one decrypt in
+total). It also reports the longest event-loop stall seen by a 1ms ticker
+while a single decode runs inline (`decode`) versus through `decode_async`,
+which moves payloads above the thread-offload threshold to a worker thread.
+
+Usage:
+    uv run python scripts/benchmark_snapshot_codec.py
+    uv run python scripts/benchmark_snapshot_codec.py --size 4000000 --decodes 200
+    uv run python scripts/benchmark_snapshot_codec.py --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypedDict
+
+from fastmcp_tasks.encryption import EncryptedCodec
+
+_KEY = "benchmark-snapshot-codec-encryption-key"
+
+
+class Result(TypedDict):
+    size: int
+    decodes: int
+    uncached_ms: float
+    cached_ms: float
+    sync_stall_ms: float
+    async_stall_ms: float
+
+
+def make_snapshot(size: int) -> str:
+    """A JSON snapshot of roughly `size` bytes."""
+    return json.dumps({"headers": {"x-blob": os.urandom(size // 2).hex()}})
+
+
+def decode_all_ms(codec: EncryptedCodec, stored: str, decodes: int) -> float:
+    started = time.perf_counter()
+    for _ in range(decodes):
+        codec.decode(stored)
+    return (time.perf_counter() - started) * 1e3
+
+
+async def max_stall_ms(work: Callable[[], Awaitable[object]]) -> float:
+    """Longest gap between 1ms ticks on the event loop while `work` runs."""
+    stall = 0.0
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal stall
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stall = max(stall, now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    await work()
+    done.set()
+    await task
+    return stall * 1e3
+
+
+async def run(size: int, decodes: int) -> Result:
+    payload = make_snapshot(size)
+    uncached = EncryptedCodec(_KEY, cache_entries=0)
+    stored = uncached.encode(payload)
+
+    async def sync_decode() -> None:
+        uncached.decode(stored)
+
+    return Result(
+        size=len(payload),
+        decodes=decodes,
+        uncached_ms=decode_all_ms(uncached, stored, decodes),
+        cached_ms=decode_all_ms(EncryptedCodec(_KEY), stored, decodes),
+        sync_stall_ms=await max_stall_ms(sync_decode),
+        async_stall_ms=await max_stall_ms(lambda: uncached.decode_async(stored)),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000, metavar="BYTES")
+    parser.add_argument("--decodes", type=int, default=1_000)
+    parser.add_argument("--json", action="store_true", help="print raw JSON")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.size, args.decodes))
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"snapshot: {result['size']} bytes, {result['decodes']} decodes")
+    print(f"  uncached      {result['uncached_ms']:>10.1f} ms")
+    print(f"  cached        {result['cached_ms']:>10.1f} ms")
+    print(f"  loop stall, decode        {result['sync_stall_ms']:>7.1f} ms")
+    print(f"  loop stall, decode_async  {result['async_stall_ms']:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,15 @@
 """Tests for the fastmcp tasks CLI."""
 
+import sys
+
 import pytest
 from fastmcp_tasks.settings import DocketSettings
 from fastmcp_tasks.worker_cli import (
     check_distributed_backend,
+    override_worker_settings,
     resolve_docket_settings,
     tasks_app,
+    worker_process_command,
 )
 
 from fastmcp import FastMCP
@@ -30,6 +34,27 @@ class TestResolveDocketSettings:
         assert exc_info.value.code == 1
 
 
+class TestOverrideWorkerSettings:
+    def test_cli_options_replace_extension_settings(self):
+        mcp = FastMCP("t")
+        mcp.add_extension(TasksExtension(concurrency=5, min_concurrency=2))
+
+        settings = override_worker_settings(
+            mcp, min_concurrency=None, max_concurrency=40
+        )
+
+        assert (settings.concurrency, settings.min_concurrency) == (5, 2)
+        assert settings.max_concurrency == 40
+        assert resolve_docket_settings(mcp) is settings
+
+    def test_no_options_keeps_settings(self):
+        mcp = FastMCP("t")
+        mcp.add_extension(TasksExtension())
+        original = resolve_docket_settings(mcp)
+
+        assert override_worker_settings(mcp, max_concurrency=None) is original
+
+
 class TestCheckDistributedBackend:
     """Test the distributed backend checker function."""
 
@@ -58,6 +83,25 @@ class TestWorkerCommand:
         assert command.__name__ == "worker"  # type: ignore[attr-defined]  # ty:ignore[unresolved-attribute]
         assert bound.arguments["server_spec"] == "server.py"
 
+    def test_autoscale_options(self):
+        _, bound, _ = tasks_app.parse_args(
+            ["worker", "server.py", "--max-concurrency", "50", "--processes", "4"]
+        )
+        assert bound.arguments["max_concurrency"] == 50
+        assert bound.arguments["processes"] == 4
+
+    def test_worker_process_command_forwards_options(self):
+        command = worker_process_command("server.py", None, 50)
+        assert command == [
+            sys.executable,
+            "-m",
+            "fastmcp_tasks.worker_cli",
+            "worker",
+            "server.py",
+            "--max-concurrency",
+            "50",
+        ]
+
 
 class TestTasksAppIntegration:
     """Test the tasks app integration."""
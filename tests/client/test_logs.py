@@ -192,6 +192,66 @@ class TestSetLoggingLevel:
         assert log_handler.logs[1].data["msg"] == "error msg"
 
 
+class TestClientLogQueue:
+    async def test_queued_logs_are_delivered_in_order_before_result(self):
+        mcp = FastMCP(client_log_queue_size=1000)
+
+        @mcp.tool
+        async def chatty(context: Context) -> None:
+            for i in range(100):
+                await context.info(f"line {i}")
+
+        log_handler = LogHandler()
+        async with Client(mcp, log_handler=log_handler.handle_log) as client:
+            await client.call_tool("chatty", {})
+            assert [log.data["msg"] for log in log_handler.logs] == [
+                f"line {i}" for i in range(100)
+            ]
+
+    async def test_full_queue_drops_oldest_and_counts(self):
+        mcp = FastMCP(client_log_queue_size=3)
+
+        @mcp.tool
+        async def chatty(context: Context) -> None:
+            # Enqueueing never yields, so the sender cannot drain in between.
+            for i in range(10):
+                await context.info(f"line {i}")
+
+        log_handler = LogHandler()
+        async with Client(mcp, log_handler=log_handler.handle_log) as client:
+            await client.call_tool("chatty", {})
+
+        assert [log.data["msg"] for log in log_handler.logs] == [
+            "line 7",
+            "line 8",
+            "line 9",
+        ]
+        assert mcp.client_log_messages_dropped == 7
+
+    async def test_level_gate_applies_before_enqueue(self):
+        mcp = FastMCP(client_log_queue_size=2)
+
+        @mcp.tool
+        async def chatty(context: Context) -> None:
+            for i in range(10):
+                await context.debug(f"debug {i}")
+            await context.warning("warning")
+
+        log_handler = LogHandler()
+        async with Client(
+            mcp, mode="legacy", log_handler=log_handler.handle_log
+        ) as client:
+            await client.set_logging_level("warning")
+            await client.call_tool("chatty", {})
+
+        assert [log.data["msg"] for log in log_handler.logs] == ["warning"]
+        assert mcp.client_log_messages_dropped == 0
+
+    def test_queue_size_must_be_positive(self):
+        with pytest.raises(ValueError, match="client_log_queue_size"):
+            FastMCP(client_log_queue_size=0)
+
+
 class TestDefaultLogHandler:
     """Tests for default_log_handler with data as any JSON-serializable type."""
 
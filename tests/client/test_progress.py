@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from fastmcp import Client, Context, FastMCP
@@ -74,3 +76,98 @@ async def test_default_progress_handler_handles_zero_total() -> None:
     from fastmcp.client.progress import default_progress_handler
 
     await default_progress_handler(progress=1, total=0, message="starting")
+
+
+class TestProgressCoalescing:
+    async def test_defaults_send_every_update(self):
+        mcp = FastMCP()
+
+        @mcp.tool
+        async def count(ctx: Context) -> None:
+            for i in range(5):
+                await ctx.report_progress(progress=i)
+
+        async with Client(mcp) as client:
+            await client.call_tool("count", {}, progress_handler=progress_handler)
+
+        assert [m["progress"] for m in PROGRESS_MESSAGES] == [0, 1, 2, 3, 4]
+
+    async def test_min_interval_coalesces_to_first_and_final(self):
+        mcp = FastMCP(progress_min_interval=60)
+
+        @mcp.tool
+        async def count(ctx: Context) -> None:
+            for i in range(1, 101):
+                await ctx.report_progress(progress=i, total=100)
+
+        async with Client(mcp) as client:
+            await client.call_tool("count", {}, progress_handler=progress_handler)
+
+        assert PROGRESS_MESSAGES == [
+            dict(progress=1, total=100, message=None),
+            dict(progress=100, total=100, message=None),
+        ]
+
+    async def test_min_delta_coalesces_small_steps(self):
+        mcp = FastMCP(progress_min_delta=25)
+
+        @mcp.tool
+        async def count(ctx: Context) -> None:
+            for i in range(1, 101):
+                await ctx.report_progress(progress=i, total=100)
+
+        async with Client(mcp) as client:
+            await client.call_tool("count", {}, progress_handler=progress_handler)
+
+        assert [m["progress"] for m in PROGRESS_MESSAGES] == [1, 26, 51, 76, 100]
+
+    async def test_message_changes_are_always_sent(self):
+        mcp = FastMCP(progress_min_interval=60)
+
+        @mcp.tool
+        async def stages(ctx: Context) -> None:
+            await ctx.report_progress(progress=1, message="loading")
+            await ctx.report_progress(progress=2, message="loading")
+            await ctx.report_progress(progress=3, message="saving")
+
+        async with Client(mcp) as client:
+            await client.call_tool("stages", {}, progress_handler=progress_handler)
+
+        assert PROGRESS_MESSAGES == [
+            dict(progress=1, total=None, message="loading"),
+            dict(progress=3, total=None, message="saving"),
+        ]
+
+    async def test_pending_update_is_flushed_when_request_ends(self):
+        mcp = FastMCP(progress_min_interval=60)
+
+        @mcp.tool
+        async def scan(ctx: Context) -> None:
+            for i in range(10):
+                await ctx.report_progress(progress=i)
+
+        async with Client(mcp) as client:
+            await client.call_tool("scan", {}, progress_handler=progress_handler)
+
+        assert [m["progress"] for m in PROGRESS_MESSAGES] == [0, 9]
+
+    async def test_pending_update_is_sent_when_interval_elapses(self):
+        mcp = FastMCP(progress_min_interval=0.05)
+        sent_before_return: list[float] = []
+
+        @mcp.tool
+        async def scan(ctx: Context) -> None:
+            for i in range(10):
+                await ctx.report_progress(progress=i)
+            await asyncio.sleep(0.2)
+            sent_before_return.extend(m["progress"] for m in PROGRESS_MESSAGES)
+
+        async with Client(mcp) as client:
+            await client.call_tool("scan", {}, progress_handler=progress_handler)
+
+        assert sent_before_return == [0, 9]
+        assert [m["progress"] for m in PROGRESS_MESSAGES] == [0, 9]
+
+    def test_negative_thresholds_are_rejected(self):
+        with pytest.raises(ValueError, match="non-negative"):
+            FastMCP(progress_min_interval=-1)
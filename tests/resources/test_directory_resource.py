@@ -0,0 +1,163 @@
+import json
+import os
+import time
+from pathlib import Path
+
+import anyio
+import pytest
+
+from fastmcp.exceptions import ResourceError
+from fastmcp.resources import DirectoryResource
+from fastmcp.resources import types as resource_types
+from fastmcp.resources.base import ResourceResult
+
+
+def backdate(root: Path, seconds: float = 60) -> None:
+    """Age every directory's mtime past the racy window."""
+    past = time.time() - seconds
+    for path in [root, *(p for p in root.rglob("*") if p.is_dir())]:
+        os.utime(path, (past, past))
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.md").write_text("b")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "c.txt").write_text("c")
+    (tmp_path / "sub" / "deep").mkdir()
+    (tmp_path / "sub" / "deep" / "d.txt").write_text("d")
+    backdate(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def scans(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls: list[Path] = []
+    original = resource_types._scan_directory
+
+    def counting_scan(root, pattern, max_depth):
+        calls.append(root)
+        return original(root, pattern, max_depth)
+
+    monkeypatch.setattr(resource_types, "_scan_directory", counting_scan)
+    return calls
+
+
+async def listed(resource: DirectoryResource) -> list[str]:
+    result = await resource.read()
+    assert isinstance(result, ResourceResult)
+    content = result.contents[0].content
+    assert isinstance(content, str)
+    return sorted(json.loads(content)["files"])
+
+
+class TestDirectoryListing:
+    @pytest.mark.parametrize(
+        "recursive, pattern",
+        [
+            (False, None),
+            (True, None),
+            (False, "*.txt"),
+            (True, "*.txt"),
+            (False, "sub/*.txt"),
+            (True, "deep/*.txt"),
+            (True, "**/*.txt"),
+        ],
+    )
+    async def test_matches_glob(self, tree: Path, recursive: bool, pattern: str | None):
+        resource = DirectoryResource(
+            uri="dir://test", path=tree, recursive=recursive, pattern=pattern
+        )
+        glob = tree.rglob if recursive else tree.glob
+        expected = sorted(
+            str(p.relative_to(tree)) for p in glob(pattern or "*") if p.is_file()
+        )
+
+        assert await listed(resource) == expected
+        assert sorted(await resource.list_files()) == sorted(
+            tree / name for name in expected
+        )
+
+    async def test_missing_directory(self, tmp_path: Path):
+        resource = DirectoryResource(uri="dir://test", path=tmp_path / "missing")
+
+        with pytest.raises(FileNotFoundError, match="Directory not found"):
+            await resource.list_files()
+        with pytest.raises(ResourceError, match="Error reading directory"):
+            await resource.read()
+
+    async def test_not_a_directory(self, tree: Path):
+        resource = DirectoryResource(uri="dir://test", path=tree / "a.txt")
+
+        with pytest.raises(NotADirectoryError):
+            await resource.list_files()
+
+
+class TestDirectoryListingCache:
+    async def test_warm_read_reuses_scan(self, tree: Path, scans: list[Path]):
+        resource = DirectoryResource(uri="dir://test", path=tree, recursive=True)
+
+        first = await listed(resource)
+        second = await listed(resource)
+
+        assert first == second
+        assert len(scans) == 1
+
+    async def test_added_file_invalidates(self, tree: Path, scans: list[Path]):
+        resource = DirectoryResource(uri="dir://test", path=tree, recursive=True)
+        await listed(resource)
+
+        (tree / "sub" / "deep" / "e.txt").write_text("e")
+
+        assert str(Path("sub/deep/e.txt")) in await listed(resource)
+        assert len(scans) == 2
+
+    async def test_removed_directory_invalidates(self, tree: Path):
+        resource = DirectoryResource(uri="dir://test", path=tree, recursive=True)
+        await listed(resource)
+
+        (tree / "sub" / "deep" / "d.txt").unlink()
+        (tree / "sub" / "deep").rmdir()
+
+        assert await listed(resource) == ["a.txt", "b.md", str(Path("sub/c.txt"))]
+
+    async def test_recent_changes_are_not_trusted(
+        self, tmp_path: Path, scans: list[Path]
+    ):
+        (tmp_path / "a.txt").write_text("a")
+        resource = DirectoryResource(uri="dir://test", path=tmp_path)
+
+        await listed(resource)
+        await listed(resource)
+
+        assert len(scans) == 2
+
+    async def test_invalidate(self, tree: Path, scans: list[Path]):
+        resource = DirectoryResource(uri="dir://test", path=tree)
+        await listed(resource)
+
+        resource.invalidate()
+        await listed(resource)
+
+        assert len(scans) == 2
+
+    @pytest.mark.timeout(15)
+    async def test_watch(self, tree: Path, scans: list[Path]):
+        resource = DirectoryResource(uri="dir://test", path=tree, recursive=True)
+
+        async with resource.watch():
+            with anyio.fail_after(10):
+                while not resource._watching:
+                    await anyio.sleep(0.05)
+            await listed(resource)
+            scanned = len(scans)
+            assert await listed(resource) == await listed(resource)
+            assert len(scans) == scanned
+
+            (tree / "sub" / "new.txt").write_text("new")
+            with anyio.fail_after(10):
+                while str(Path("sub/new.txt")) not in await listed(resource):
+                    await anyio.sleep(0.05)
+
+        assert not resource._watching
@@ -1,12 +1,16 @@
+import base64
 import os
+import tracemalloc
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
 import pytest
+from mcp_types import BlobResourceContents
 from pydantic import FileUrl
 
+from fastmcp import Client, FastMCP
 from fastmcp.exceptions import ResourceError
-from fastmcp.resources import FileResource
+from fastmcp.resources import FileResource, FileResourceTemplate
 from fastmcp.resources.base import ResourceResult
 
 
@@ -179,3 +183,202 @@ class TestFileResource:
         )
         result = await resource.read()
         assert result.contents[0].content == content
+
+
+class TestFileResourceRanges:
+    """Test ranged and streamed reads."""
+
+    async def test_read_range(self, tmp_path: Path):
+        file = tmp_path / "data.bin"
+        file.write_bytes(bytes(range(100)))
+
+        resource = FileResource(
+            uri=FileUrl("file:///test/range"),
+            path=file,
+            is_binary=True,
+            offset=10,
+            length=5,
+        )
+        result = await resource.read()
+        content = result.contents[0]
+        assert content.content == bytes(range(10, 15))
+        assert content.meta == {"offset": 10, "length": 5, "size": 100}
+
+    async def test_read_range_past_end(self, tmp_path: Path):
+        file = tmp_path / "data.bin"
+        file.write_bytes(bytes(range(100)))
+
+        resource = FileResource(
+            uri=FileUrl("file:///test/range"), path=file, is_binary=True, offset=95
+        )
+        result = await resource.read()
+        assert result.contents[0].content == bytes(range(95, 100))
+
+        resource = FileResource(
+            uri=FileUrl("file:///test/range"), path=file, is_binary=True, offset=200
+        )
+        result = await resource.read()
+        assert result.contents[0].content == b""
+        assert result.contents[0].meta == {"offset": 200, "length": 0, "size": 100}
+
+    async def test_read_text_range(self, tmp_path: Path):
+        file = tmp_path / "data.txt"
+        file.write_text("hello world", encoding="utf-8")
+
+        resource = FileResource(
+            uri=FileUrl("file:///test/range"), path=file, offset=6, length=5
+        )
+        result = await resource.read()
+        assert result.contents[0].content == "world"
+
+    async def test_text_range_drops_partial_characters(self, tmp_path: Path):
+        file = tmp_path / "data.txt"
+        # "é" and "€" are two and three bytes in UTF-8.
+        file.write_text("aé€b", encoding="utf-8")
+
+        # Bytes 2..5 start inside "é" and end inside "€".
+        resource = FileResource(
+            uri=FileUrl("file:///test/range"), path=file, offset=2, length=3
+        )
+        result = await resource.read()
+        assert result.contents[0].content == ""
+        assert result.contents[0].meta == {"offset": 3, "length": 0, "size": 7}
+
+        resource = resource.model_copy(update={"offset": 1, "length": 5})
+        result = await resource.read()
+        assert result.contents[0].content == "é€"
+        assert result.contents[0].meta == {"offset": 1, "length": 5, "size": 7}
+
+        resource = resource.model_copy(update={"offset": 2, "length": None})
+        result = await resource.read()
+        assert result.contents[0].content == "€b"
+        assert result.contents[0].meta == {"offset": 3, "length": 4, "size": 7}
+
+    async def test_stream(self, tmp_path: Path):
+        data = os.urandom(10_000)
+        file = tmp_path / "data.bin"
+        file.write_bytes(data)
+
+        resource = FileResource(
+            uri=FileUrl("file:///test/stream"), path=file, is_binary=True
+        )
+        chunks = [chunk async for chunk in resource.stream(chunk_size=4096)]
+        assert [len(c) for c in chunks] == [4096, 4096, 1808]
+        assert b"".join(chunks) == data
+
+        ranged = resource.model_copy(update={"offset": 100, "length": 5000})
+        chunks = [chunk async for chunk in ranged.stream(chunk_size=4096)]
+        assert b"".join(chunks) == data[100:5100]
+
+    async def test_negative_offset_rejected(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            FileResource(uri=FileUrl("file:///test"), path=tmp_path, offset=-1)
+
+
+class TestFileResourceTemplate:
+    """Test serving a file in ranges through a template."""
+
+    def test_requires_range_params(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="missing: length"):
+            FileResourceTemplate(
+                uri_template="file:///data{?offset}",
+                name="data",
+                path=tmp_path / "data.bin",
+            )
+
+    def test_requires_absolute_path(self):
+        with pytest.raises(ValueError, match="Path must be absolute"):
+            FileResourceTemplate(
+                uri_template="file:///data{?offset,length}",
+                name="data",
+                path=Path("data.bin"),
+            )
+
+    async def test_read_through_client(self, tmp_path: Path):
+        data = os.urandom(1000)
+        file = tmp_path / "data.bin"
+        file.write_bytes(data)
+
+        mcp = FastMCP()
+        mcp.add_template(
+            FileResourceTemplate(
+                uri_template="file:///data.bin{?offset,length}",
+                name="data",
+                path=file,
+                chunk_size=256,
+            )
+        )
+
+        async with Client(mcp) as client:
+            first = await client.read_resource("file:///data.bin")
+            ranged = await client.read_resource("file:///data.bin?offset=900&length=50")
+            capped = await client.read_resource(
+                "file:///data.bin?offset=100&length=5000"
+            )
+
+        def blob(contents: list) -> bytes:
+            assert isinstance(contents[0], BlobResourceContents)
+            return base64.b64decode(contents[0].blob)
+
+        assert blob(first) == data[:256]
+        assert blob(ranged) == data[900:950]
+        assert blob(capped) == data[100:356]
+
+    async def test_zero_length_is_empty_read(self, tmp_path: Path):
+        file = tmp_path / "data.bin"
+        file.write_bytes(bytes(range(100)))
+        template = FileResourceTemplate(
+            uri_template="file:///data.bin{?offset,length}",
+            name="data",
+            path=file,
+            chunk_size=50,
+        )
+
+        resource = await template.create_resource(
+            "file:///data.bin", {"offset": "10", "length": "0"}
+        )
+        result = await resource.read()
+        assert isinstance(result, ResourceResult)
+        assert result.contents[0].content == b""
+        assert result.contents[0].meta == {"offset": 10, "length": 0, "size": 100}
+
+    async def test_large_sparse_file_memory_is_bounded(self, tmp_path: Path):
+        file = tmp_path / "sparse.bin"
+        size = 512 * 1024 * 1024
+        with file.open("wb") as f:
+            f.truncate(size)
+            f.seek(size - 4)
+            f.write(b"tail")
+
+        chunk_size = 1024 * 1024
+        template = FileResourceTemplate(
+            uri_template="file:///sparse.bin{?offset,length}",
+            name="sparse",
+            path=file,
+            chunk_size=chunk_size,
+        )
+
+        tracemalloc.start()
+        try:
+            resource = await template.create_resource(
+                "file:///sparse.bin",
+                {"offset": str(size - chunk_size), "length": str(size)},
+            )
+            assert isinstance(resource, FileResource)
+            result = await resource.read()
+            assert isinstance(result, ResourceResult)
+            assert len(result.contents[0].content) == chunk_size
+            assert result.contents[0].content[-4:] == b"tail"
+            del result
+
+            streamed = 0
+            async for chunk in resource.model_copy(
+                update={"offset": size - 64 * chunk_size, "length": None}
+            ).stream(chunk_size):
+                streamed += len(chunk)
+            assert streamed == 64 * chunk_size
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 8 * chunk_size
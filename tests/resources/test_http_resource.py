@@ -0,0 +1,204 @@
+import asyncio
+from collections.abc import MutableMapping
+from typing import Any
+
+import httpx2
+import pytest
+
+from fastmcp import Client, FastMCP
+from fastmcp.resources import HttpResource, HttpResourceClient
+from fastmcp.resources.base import ResourceResult
+
+
+class ValidatorStub:
+    """ASGI app serving a versioned body with an ETag and Last-Modified."""
+
+    last_modified = "Mon, 19 Oct 2026 12:00:00 GMT"
+
+    def __init__(self) -> None:
+        self.version = 1
+        self.requests: list[dict[str, str]] = []
+        self.release: asyncio.Event | None = None
+
+    @property
+    def etag(self) -> str:
+        return f'"v{self.version}"'
+
+    async def __call__(
+        self, scope: MutableMapping[str, Any], receive: Any, send: Any
+    ) -> None:
+        headers = {k.decode(): v.decode() for k, v in scope["headers"]}
+        self.requests.append(headers)
+        if self.release is not None:
+            await self.release.wait()
+
+        if scope["path"] == "/missing":
+            status, body = 404, b"not found"
+        elif headers.get("if-none-match") == self.etag:
+            status, body = 304, b""
+        else:
+            status, body = 200, f'{{"version": {self.version}}}'.encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"etag", self.etag.encode()),
+                    (b"last-modified", self.last_modified.encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+@pytest.fixture
+def stub() -> ValidatorStub:
+    return ValidatorStub()
+
+
+class CountingFactory:
+    def __init__(self, app: ValidatorStub):
+        self.app = app
+        self.clients: list[httpx2.AsyncClient] = []
+
+    def __call__(self) -> httpx2.AsyncClient:
+        client = httpx2.AsyncClient(transport=httpx2.ASGITransport(app=self.app))
+        self.clients.append(client)
+        return client
+
+
+def make_server(stub: ValidatorStub) -> tuple[FastMCP, CountingFactory]:
+    factory = CountingFactory(stub)
+    mcp = FastMCP(http_resource_client=HttpResourceClient(client_factory=factory))
+    mcp.add_resource(
+        HttpResource(uri="data://config", url="http://upstream/config.json")
+    )
+    return mcp, factory
+
+
+class TestHttpResource:
+    async def test_repeat_reads_revalidate(self, stub: ValidatorStub):
+        mcp, _ = make_server(stub)
+
+        async with Client(mcp) as client:
+            first = await client.read_resource("data://config")
+            second = await client.read_resource("data://config")
+
+        assert first == second
+        assert len(stub.requests) == 2
+        assert "if-none-match" not in stub.requests[0]
+        assert stub.requests[1]["if-none-match"] == '"v1"'
+        assert stub.requests[1]["if-modified-since"] == stub.last_modified
+
+    async def test_changed_body_replaces_cache(self, stub: ValidatorStub):
+        mcp, _ = make_server(stub)
+
+        async with Client(mcp) as client:
+            await client.read_resource("data://config")
+            stub.version = 2
+            changed = await client.read_resource("data://config")
+            again = await client.read_resource("data://config")
+
+        assert changed == again
+        assert '"version": 2' in str(changed[0])
+        assert stub.requests[2]["if-none-match"] == '"v2"'
+
+    async def test_client_is_pooled_for_lifespan(self, stub: ValidatorStub):
+        mcp, factory = make_server(stub)
+
+        async with Client(mcp) as client:
+            assert factory.clients == []
+            for _ in range(3):
+                await client.read_resource("data://config")
+            assert len(factory.clients) == 1
+            assert not factory.clients[0].is_closed
+
+        assert factory.clients[0].is_closed
+
+    async def test_concurrent_reads_are_coalesced(self, stub: ValidatorStub):
+        http_client = HttpResourceClient(client_factory=CountingFactory(stub))
+        stub.release = asyncio.Event()
+
+        async with http_client:
+            reads = [
+                asyncio.ensure_future(http_client.get_text("http://upstream/a"))
+                for _ in range(10)
+            ]
+            await asyncio.sleep(0.01)
+            stub.release.set()
+            results = await asyncio.gather(*reads)
+
+        assert len(stub.requests) == 1
+        assert results == ['{"version": 1}'] * 10
+
+    async def test_cancelled_reader_does_not_cancel_others(self, stub: ValidatorStub):
+        http_client = HttpResourceClient(client_factory=CountingFactory(stub))
+        stub.release = asyncio.Event()
+
+        async with http_client:
+            first = asyncio.ensure_future(http_client.get_text("http://upstream/a"))
+            second = asyncio.ensure_future(http_client.get_text("http://upstream/a"))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            stub.release.set()
+
+            assert await second == '{"version": 1}'
+        assert first.cancelled()
+
+    def test_fetch_from_closed_loop_is_not_shared(self, stub: ValidatorStub):
+        http_client = HttpResourceClient(client_factory=CountingFactory(stub))
+        stub.release = asyncio.Event()
+
+        async def abandon_fetch() -> None:
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(http_client.get_text("http://upstream/a"), 0.01)
+
+        # Close the loop while the fetch task is still pending, as happens
+        # when a loop is torn down without cancelling its tasks.
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(abandon_fetch())
+        finally:
+            loop.close()
+
+        stub.release = None
+        result = asyncio.run(http_client.get_text("http://upstream/a"))
+        assert result == '{"version": 1}'
+        assert len(stub.requests) == 2
+
+    async def test_error_status_raises(self, stub: ValidatorStub):
+        http_client = HttpResourceClient(client_factory=CountingFactory(stub))
+
+        async with http_client:
+            with pytest.raises(httpx2.HTTPStatusError):
+                await http_client.get_text("http://upstream/missing")
+
+    async def test_lru_eviction(self, stub: ValidatorStub):
+        http_client = HttpResourceClient(
+            client_factory=CountingFactory(stub), max_entries=1
+        )
+
+        async with http_client:
+            await http_client.get_text("http://upstream/a")
+            await http_client.get_text("http://upstream/b")
+            await http_client.get_text("http://upstream/a")
+
+        assert ["if-none-match" in r for r in stub.requests] == [False, False, False]
+
+    async def test_read_outside_server(self, monkeypatch: pytest.MonkeyPatch):
+        stub = ValidatorStub()
+        monkeypatch.setattr(
+            "fastmcp.resources.types._standalone_http_client",
+            HttpResourceClient(client_factory=CountingFactory(stub)),
+        )
+        resource = HttpResource(uri="data://config", url="http://upstream/config")
+
+        result = await resource.read()
+
+        assert isinstance(result, ResourceResult)
+        assert result.contents[0].content == '{"version": 1}'
+        assert result.contents[0].mime_type == "application/json"
+
+    def test_max_entries_must_be_positive(self):
+        with pytest.raises(ValueError, match="max_entries"):
+            HttpResourceClient(max_entries=0)
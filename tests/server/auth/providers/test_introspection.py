@@ -3,7 +3,9 @@
 import base64
 import time
 from typing import Any
+from urllib.parse import parse_qs
 
+import httpx2
 import pytest
 
 from fastmcp.server.auth.providers.introspection import (
@@ -952,6 +954,98 @@ class TestIntrospectionCaching:
         assert hash_0 not in verifier._cache._entries
 
 
+class FakeIntrospectionEndpoint:
+    """Introspection endpoint that counts calls per token."""
+
+    def __init__(self, active: set[str]):
+        self.active = active
+        self.calls: dict[str, int] = {}
+
+    def __call__(self, request: httpx2.Request) -> httpx2.Response:
+        token = parse_qs(request.content.decode())["token"][0]
+        self.calls[token] = self.calls.get(token, 0) + 1
+        if token == "flaky":
+            return httpx2.Response(503)
+        if token in self.active:
+            return httpx2.Response(200, json={"active": True, "client_id": token})
+        return httpx2.Response(200, json={"active": False})
+
+
+class TestIntrospectionNegativeCaching:
+    """Test short-lived caching of tokens the endpoint rejects."""
+
+    @pytest.fixture
+    def endpoint(self) -> FakeIntrospectionEndpoint:
+        return FakeIntrospectionEndpoint(active={"good"})
+
+    def make_verifier(
+        self, endpoint: FakeIntrospectionEndpoint, **kwargs: Any
+    ) -> IntrospectionTokenVerifier:
+        return IntrospectionTokenVerifier(
+            introspection_url="https://auth.example.com/oauth/introspect",
+            client_id="test-client",
+            client_secret="test-secret",
+            cache_ttl_seconds=300,
+            http_client=httpx2.AsyncClient(transport=httpx2.MockTransport(endpoint)),
+            **kwargs,
+        )
+
+    async def test_inactive_token_is_introspected_once(
+        self, endpoint: FakeIntrospectionEndpoint
+    ):
+        verifier = self.make_verifier(endpoint, negative_cache_ttl_seconds=5)
+
+        for _ in range(10):
+            assert await verifier.verify_token("bad") is None
+
+        assert endpoint.calls == {"bad": 1}
+        assert verifier._cache.stats.negative_hits == 9
+
+    async def test_rejection_expires(self, endpoint: FakeIntrospectionEndpoint):
+        verifier = self.make_verifier(endpoint, negative_cache_ttl_seconds=5)
+
+        await verifier.verify_token("bad")
+        cache_key = verifier._cache._hash_token("bad")
+        verifier._cache._rejected[cache_key].expires_at = time.time() - 1
+        endpoint.active.add("bad")
+
+        result = await verifier.verify_token("bad")
+        assert result is not None
+        assert endpoint.calls == {"bad": 2}
+
+    async def test_http_errors_are_not_negatively_cached(
+        self, endpoint: FakeIntrospectionEndpoint
+    ):
+        verifier = self.make_verifier(endpoint, negative_cache_ttl_seconds=5)
+
+        for _ in range(3):
+            assert await verifier.verify_token("flaky") is None
+
+        assert endpoint.calls == {"flaky": 3}
+
+    async def test_disabled_by_default(self, endpoint: FakeIntrospectionEndpoint):
+        verifier = self.make_verifier(endpoint)
+
+        for _ in range(3):
+            await verifier.verify_token("bad")
+
+        assert endpoint.calls == {"bad": 3}
+
+    async def test_invalid_tokens_do_not_evict_valid_ones(
+        self, endpoint: FakeIntrospectionEndpoint
+    ):
+        verifier = self.make_verifier(
+            endpoint, max_cache_size=2, negative_cache_ttl_seconds=5
+        )
+
+        await verifier.verify_token("good")
+        for i in range(20):
+            await verifier.verify_token(f"bad-{i}")
+        assert await verifier.verify_token("good") is not None
+
+        assert endpoint.calls["good"] == 1
+
+
 class TestIntrospectionTokenVerifierIntegration:
     """Integration tests with FastMCP server."""
 
@@ -1,8 +1,10 @@
+import asyncio
 import time
 from collections.abc import AsyncGenerator
 from typing import Any, cast
 from unittest.mock import MagicMock, patch
 
+import httpx2
 import pytest
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed448 import Ed448PrivateKey
@@ -981,3 +983,187 @@ class TestBearerTokenJWKS:
 
         access_token = await jwks_provider.load_access_token(token)
         assert access_token is None
+
+
+class StubJWKSServer:
+    """In-process JWKS endpoint that counts fetches and can hold them open."""
+
+    def __init__(self, *key_pairs: tuple[str, RSAKeyPair]):
+        self.keys = list(key_pairs)
+        self.requests = 0
+        self.status_code = 200
+        self.release: asyncio.Event | None = None
+
+    async def __call__(self, request: httpx2.Request) -> httpx2.Response:
+        self.requests += 1
+        if self.release is not None:
+            await self.release.wait()
+        else:
+            # Give concurrent callers a chance to pile up behind the fetch
+            await asyncio.sleep(0.01)
+        if self.status_code != 200:
+            return httpx2.Response(self.status_code)
+        keys = []
+        for kid, key_pair in self.keys:
+            public_key = jose_jwk.import_key(key_pair.public_key, "RSA").as_dict()
+            keys.append({**public_key, "kid": kid, "alg": "RS256"})
+        return httpx2.Response(200, json={"keys": keys})
+
+
+class TestJWKSRefresh:
+    """JWKS fetches are coalesced, refreshed ahead of expiry, and rate-limited."""
+
+    @pytest.fixture
+    def jwks_server(self, rsa_key_pair: RSAKeyPair) -> StubJWKSServer:
+        return StubJWKSServer(("key-1", rsa_key_pair))
+
+    @pytest.fixture
+    def verifier(self, jwks_server: StubJWKSServer) -> JWTVerifier:
+        return JWTVerifier(
+            jwks_uri="https://auth.example.com/.well-known/jwks.json",
+            issuer="https://auth.example.com",
+            audience="https://api.example.com",
+            http_client=httpx2.AsyncClient(transport=httpx2.MockTransport(jwks_server)),
+        )
+
+    def token(self, key_pair: RSAKeyPair, kid: str) -> str:
+        return key_pair.create_token(
+            issuer="https://auth.example.com",
+            audience="https://api.example.com",
+            kid=kid,
+        )
+
+    async def verify_many(
+        self, verifier: JWTVerifier, token: str, count: int = 500
+    ) -> list[Any]:
+        return await asyncio.gather(
+            *(verifier.load_access_token(token) for _ in range(count))
+        )
+
+    async def test_concurrent_verifications_share_one_fetch(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        verifier: JWTVerifier,
+        jwks_server: StubJWKSServer,
+    ):
+        results = await self.verify_many(verifier, self.token(rsa_key_pair, "key-1"))
+
+        assert all(result is not None for result in results)
+        assert jwks_server.requests == 1
+
+    async def test_expired_cache_is_refetched_once(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        verifier: JWTVerifier,
+        jwks_server: StubJWKSServer,
+    ):
+        token = self.token(rsa_key_pair, "key-1")
+        assert await verifier.load_access_token(token) is not None
+
+        verifier._jwks_cache_time -= verifier._cache_ttl
+        results = await self.verify_many(verifier, token)
+
+        assert all(result is not None for result in results)
+        assert jwks_server.requests == 2
+
+    async def test_unknown_kid_refetches_are_rate_limited(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        verifier: JWTVerifier,
+        jwks_server: StubJWKSServer,
+    ):
+        assert await verifier.load_access_token(self.token(rsa_key_pair, "key-1"))
+        unknown = self.token(rsa_key_pair, "no-such-key")
+
+        # Failed verifications log at debug level, so keep the storms smaller.
+        results = await self.verify_many(verifier, unknown, count=50)
+        assert all(result is None for result in results)
+        assert jwks_server.requests == 1
+
+        # Once the refetch interval passes, a miss storm costs one fetch.
+        verifier._jwks_last_attempt -= verifier._min_refetch_interval
+        results = await self.verify_many(verifier, unknown, count=50)
+        assert all(result is None for result in results)
+        assert jwks_server.requests == 2
+
+    async def test_rotated_key_is_picked_up_by_refetch(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        verifier: JWTVerifier,
+        jwks_server: StubJWKSServer,
+    ):
+        assert await verifier.load_access_token(self.token(rsa_key_pair, "key-1"))
+
+        new_key_pair = RSAKeyPair.generate()
+        jwks_server.keys.append(("key-2", new_key_pair))
+        verifier._jwks_last_attempt -= verifier._min_refetch_interval
+        results = await self.verify_many(verifier, self.token(new_key_pair, "key-2"))
+
+        assert all(result is not None for result in results)
+        assert jwks_server.requests == 2
+
+    async def test_refresh_ahead_of_expiry_does_not_block(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        verifier: JWTVerifier,
+        jwks_server: StubJWKSServer,
+    ):
+        token = self.token(rsa_key_pair, "key-1")
+        assert await verifier.load_access_token(token) is not None
+
+        # Age the cache into the refresh window and hold the refetch open.
+        verifier._jwks_cache_time -= verifier._cache_ttl - verifier._refresh_ahead
+        verifier._jwks_last_attempt = verifier._jwks_cache_time
+        stale_time = verifier._jwks_cache_time
+        jwks_server.release = asyncio.Event()
+
+        results = await self.verify_many(verifier, token)
+        assert all(result is not None for result in results)
+        assert jwks_server.requests == 2
+
+        jwks_server.release.set()
+        assert verifier._jwks_fetch_task is not None
+        await verifier._jwks_fetch_task
+        assert verifier._jwks_cache_time > stale_time
+
+    async def test_failed_background_refresh_keeps_cached_keys(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        verifier: JWTVerifier,
+        jwks_server: StubJWKSServer,
+    ):
+        token = self.token(rsa_key_pair, "key-1")
+        assert await verifier.load_access_token(token) is not None
+
+        verifier._jwks_cache_time -= verifier._cache_ttl - verifier._refresh_ahead
+        verifier._jwks_last_attempt = verifier._jwks_cache_time
+        jwks_server.status_code = 500
+
+        assert await verifier.load_access_token(token) is not None
+        assert verifier._jwks_fetch_task is not None
+        with pytest.raises(ValueError, match="Failed to fetch JWKS"):
+            await verifier._jwks_fetch_task
+
+        # The failure counts as an attempt, so it isn't retried per request.
+        results = await self.verify_many(verifier, token, count=50)
+        assert all(result is not None for result in results)
+        assert jwks_server.requests == 2
+
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        verifier: JWTVerifier,
+        jwks_server: StubJWKSServer,
+    ):
+        jwks_server.release = asyncio.Event()
+        token = self.token(rsa_key_pair, "key-1")
+
+        first = asyncio.create_task(verifier.load_access_token(token))
+        second = asyncio.create_task(verifier.load_access_token(token))
+        await asyncio.sleep(0)
+        first.cancel()
+        jwks_server.release.set()
+
+        assert await second is not None
+        assert first.cancelled()
+        assert jwks_server.requests == 1
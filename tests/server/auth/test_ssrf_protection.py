@@ -3,7 +3,9 @@
 This module tests the ssrf.py module which provides SSRF-protected HTTP fetching.
 """
 
+import asyncio
 import socket
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx2
@@ -13,7 +15,9 @@ import fastmcp
 from fastmcp.server.auth.ssrf import (
     SSRFError,
     SSRFFetchError,
+    _dns_cache,
     is_ip_allowed,
+    resolve_hostname,
     ssrf_safe_fetch,
     validate_url,
 )
@@ -351,6 +355,116 @@ class TestSSRFSafeFetch:
                 await ssrf_safe_fetch("https://example.com/api")
 
 
+class CountingResolver:
+    """Stands in for socket.getaddrinfo, counting lookups per host."""
+
+    def __init__(self, answers: dict[str, list[str] | None]):
+        self.answers = answers
+        self.calls: dict[str, int] = {}
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, host: str, port: int, *args, **kwargs):
+        self.calls[host] = self.calls.get(host, 0) + 1
+        self.release.wait(timeout=5)
+        ips = self.answers.get(host)
+        if ips is None:
+            raise socket.gaierror("Name or service not known")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip, port)) for ip in ips]
+
+
+class TestDNSCache:
+    """Tests for cached, coalesced hostname resolution."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        _dns_cache.clear()
+        yield
+        _dns_cache.clear()
+
+    @pytest.fixture
+    def resolver(self, monkeypatch) -> CountingResolver:
+        resolver = CountingResolver(
+            {
+                "public.example.com": ["93.184.216.34"],
+                "private.example.com": ["10.0.0.1"],
+            }
+        )
+        monkeypatch.setattr(socket, "getaddrinfo", resolver)
+        return resolver
+
+    async def test_results_are_cached(self, resolver: CountingResolver):
+        for _ in range(5):
+            assert await resolve_hostname("public.example.com") == ["93.184.216.34"]
+
+        assert resolver.calls == {"public.example.com": 1}
+
+    async def test_cache_expires_after_ttl(self, resolver: CountingResolver):
+        with temporary_settings(ssrf_dns_cache_ttl=0.05):
+            await resolve_hostname("public.example.com")
+            await asyncio.sleep(0.1)
+            await resolve_hostname("public.example.com")
+
+        assert resolver.calls == {"public.example.com": 2}
+
+    async def test_zero_ttl_disables_cache(self, resolver: CountingResolver):
+        with temporary_settings(ssrf_dns_cache_ttl=0):
+            await resolve_hostname("public.example.com")
+            await resolve_hostname("public.example.com")
+
+        assert resolver.calls == {"public.example.com": 2}
+
+    async def test_failures_are_negatively_cached(self, resolver: CountingResolver):
+        for _ in range(3):
+            with pytest.raises(SSRFError, match="DNS resolution failed"):
+                await resolve_hostname("missing.example.com")
+
+        assert resolver.calls == {"missing.example.com": 1}
+
+        with temporary_settings(ssrf_dns_negative_cache_ttl=0):
+            _dns_cache.clear()
+            for _ in range(2):
+                with pytest.raises(SSRFError):
+                    await resolve_hostname("missing.example.com")
+        assert resolver.calls == {"missing.example.com": 3}
+
+    async def test_concurrent_lookups_are_coalesced(self, resolver: CountingResolver):
+        resolver.release.clear()
+        lookups = [
+            asyncio.create_task(resolve_hostname("public.example.com"))
+            for _ in range(50)
+        ]
+        await asyncio.sleep(0.05)
+        resolver.release.set()
+
+        results = await asyncio.gather(*lookups)
+        assert all(ips == ["93.184.216.34"] for ips in results)
+        assert resolver.calls == {"public.example.com": 1}
+
+    async def test_cached_blocked_ips_are_rejected_on_every_use(
+        self, resolver: CountingResolver
+    ):
+        for _ in range(3):
+            with pytest.raises(SSRFError, match="blocked IP"):
+                await validate_url("https://private.example.com/jwks.json")
+
+        assert resolver.calls == {"private.example.com": 1}
+
+    async def test_cache_is_bounded(self, resolver: CountingResolver, monkeypatch):
+        monkeypatch.setattr(_dns_cache, "max_entries", 2)
+        resolver.answers.update(
+            {"a.example.com": ["1.1.1.1"], "b.example.com": ["1.0.0.1"]}
+        )
+
+        await resolve_hostname("public.example.com")
+        await resolve_hostname("a.example.com")
+        await resolve_hostname("b.example.com")
+        await resolve_hostname("public.example.com")
+
+        assert resolver.calls["public.example.com"] == 2
+        assert len(_dns_cache._entries) == 2
+
+
 class TestJWKSSSRFProtection:
     """Tests for SSRF protection in JWTVerifier JWKS fetching."""
 
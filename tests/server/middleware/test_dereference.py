@@ -1,10 +1,14 @@
 """Tests for DereferenceRefsMiddleware."""
 
 from enum import Enum
+from unittest.mock import patch
 
 import pydantic
+import pytest
 
 from fastmcp import Client, FastMCP
+from fastmcp.server.middleware.dereference import DereferenceRefsMiddleware
+from fastmcp.utilities.json_schema import dereference_refs
 
 
 class Color(Enum):
@@ -134,3 +138,69 @@ class TestDereferenceRefsMiddleware:
         # Simple schema should not have $defs regardless
         assert "$defs" not in schema
         assert schema["properties"]["a"]["type"] == "integer"
+
+
+class TestDereferenceCache:
+    async def test_repeated_listings_reuse_dereferenced_schemas(self):
+        mcp = FastMCP("test")
+
+        @mcp.tool
+        def paint(request: PaintRequest) -> PaintRequest:
+            return request
+
+        @mcp.resource("paint://{color}")
+        def swatch(color: Color) -> str:
+            return color.value
+
+        with patch(
+            "fastmcp.server.middleware.dereference.dereference_refs",
+            wraps=dereference_refs,
+        ) as deref:
+            first = await mcp.list_tools()
+            await mcp.list_resource_templates()
+            calls_after_first = deref.call_count
+            for _ in range(3):
+                again = await mcp.list_tools()
+                await mcp.list_resource_templates()
+
+        assert calls_after_first > 0
+        assert deref.call_count == calls_after_first
+        assert again[0].parameters == first[0].parameters
+        assert "$defs" not in again[0].parameters
+
+    async def test_changed_schema_is_dereferenced_again(self):
+        middleware = DereferenceRefsMiddleware()
+        schema = PaintRequest.model_json_schema()
+
+        first = middleware._dereference(schema)
+        schema["$defs"]["Color"]["enum"].append("purple")
+        second = middleware._dereference(schema)
+
+        assert "purple" not in str(first)
+        assert "purple" in str(second)
+
+    def test_editing_a_result_does_not_corrupt_the_cache(self):
+        middleware = DereferenceRefsMiddleware()
+        schema = PaintRequest.model_json_schema()
+
+        first = middleware._dereference(schema)
+        first["properties"]["color"]["enum"].append("purple")
+        first["x-edited"] = True
+        second = middleware._dereference(schema)
+        second["properties"]["color"]["enum"].append("orange")
+        third = middleware._dereference(schema)
+
+        assert third == dereference_refs(schema)
+        assert third is not second
+
+    def test_cache_is_bounded(self):
+        middleware = DereferenceRefsMiddleware(cache_size=2)
+        for i in range(5):
+            schema = PaintRequest.model_json_schema()
+            schema["title"] = f"Request{i}"
+            middleware._dereference(schema)
+        assert len(middleware._cache) == 2
+
+    def test_invalid_cache_size(self):
+        with pytest.raises(ValueError, match="cache_size"):
+            DereferenceRefsMiddleware(cache_size=0)
@@ -623,3 +623,106 @@ class TestApplyMiddlewareParameter:
             "add", {"a": 5, "b": 3}, run_middleware=False
         )
         assert result_without.structured_content["result"] == 8  # type: ignore[union-attr,index]  # ty:ignore[not-subscriptable]
+
+
+class TestCompiledMiddlewareChain:
+    async def test_only_overridden_hooks_are_chained(self):
+        class CallToolOnly(Middleware):
+            async def on_call_tool(self, context, call_next):
+                return await call_next(context)
+
+        middleware = CallToolOnly()
+        server = FastMCP(dereference_schemas=False)
+        server.add_middleware(middleware)
+
+        (step,) = server._compiled_middleware("tools/call", "request", "all")
+        assert step.handler == middleware.on_call_tool
+        assert server._compiled_middleware("prompts/list", "request", "all") == ()
+
+    async def test_chain_is_reused_until_middleware_changes(self):
+        class Counting(Middleware):
+            async def on_call_tool(self, context, call_next):
+                return await call_next(context)
+
+        server = FastMCP(dereference_schemas=False)
+        server.add_middleware(Counting())
+        first = server._compiled_middleware("tools/call", "request", "all")
+        assert server._compiled_middleware("tools/call", "request", "all") is first
+
+        server.add_middleware(Counting())
+        assert len(server._compiled_middleware("tools/call", "request", "all")) == 2
+
+        # Direct mutation of the public list is picked up too.
+        server.middleware.pop()
+        assert len(server._compiled_middleware("tools/call", "request", "all")) == 1
+
+    async def test_equal_but_distinct_middleware_recompiles(self):
+        class AlwaysEqual(Middleware):
+            def __eq__(self, other: object) -> bool:
+                return isinstance(other, AlwaysEqual)
+
+            __hash__ = object.__hash__
+
+            async def on_call_tool(self, context, call_next):
+                return await call_next(context)
+
+        server = FastMCP(dereference_schemas=False)
+        server.middleware = [AlwaysEqual()]
+        server._compiled_middleware("tools/call", "request", "all")
+
+        replacement = AlwaysEqual()
+        server.middleware = [replacement]
+        (step,) = server._compiled_middleware("tools/call", "request", "all")
+        assert step.handler == replacement.on_call_tool
+
+    async def test_custom_call_override_runs_for_every_message(self):
+        seen: list[str | None] = []
+
+        class CustomCall(Middleware):
+            async def __call__(self, context, call_next):
+                seen.append(context.method)
+                return await call_next(context)
+
+        server = FastMCP(dereference_schemas=False)
+
+        @server.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        server.add_middleware(CustomCall())
+        await server.list_prompts()
+        await server.call_tool("add", {"a": 1, "b": 2})
+
+        assert seen == ["prompts/list", "tools/call"]
+
+    async def test_hooks_run_in_registration_order(self):
+        order: list[str] = []
+
+        class Named(Middleware):
+            def __init__(self, name: str):
+                self.name = name
+
+            async def on_message(self, context, call_next):
+                order.append(f"{self.name}:message")
+                return await call_next(context)
+
+            async def on_call_tool(self, context, call_next):
+                order.append(f"{self.name}:call_tool")
+                return await call_next(context)
+
+        server = FastMCP(dereference_schemas=False)
+
+        @server.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        server.add_middleware(Named("outer"))
+        server.add_middleware(Named("inner"))
+        await server.call_tool("add", {"a": 1, "b": 2})
+
+        assert order == [
+            "outer:message",
+            "outer:call_tool",
+            "inner:message",
+            "inner:call_tool",
+        ]
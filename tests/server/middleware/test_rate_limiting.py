@@ -1,17 +1,21 @@
 """Tests for rate limiting middleware."""
 
 import asyncio
+import sys
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from burner_redis import BurnerRedis
 from mcp import MCPError
 
 from fastmcp import FastMCP
 from fastmcp.client import Client
 from fastmcp.server.middleware.middleware import MiddlewareContext
 from fastmcp.server.middleware.rate_limiting import (
+    InMemoryRateLimitBackend,
     RateLimitError,
     RateLimitingMiddleware,
+    RedisRateLimitBackend,
     SlidingWindowRateLimiter,
     SlidingWindowRateLimitingMiddleware,
     TokenBucketRateLimiter,
@@ -123,7 +127,8 @@ class TestSlidingWindowRateLimiter:
         limiter = SlidingWindowRateLimiter(max_requests=10, window_seconds=60)
         assert limiter.max_requests == 10
         assert limiter.window_seconds == 60
-        assert len(limiter.requests) == 0
+        assert limiter.current_count == 0
+        assert limiter.previous_count == 0
 
     async def test_is_allowed_success(self):
         """Test allowing requests within limit."""
@@ -166,6 +171,42 @@ class TestSlidingWindowRateLimiter:
         # Should be able to make requests again
         assert await limiter.is_allowed() is True
 
+    async def test_previous_window_is_weighted_by_overlap(self, monkeypatch):
+        """The previous window counts in proportion to its remaining overlap."""
+        current_time = 100.0
+        monkeypatch.setattr(
+            "fastmcp.server.middleware.rate_limiting.time.time",
+            lambda: current_time,
+        )
+
+        limiter = SlidingWindowRateLimiter(max_requests=10, window_seconds=10)
+        for _ in range(10):
+            assert await limiter.is_allowed() is True
+        assert await limiter.is_allowed() is False
+
+        # A quarter into the next window, 75% of the previous 10 requests
+        # still count, leaving room for 3 more.
+        current_time = 112.5
+        results = [await limiter.is_allowed() for _ in range(4)]
+        assert results == [True, True, True, False]
+
+        # Two windows later nothing overlaps.
+        current_time = 130.0
+        assert await limiter.is_allowed() is True
+        assert limiter.previous_count == 0
+        assert limiter.current_count == 1
+
+    async def test_memory_is_constant_per_client(self):
+        limiter = SlidingWindowRateLimiter(max_requests=10_000, window_seconds=60)
+        size = sys.getsizeof(limiter)
+
+        for _ in range(5_000):
+            assert await limiter.is_allowed() is True
+
+        assert limiter.current_count == 5_000
+        assert sys.getsizeof(limiter) == size
+        assert not hasattr(limiter, "__dict__")
+
 
 class TestRateLimitingMiddleware:
     """Test rate limiting middleware."""
@@ -574,3 +615,210 @@ class TestRateLimitingMiddlewareIntegration:
             # Should be able to make another request
             result = await client.call_tool("quick_action", {"message": "after_wait"})
             assert "after_wait" in str(result)
+
+
+class TestInMemoryRateLimitBackend:
+    """Test eviction of idle clients from the in-memory backend."""
+
+    async def test_reset_clients_are_evicted(self, monkeypatch):
+        current_time = 0.0
+        monkeypatch.setattr(
+            "fastmcp.server.middleware.rate_limiting.time.time",
+            lambda: current_time,
+        )
+        backend = InMemoryRateLimitBackend()
+
+        await backend.consume_token("idle", 10, 5.0)
+        await backend.record_request("idle", 10, 60)
+
+        # The bucket refills in 0.2s; the window empties after two windows.
+        current_time = 1.0
+        await backend.consume_token("active", 10, 5.0)
+        await backend.record_request("active", 10, 60)
+        assert list(backend.token_buckets) == ["active"]
+        assert list(backend.sliding_windows) == ["idle", "active"]
+
+        current_time = 120.0
+        await backend.record_request("late", 10, 60)
+        assert list(backend.sliding_windows) == ["late"]
+
+    async def test_limited_clients_are_kept(self, monkeypatch):
+        current_time = 0.0
+        monkeypatch.setattr(
+            "fastmcp.server.middleware.rate_limiting.time.time",
+            lambda: current_time,
+        )
+        backend = InMemoryRateLimitBackend()
+
+        assert await backend.consume_token("a", 1, 0.1) is True
+        current_time = 5.0
+        await backend.consume_token("b", 1, 0.1)
+
+        assert await backend.consume_token("a", 1, 0.1) is False
+
+    async def test_least_recently_used_client_is_evicted(self):
+        backend = InMemoryRateLimitBackend(max_clients=2)
+
+        await backend.consume_token("a", 10, 0.001)
+        await backend.consume_token("b", 10, 0.001)
+        await backend.consume_token("a", 10, 0.001)
+        await backend.consume_token("c", 10, 0.001)
+
+        assert list(backend.token_buckets) == ["a", "c"]
+
+    async def test_memory_is_bounded_across_many_clients(self):
+        backend = InMemoryRateLimitBackend(max_clients=1_000)
+        middleware = SlidingWindowRateLimitingMiddleware(
+            max_requests=100, backend=backend
+        )
+
+        def footprint() -> int:
+            return sum(
+                sys.getsizeof(limiters) + sum(map(sys.getsizeof, limiters.values()))
+                for limiters in (backend.token_buckets, backend.sliding_windows)
+            )
+
+        baseline = 0
+        for i in range(100_000):
+            await backend.consume_token(f"client-{i}", 10, 0.001)
+            await backend.record_request(f"client-{i}", 10, 60)
+            if i == 10_000:
+                baseline = footprint()
+
+        assert len(backend.token_buckets) == 1_000
+        assert len(middleware.limiters) == 1_000
+        # Another 90k clients must not grow the tables.
+        assert footprint() == baseline
+
+    def test_invalid_max_clients(self):
+        with pytest.raises(ValueError, match="max_clients"):
+            InMemoryRateLimitBackend(max_clients=0)
+
+
+class TestRedisRateLimitBackend:
+    """Test the Redis backend against an in-process Redis."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = {"now": 1000.0}
+        monkeypatch.setattr(
+            "fastmcp.server.middleware.rate_limiting.time.time",
+            lambda: clock["now"],
+        )
+        return clock
+
+    async def test_token_bucket(self, clock):
+        backend = RedisRateLimitBackend(BurnerRedis())
+
+        results = [await backend.consume_token("a", 3, 10.0) for _ in range(4)]
+        assert results == [True, True, True, False]
+
+        clock["now"] += 0.25
+        assert await backend.consume_token("a", 3, 10.0) is True
+        assert await backend.consume_token("a", 3, 10.0) is True
+        assert await backend.consume_token("a", 3, 10.0) is False
+
+    async def test_token_bucket_matches_in_memory(self, clock):
+        redis_backend = RedisRateLimitBackend(BurnerRedis())
+        memory_backend = InMemoryRateLimitBackend()
+
+        for step in [0.0, 0.0, 0.05, 0.0, 0.3, 0.0, 0.0, 0.01, 1.0, 0.0, 0.0]:
+            clock["now"] += step
+            assert await redis_backend.consume_token(
+                "a", 2, 5.0
+            ) == await memory_backend.consume_token("a", 2, 5.0)
+
+    async def test_token_bucket_ignores_a_clock_behind(self, clock):
+        redis = BurnerRedis()
+        backend = RedisRateLimitBackend(redis)
+
+        assert await backend.consume_token("a", 1, 1.0) is True
+        # A replica whose clock is 10s behind must not rewind the refill time...
+        clock["now"] -= 10.0
+        assert await backend.consume_token("a", 1, 1.0) is False
+        stored = await redis.hget("fastmcp:ratelimit:bucket:a", "last_refill")
+        assert float(stored) == 1000.0
+
+        # ...or the next correct caller would be credited the same 10s again.
+        clock["now"] = 1000.5
+        assert await backend.consume_token("a", 1, 1.0) is False
+
+    async def test_token_buckets_are_per_key(self, clock):
+        backend = RedisRateLimitBackend(BurnerRedis())
+
+        assert await backend.consume_token("a", 1, 1.0) is True
+        assert await backend.consume_token("a", 1, 1.0) is False
+        assert await backend.consume_token("b", 1, 1.0) is True
+
+    async def test_sliding_window(self, clock):
+        backend = RedisRateLimitBackend(BurnerRedis())
+
+        results = [await backend.record_request("a", 2, 1) for _ in range(3)]
+        assert results == [True, True, False]
+
+        clock["now"] += 1.1
+        assert await backend.record_request("a", 2, 1) is True
+
+    async def test_sliding_window_matches_in_memory(self, clock):
+        redis_backend = RedisRateLimitBackend(BurnerRedis())
+        memory_backend = InMemoryRateLimitBackend()
+
+        for step in [0.0, 0.0, 0.0, 0.0, 4.0, 3.5, 0.0, 0.0, 1.0, 0.0, 25.0, 0.0]:
+            clock["now"] += step
+            assert await redis_backend.record_request(
+                "a", 3, 5
+            ) == await memory_backend.record_request("a", 3, 5)
+
+    async def test_replicas_share_limits(self, clock):
+        redis = BurnerRedis()
+        replica_a = RedisRateLimitBackend(redis)
+        replica_b = RedisRateLimitBackend(redis)
+
+        assert await replica_a.consume_token("client", 2, 1.0) is True
+        assert await replica_b.consume_token("client", 2, 1.0) is True
+        assert await replica_a.consume_token("client", 2, 1.0) is False
+        assert await replica_b.consume_token("client", 2, 1.0) is False
+
+    async def test_key_prefix_isolates_limits(self, clock):
+        redis = BurnerRedis()
+        tools = RedisRateLimitBackend(redis, key_prefix="tools:")
+        prompts = RedisRateLimitBackend(redis, key_prefix="prompts:")
+
+        assert await tools.consume_token("client", 1, 1.0) is True
+        assert await tools.consume_token("client", 1, 1.0) is False
+        assert await prompts.consume_token("client", 1, 1.0) is True
+        assert await redis.exists("tools:bucket:client", "prompts:bucket:client") == 2
+
+    async def test_idle_keys_expire(self, clock):
+        redis = BurnerRedis()
+        backend = RedisRateLimitBackend(redis)
+
+        await backend.consume_token("a", 10, 5.0)
+        await backend.record_request("a", 10, 60)
+
+        assert 0 < await redis.ttl("fastmcp:ratelimit:bucket:a") <= 3
+        assert 60 < await redis.ttl("fastmcp:ratelimit:window:a") <= 120
+
+    async def test_middlewares_use_backend(self, mock_context, mock_call_next, clock):
+        redis = BurnerRedis()
+        bucket = RateLimitingMiddleware(
+            max_requests_per_second=1.0,
+            burst_capacity=1,
+            backend=RedisRateLimitBackend(redis),
+        )
+        window = SlidingWindowRateLimitingMiddleware(
+            max_requests=1, backend=RedisRateLimitBackend(redis)
+        )
+
+        for middleware in [bucket, window]:
+            await middleware.on_request(mock_context, mock_call_next)
+            with pytest.raises(RateLimitError):
+                await middleware.on_request(mock_context, mock_call_next)
+
+    def test_limiters_require_in_memory_backend(self):
+        middleware = RateLimitingMiddleware(
+            backend=RedisRateLimitBackend(BurnerRedis())
+        )
+
+        with pytest.raises(TypeError, match="in-memory backend"):
+            middleware.limiters
@@ -1,11 +1,23 @@
 """Tests for ResponseLimitingMiddleware."""
 
+from unittest.mock import AsyncMock, MagicMock
+
+import pydantic_core
 import pytest
-from mcp_types import ImageContent, TextContent
+from mcp_types import (
+    EmbeddedResource,
+    ImageContent,
+    TextContent,
+    TextResourceContents,
+)
 from pydantic import BaseModel
 
 from fastmcp import Client, FastMCP
-from fastmcp.server.middleware.response_limiting import ResponseLimitingMiddleware
+from fastmcp.server.middleware.response_limiting import (
+    ResponseLimitingMiddleware,
+    _estimate_json_size,
+    _join_prefix,
+)
 from fastmcp.tools.base import ToolResult
 
 
@@ -179,3 +191,94 @@ class TestResponseLimitingMiddleware:
         content = result.content[0]
         assert isinstance(content, TextContent)
         content.text.encode("utf-8")
+
+
+class TestSizeEstimation:
+    """Tests for incremental size estimation and slicing truncation."""
+
+    @pytest.mark.parametrize(
+        "result",
+        [
+            ToolResult(content=[TextContent(type="text", text="hello")]),
+            ToolResult(
+                content=[TextContent(type="text", text='quote " slash \\ tab\t é 🌍\n')]
+            ),
+            ToolResult(
+                content=[TextContent(type="text", text="bell\x07 nul\x00 \x1f\x08\x0c")]
+            ),
+            ToolResult(
+                content=[
+                    ImageContent(type="image", data="x" * 100, mime_type="image/png"),
+                    EmbeddedResource(
+                        type="resource",
+                        resource=TextResourceContents(
+                            uri="file:///a.txt", text="body" * 10
+                        ),
+                    ),
+                ],
+                structured_content={"a": [1, 2.5, None, True, "x"], "b": {}},
+                meta={"trace": "abc"},
+            ),
+        ],
+    )
+    def test_estimate_matches_serialized_size(self, result: ToolResult):
+        serialized = pydantic_core.to_json(result, fallback=str)
+        assert _estimate_json_size(result, 1_000_000) == len(serialized)
+
+    async def test_control_characters_count_as_escapes(self):
+        """Six-byte \\u00XX escapes push a short string over the limit."""
+        middleware = ResponseLimitingMiddleware(max_size=200_000)
+        context = MagicMock()
+        context.message.name = "binaryish"
+        result = ToolResult(content=[TextContent(type="text", text="\x01" * 100_000)])
+
+        assert _estimate_json_size(result, 1_000_000) == len(
+            pydantic_core.to_json(result)
+        )
+        limited = await middleware.on_call_tool(context, AsyncMock(return_value=result))
+        text = limited.content[0]
+        assert isinstance(text, TextContent)
+        assert text.text.startswith("\x01" * 100)
+        assert len(pydantic_core.to_json(text.text)) < 200_000
+
+    def test_estimate_stops_once_over_budget(self):
+        blocks = [TextContent(type="text", text="x" * 1_000) for _ in range(1_000)]
+        result = ToolResult(content=blocks)
+
+        assert 100 < _estimate_json_size(result, 100) < 2_000
+
+    def test_join_prefix_copies_only_what_fits(self):
+        texts = ["a" * 10, "b" * 10, "c" * 10]
+
+        assert _join_prefix(texts, 15) == "a" * 10 + "\n\n" + "bbb"
+        assert _join_prefix(texts, 1_000) == "\n\n".join(texts)
+        assert _join_prefix(texts, 0) == ""
+        assert _join_prefix(texts, 11) == "a" * 10 + "\n\n"
+
+    async def test_large_text_results_are_never_serialized(self, monkeypatch):
+        """Oversized text results are truncated without a full dump."""
+        real_to_json = pydantic_core.to_json
+
+        def small_only(value, **kwargs):
+            # Measuring the short truncated text is fine; the result is not.
+            assert isinstance(value, str) and len(value) <= 1_000
+            return real_to_json(value, **kwargs)
+
+        to_json = MagicMock(side_effect=small_only)
+        monkeypatch.setattr(
+            "fastmcp.server.middleware.response_limiting.pydantic_core.to_json",
+            to_json,
+        )
+        middleware = ResponseLimitingMiddleware(max_size=1_000)
+        context = MagicMock()
+        context.message.name = "big"
+        big = ToolResult(
+            content=[TextContent(type="text", text="é" * 5_000_000)] * 2,
+        )
+
+        result = await middleware.on_call_tool(context, AsyncMock(return_value=big))
+
+        text = result.content[0]
+        assert isinstance(text, TextContent)
+        assert text.text.startswith("é" * 100)
+        assert len(text.text.encode("utf-8")) < 1_000
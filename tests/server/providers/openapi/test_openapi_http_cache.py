@@ -0,0 +1,179 @@
+"""Tests for HTTP response caching of OpenAPI resource reads."""
+
+from typing import Any
+
+import httpx2
+import pytest
+from key_value.aio.stores.memory import MemoryStore
+
+from fastmcp import FastMCP
+from fastmcp.server.providers.openapi import (
+    MCPType,
+    OpenAPIHTTPCache,
+    OpenAPIProvider,
+    RouteMap,
+)
+
+ROUTE_MAPS = [
+    RouteMap(
+        methods=["GET"], pattern=r".*\{.*\}.*", mcp_type=MCPType.RESOURCE_TEMPLATE
+    ),
+    RouteMap(methods=["GET"], mcp_type=MCPType.RESOURCE),
+]
+
+SPEC: dict[str, Any] = {
+    "openapi": "3.0.0",
+    "info": {"title": "Cached API", "version": "1.0.0"},
+    "servers": [{"url": "https://api.example.com"}],
+    "paths": {
+        "/status": {
+            "get": {
+                "operationId": "get_status",
+                "responses": {"200": {"description": ""}},
+            }
+        },
+        "/users/{user_id}": {
+            "get": {
+                "operationId": "get_user",
+                "parameters": [
+                    {
+                        "name": "user_id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "integer"},
+                    }
+                ],
+                "responses": {"200": {"description": ""}},
+            }
+        },
+    },
+}
+
+
+class Upstream:
+    """Mock API that records requests and replies with configurable headers."""
+
+    def __init__(self, headers: dict[str, str] | None = None):
+        self.headers = headers or {}
+        self.requests: list[httpx2.Request] = []
+        self.version = 1
+
+    def __call__(self, request: httpx2.Request) -> httpx2.Response:
+        self.requests.append(request)
+        etag = f'"v{self.version}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx2.Response(304, headers=self.headers)
+        return httpx2.Response(
+            200,
+            json={"path": request.url.path, "version": self.version},
+            headers={**self.headers, "etag": etag},
+        )
+
+
+def make_server(upstream: Upstream, cache: OpenAPIHTTPCache | None = None) -> FastMCP:
+    client = httpx2.AsyncClient(
+        base_url="https://api.example.com", transport=httpx2.MockTransport(upstream)
+    )
+    provider = OpenAPIProvider(
+        SPEC,
+        client=client,
+        route_maps=ROUTE_MAPS,
+        http_cache=cache or OpenAPIHTTPCache(),
+    )
+    return FastMCP(providers=[provider])
+
+
+async def read(mcp: FastMCP, uri: str) -> str:
+    result = await mcp.read_resource(uri)
+    return str(result.contents[0].content)
+
+
+class TestOpenAPIHTTPCache:
+    async def test_fresh_response_is_served_from_cache(self):
+        upstream = Upstream({"cache-control": "max-age=60"})
+        mcp = make_server(upstream)
+
+        first = await read(mcp, "resource://get_status")
+        upstream.version = 2
+        second = await read(mcp, "resource://get_status")
+
+        assert first == second
+        assert '"version": 1' in second
+        assert len(upstream.requests) == 1
+
+    async def test_stale_response_is_revalidated(self):
+        upstream = Upstream({"cache-control": "no-cache"})
+        mcp = make_server(upstream)
+
+        await read(mcp, "resource://get_status")
+        second = await read(mcp, "resource://get_status")
+
+        assert '"version": 1' in second
+        assert len(upstream.requests) == 2
+        assert upstream.requests[1].headers["if-none-match"] == '"v1"'
+
+        upstream.version = 2
+        third = await read(mcp, "resource://get_status")
+        assert '"version": 2' in third
+
+    async def test_templates_cache_per_uri(self):
+        upstream = Upstream({"cache-control": "max-age=60"})
+        mcp = make_server(upstream)
+
+        for _ in range(2):
+            assert '"/users/1"' in await read(mcp, "resource://get_user/1")
+            assert '"/users/2"' in await read(mcp, "resource://get_user/2")
+
+        assert [r.url.path for r in upstream.requests] == ["/users/1", "/users/2"]
+
+    async def test_no_store_is_never_cached(self):
+        upstream = Upstream({"cache-control": "no-store"})
+        mcp = make_server(upstream)
+
+        await read(mcp, "resource://get_status")
+        await read(mcp, "resource://get_status")
+
+        assert len(upstream.requests) == 2
+        assert "if-none-match" not in upstream.requests[1].headers
+
+    async def test_entries_are_partitioned_by_auth_headers(self):
+        upstream = Upstream({"cache-control": "max-age=60"})
+        cache = OpenAPIHTTPCache()
+
+        async def send(request: httpx2.Request) -> httpx2.Response:
+            return upstream(request)
+
+        for token in ["alice", "bob", "alice"]:
+            request = httpx2.Request(
+                "GET",
+                "https://api.example.com/status",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            await cache.send(request, send)
+
+        assert [r.headers["authorization"] for r in upstream.requests] == [
+            "Bearer alice",
+            "Bearer bob",
+        ]
+
+    async def test_pluggable_storage(self):
+        store = MemoryStore()
+        upstream = Upstream({"cache-control": "max-age=60"})
+        mcp = make_server(upstream, OpenAPIHTTPCache(store))
+
+        await read(mcp, "resource://get_status")
+
+        assert await store.keys(collection="openapi/http")
+
+    async def test_oversized_responses_are_not_cached(self):
+        upstream = Upstream({"cache-control": "max-age=60"})
+        mcp = make_server(upstream, OpenAPIHTTPCache(max_item_size=10))
+
+        await read(mcp, "resource://get_status")
+        await read(mcp, "resource://get_status")
+
+        assert len(upstream.requests) == 2
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError, match="max_entries"):
+            OpenAPIHTTPCache(max_entries=0)
@@ -0,0 +1,229 @@
+"""Tests for lazy component materialization in OpenAPIProvider."""
+
+from typing import Any
+
+import httpx2
+import pytest
+
+from fastmcp import FastMCP
+from fastmcp.server.providers.openapi import MCPType, OpenAPIProvider, RouteMap
+
+ROUTE_MAPS = [
+    RouteMap(
+        methods=["GET"], pattern=r".*\{.*\}.*", mcp_type=MCPType.RESOURCE_TEMPLATE
+    ),
+    RouteMap(methods=["GET"], mcp_type=MCPType.RESOURCE),
+]
+
+
+def make_spec(num_items: int = 5) -> dict[str, Any]:
+    paths: dict[str, Any] = {
+        f"/items_{i}": {
+            "post": {
+                "operationId": f"create_item_{i}",
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {"name": {"type": "string"}},
+                                "required": ["name"],
+                            }
+                        }
+                    },
+                },
+                "responses": {
+                    "200": {
+                        "description": "Created",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {"id": {"type": "integer"}},
+                                }
+                            }
+                        },
+                    }
+                },
+            }
+        }
+        for i in range(num_items)
+    }
+    paths["/status"] = {
+        "get": {"operationId": "get_status", "responses": {"200": {"description": ""}}}
+    }
+    paths["/users/{user_id}"] = {
+        "get": {
+            "operationId": "get_user",
+            "parameters": [
+                {
+                    "name": "user_id",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "integer"},
+                }
+            ],
+            "responses": {"200": {"description": ""}},
+        }
+    }
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Lazy API", "version": "1.0.0"},
+        "servers": [{"url": "https://api.example.com"}],
+        "paths": paths,
+    }
+
+
+def handler(request: httpx2.Request) -> httpx2.Response:
+    if request.url.path.startswith("/users/"):
+        return httpx2.Response(200, json={"id": int(request.url.path.split("/")[-1])})
+    if request.url.path == "/status":
+        return httpx2.Response(200, json={"ok": True})
+    return httpx2.Response(200, json={"id": 1})
+
+
+def make_provider(num_items: int = 5, **kwargs: Any) -> OpenAPIProvider:
+    client = httpx2.AsyncClient(
+        base_url="https://api.example.com", transport=httpx2.MockTransport(handler)
+    )
+    return OpenAPIProvider(
+        make_spec(num_items), client=client, route_maps=ROUTE_MAPS, **kwargs
+    )
+
+
+class TestLazyOpenAPIProvider:
+    async def test_lazy_lists_same_components_as_eager(self):
+        eager = FastMCP(providers=[make_provider()])
+        lazy = FastMCP(providers=[make_provider(lazy=True)])
+
+        eager_tools = {t.name: t for t in await eager.list_tools()}
+        lazy_tools = {t.name: t for t in await lazy.list_tools()}
+        assert lazy_tools.keys() == eager_tools.keys()
+        for name, tool in eager_tools.items():
+            assert lazy_tools[name].parameters == tool.parameters
+            assert lazy_tools[name].output_schema == tool.output_schema
+
+        assert [str(r.uri) for r in await lazy.list_resources()] == [
+            str(r.uri) for r in await eager.list_resources()
+        ]
+        assert [t.uri_template for t in await lazy.list_resource_templates()] == [
+            t.uri_template for t in await eager.list_resource_templates()
+        ]
+
+    async def test_components_are_built_on_first_use(self):
+        provider = make_provider(lazy=True)
+        assert provider._materialized == {}
+
+        mcp = FastMCP(providers=[provider])
+        result = await mcp.call_tool("create_item_3", {"name": "widget"})
+
+        assert result.structured_content == {"id": 1}
+        assert list(provider._materialized) == [("tool", "create_item_3")]
+
+    async def test_resources_and_templates_resolve_lazily(self):
+        provider = make_provider(lazy=True)
+        mcp = FastMCP(providers=[provider])
+
+        status = await mcp.read_resource("resource://get_status")
+        user = await mcp.read_resource("resource://get_user/7")
+
+        assert '"ok": true' in str(status.contents[0].content)
+        assert '"id": 7' in str(user.contents[0].content)
+        assert set(provider._materialized) == {
+            ("resource", "resource://get_status"),
+            ("resource_template", "resource://get_user/{user_id}"),
+        }
+
+    async def test_cache_size_bounds_looked_up_components(self):
+        provider = make_provider(num_items=20, lazy=True, lazy_cache_size=3)
+        mcp = FastMCP(providers=[provider])
+
+        for i in range(5):
+            assert await mcp.get_tool(f"create_item_{i}") is not None
+
+        assert list(provider._materialized) == [
+            ("tool", "create_item_2"),
+            ("tool", "create_item_3"),
+            ("tool", "create_item_4"),
+        ]
+
+        # An evicted component is rebuilt transparently.
+        tool = await mcp.get_tool("create_item_0")
+        assert tool is not None
+        assert ("tool", "create_item_0") in provider._materialized
+        assert len(provider._materialized) == 3
+
+    async def test_listing_keeps_at_most_cache_size_components(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        provider = make_provider(num_items=20, lazy=True, lazy_cache_size=3)
+        mcp = FastMCP(providers=[provider])
+        built: list[str] = []
+        build = provider._build_openapi_tool
+
+        def counting_build(route, name, tags):
+            built.append(name)
+            return build(route, name, tags)
+
+        monkeypatch.setattr(provider, "_build_openapi_tool", counting_build)
+
+        assert await mcp.get_tool("create_item_0") is not None
+        first = await mcp.list_tools()
+        assert len(first) == 20
+        # The looked-up component moved to the listed store; 19 were built.
+        assert len(built) == 20
+        assert list(provider._listed) == [
+            ("tool", "create_item_0"),
+            ("tool", "create_item_1"),
+            ("tool", "create_item_2"),
+        ]
+        assert provider._materialized == {}
+
+        built.clear()
+        assert len(await mcp.list_tools()) == 20
+        assert sorted(built) == sorted(f"create_item_{i}" for i in range(3, 20))
+        assert len(provider._listed) == 3
+
+        # Lookups still go through the LRU, untouched by the listings.
+        built.clear()
+        assert await mcp.get_tool("create_item_1") is not None
+        assert await mcp.get_tool("create_item_5") is not None
+        assert built == ["create_item_5"]
+        assert list(provider._materialized) == [("tool", "create_item_5")]
+
+    async def test_spec_is_parsed_once_at_startup(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        import fastmcp.server.providers.openapi.provider as provider_module
+
+        parses: list[object] = []
+        parse = provider_module.parse_openapi_to_http_routes
+
+        def counting_parse(spec):
+            parses.append(spec)
+            return parse(spec)
+
+        monkeypatch.setattr(
+            provider_module, "parse_openapi_to_http_routes", counting_parse
+        )
+
+        provider = make_provider(lazy=True)
+        assert len(parses) == 1
+        assert provider._materialized == {}
+
+        mcp = FastMCP(providers=[provider])
+        assert await mcp.get_tool("create_item_1") is not None
+        await mcp.list_tools()
+        assert len(parses) == 1
+
+    async def test_unknown_names_build_nothing(self):
+        provider = make_provider(lazy=True)
+        mcp = FastMCP(providers=[provider])
+
+        assert await mcp.get_tool("missing") is None
+        assert provider._materialized == {}
+
+    def test_invalid_cache_size(self):
+        with pytest.raises(ValueError, match="lazy_cache_size"):
+            make_provider(lazy=True, lazy_cache_size=0)
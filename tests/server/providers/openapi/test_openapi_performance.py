@@ -5,12 +5,14 @@ and don't regress to the slow performance we had before optimization.
 """
 
 import time
+from pathlib import Path
 from typing import Any
 
 import httpx2
 import pytest
 
 from fastmcp import FastMCP
+from fastmcp.server.providers.openapi import OpenAPIProvider
 
 
 class TestOpenAPIPerformance:
@@ -135,3 +137,85 @@ class TestOpenAPIPerformance:
             f"Medium schema parsing took {elapsed_time:.3f}s, expected <1s"
         )
         assert mcp_server is not None
+
+    def test_route_cache_cold_vs_cached_start(self, tmp_path: Path):
+        """
+        Compare provider start-up with an empty route cache (parse + write)
+        against a warm one (load only).
+
+        The synthetic spec leans on shared `$ref` components, which is where
+        parsing spends its time (ref resolution and schema dependency
+        extraction) and what the cache lets a restart skip.
+        """
+        schema: dict[str, Any] = {
+            "openapi": "3.0.0",
+            "info": {"title": "Test API", "version": "1.0.0"},
+            "paths": {},
+            "components": {
+                "schemas": {
+                    f"Model{i}": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "name": {"type": "string"},
+                            "child": {
+                                "$ref": f"#/components/schemas/Model{(i + 1) % 20}"
+                            },
+                        },
+                    }
+                    for i in range(20)
+                }
+            },
+        }
+        for i in range(300):
+            model = {"$ref": f"#/components/schemas/Model{i % 20}"}
+            schema["paths"][f"/items/{i}/{{item_id}}"] = {
+                "put": {
+                    "operationId": f"update_item_{i}",
+                    "parameters": [
+                        {
+                            "name": "item_id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "integer"},
+                        },
+                        {
+                            "name": "dry_run",
+                            "in": "query",
+                            "schema": {"type": "boolean"},
+                        },
+                    ],
+                    "requestBody": {
+                        "required": True,
+                        "content": {"application/json": {"schema": model}},
+                    },
+                    "responses": {
+                        "200": {
+                            "description": "Updated",
+                            "content": {"application/json": {"schema": model}},
+                        }
+                    },
+                }
+            }
+
+        client = httpx2.AsyncClient(base_url="https://api.example.com")
+
+        start_time = time.perf_counter()
+        cold = OpenAPIProvider(schema, client=client, route_cache_dir=tmp_path)
+        cold_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        cached = OpenAPIProvider(schema, client=client, route_cache_dir=tmp_path)
+        cached_time = time.perf_counter() - start_time
+
+        print(
+            f"OpenAPI provider start: cold {cold_time:.3f}s, "
+            f"cached {cached_time:.3f}s ({cold_time / cached_time:.1f}x)"
+        )
+
+        assert cached._tools.keys() == cold._tools.keys()
+        assert len(cached._tools) == 300
+        assert cached_time < cold_time, (
+            f"Cached start ({cached_time:.3f}s) was not faster than a cold "
+            f"start ({cold_time:.3f}s)"
+        )
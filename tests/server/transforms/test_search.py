@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import math
 from collections.abc import Sequence
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import mcp_types
 import pytest
@@ -14,10 +15,14 @@ from fastmcp import Client, FastMCP
 from fastmcp.server.context import Context
 from fastmcp.server.middleware.middleware import CallNext, Middleware, MiddlewareContext
 from fastmcp.server.transforms import Visibility
+from fastmcp.server.transforms.search.base import (
+    _CatalogTracker,
+    _tool_fingerprint,
+)
 from fastmcp.server.transforms.search.bm25 import (
     BM25SearchTransform,
     _BM25Index,
-    _catalog_hash,
+    _tokenize,
 )
 from fastmcp.server.transforms.search.regex import RegexSearchTransform
 from fastmcp.tools.base import Tool, ToolResult
@@ -436,6 +441,74 @@ class TestBM25Index:
         index.build(["alpha beta gamma"])
         assert index.query("zzz", 5) == []
 
+    def test_scores_match_full_scan(self):
+        documents = [
+            "search database query records",
+            "search the web",
+            "database database backup",
+            "send email",
+            "",
+            "records retention policy for database records",
+        ]
+        index = _BM25Index()
+        index.build(documents)
+
+        tokenized = [_tokenize(doc) for doc in documents]
+        avg_dl = sum(map(len, tokenized)) / len(tokenized)
+
+        def score(tokens: list[str], query: str) -> float:
+            total = 0.0
+            for term in _tokenize(query):
+                df = sum(term in doc for doc in tokenized)
+                tf = tokens.count(term)
+                if not tf:
+                    continue
+                idf = math.log((len(tokenized) - df + 0.5) / (df + 0.5) + 1.0)
+                norm = 1 - index.b + index.b * len(tokens) / avg_dl
+                total += idf * tf * (index.k1 + 1) / (tf + index.k1 * norm)
+            return total
+
+        for query in ["database records", "search", "email database", "missing"]:
+            scores = [score(tokens, query) for tokens in tokenized]
+            expected = sorted(
+                (i for i, s in enumerate(scores) if s > 0),
+                key=lambda i: (-scores[i], i),
+            )
+            assert index.query(query, 10) == expected
+            assert index.query(query, 2) == expected[:2]
+
+    def test_ties_keep_catalog_order(self):
+        index = _BM25Index()
+        index.build(["alpha beta", "gamma delta", "alpha beta", "alpha beta"])
+        assert index.query("alpha", 2) == [0, 2]
+
+    def test_query_cost_tracks_matches_not_catalog_size(self):
+        """A query scores only the documents containing its terms."""
+
+        class CountingNorms(dict):
+            lookups = 0
+
+            def __getitem__(self, key):
+                CountingNorms.lookups += 1
+                return super().__getitem__(key)
+
+        for size in (1_000, 10_000):
+            documents = [
+                f"tool_{i} get record service{i % 97}"
+                + (" quarantine" if i % (size // 10) == 0 else "")
+                for i in range(size)
+            ]
+            index = _BM25Index()
+            index.build(documents)
+            norms = CountingNorms(index._length_norms())
+            CountingNorms.lookups = 0
+            with patch.object(index, "_length_norms", return_value=norms):
+                assert len(index.query("quarantine", 5)) == 5
+            # One score update per posting: the ten matching tools, not the
+            # whole catalog. Latency is tracked in
+            # scripts/benchmark_bm25_search.py.
+            assert CountingNorms.lookups == 10
+
 
 # ---------------------------------------------------------------------------
 # call_tool self-reference guard
@@ -487,13 +560,19 @@ class TestCallToolGuard:
 
 
 # ---------------------------------------------------------------------------
-# catalog hash staleness
+# catalog change tracking
 # ---------------------------------------------------------------------------
 
 
-class TestCatalogHash:
-    def test_hash_differs_for_same_name_different_description(self):
-        """Hash must change when a tool's description changes, not just its name."""
+def _tool(name: str, description: str) -> Tool:
+    def fn() -> None: ...
+
+    return Tool.from_function(fn=fn, name=name, description=description)
+
+
+class TestCatalogTracker:
+    def test_fingerprint_differs_for_same_name_different_description(self):
+        """Fingerprint must change when a tool's description changes, not just its name."""
         tool_a = MagicMock()
         tool_a.name = "search"
         tool_a.description = "find records in the database"
@@ -504,4 +583,72 @@ class TestCatalogHash:
         tool_b.description = "send an email to a recipient"
         tool_b.parameters = {}
 
-        assert _catalog_hash([tool_a]) != _catalog_hash([tool_b])
+        assert _tool_fingerprint(tool_a) != _tool_fingerprint(tool_b)
+
+    def test_sync_reports_only_changes(self):
+        tracker = _CatalogTracker()
+        add, send = _tool("add", "add numbers"), _tool("send", "send email")
+        assert tracker.sync([add, send]) == ([add, send], [])
+
+        # A different object with identical content is not a change...
+        add_copy = _tool("add", "add numbers")
+        assert tracker.sync([add_copy, send]) == ([], [])
+        assert tracker.tools["tool:add@"] is add_copy
+
+        # ...but new content, new tools, and removals are.
+        edited, weather = _tool("add", "sum numbers"), _tool("weather", "forecast")
+        assert tracker.sync([edited, weather]) == (
+            [edited, weather],
+            ["tool:send@"],
+        )
+
+    def test_in_place_edits_are_detected(self):
+        tracker = _CatalogTracker()
+        tools = [_tool(f"tool_{i}", "does things") for i in range(3)]
+        tracker.sync(tools)
+        assert tracker.sync(tools) == ([], [])
+
+        tools[1].description = "does other things"
+        assert tracker.sync(tools) == ([tools[1]], [])
+
+
+class TestBM25IncrementalIndex:
+    async def test_search_only_reindexes_changed_tools(self):
+        transform = BM25SearchTransform()
+        tools = [_tool(f"tool_{i}", f"handles widget {i}") for i in range(5)]
+        await transform._search(tools, "widget")
+
+        edited = _tool("tool_2", "forecasts weather")
+        with patch.object(transform._index, "add", wraps=transform._index.add) as add:
+            results = await transform._search(
+                [*tools[:2], edited, *tools[3:]], "weather"
+            )
+        assert results == [edited]
+        assert add.call_count == 1
+
+        results = await transform._search(tools[:1], "widget")
+        assert results == tools[:1]
+
+    async def test_ties_follow_catalog_order_after_readding(self):
+        transform = BM25SearchTransform()
+        first, second = _tool("first", "widget"), _tool("second", "widget")
+        await transform._search([first, second], "widget")
+        await transform._search([second], "widget")
+
+        # "first" comes back with a newer document id than "second".
+        assert await transform._search([first, second], "widget") == [first, second]
+
+    def test_index_add_and_remove_match_rebuild(self):
+        documents = ["alpha beta", "beta gamma gamma", "delta", "alpha alpha delta"]
+        incremental = _BM25Index()
+        incremental.build(["zeta", "alpha gamma", "omega omega"])
+        incremental.remove(2)
+        incremental.add(0, documents[0])
+        incremental.add(1, documents[1])
+        incremental.add(2, documents[2])
+        incremental.add(3, documents[3])
+
+        rebuilt = _BM25Index()
+        rebuilt.build(documents)
+        for query in ["alpha", "gamma delta", "beta", "zeta"]:
+            assert incremental.query(query, 5) == rebuilt.query(query, 5)
@@ -0,0 +1,210 @@
+"""Multiplexed task polling: one `TaskTracker` scheduler per client session.
+
+Every task a session waits on is polled from the session's tracker, which keeps
+a per-task backoff (capped by the server's advertised ``pollIntervalMs``, with
+jitter) and bounds the ``tasks/get`` requests in flight. Callers waiting on the
+same task share its polls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from datetime import timedelta
+
+import anyio
+import fastmcp_tasks.client as tasks_client
+import pytest
+from fastmcp_tasks.client import (
+    MAX_POLLS_IN_FLIGHT,
+    MIN_POLL_INTERVAL,
+    POLL_JITTER,
+    TaskTracker,
+    _jittered,
+    _poll_ceiling,
+    task_tracker,
+)
+from mcp.client.session import ClientSession
+
+from fastmcp import FastMCP
+from fastmcp.client import Client
+from fastmcp.utilities.tasks import TaskConfig
+from fastmcp_tasks import TasksExtension, call_tool_task
+
+
+class PollRecorder:
+    """Wraps `_send_get` to count polls per task and the peak in flight."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch):
+        self.polls: Counter[str] = Counter()
+        self.times: dict[str, list[float]] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        send_get = tasks_client._send_get
+
+        async def recording_send_get(
+            session: ClientSession, task_id: str, read_timeout_seconds=None
+        ):
+            self.polls[task_id] += 1
+            self.times.setdefault(task_id, []).append(asyncio.get_running_loop().time())
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                return await send_get(session, task_id, read_timeout_seconds)
+            finally:
+                self.in_flight -= 1
+
+        monkeypatch.setattr(tasks_client, "_send_get", recording_send_get)
+
+    @property
+    def total(self) -> int:
+        return sum(self.polls.values())
+
+
+@pytest.fixture
+def recorder(monkeypatch: pytest.MonkeyPatch) -> PollRecorder:
+    return PollRecorder(monkeypatch)
+
+
+def test_jitter_only_lengthens_the_delay():
+    for _ in range(100):
+        assert 0.5 <= _jittered(0.5) <= 0.5 * (1 + POLL_JITTER)
+
+
+@pytest.mark.timeout(15)
+async def test_awaiting_200_tasks_shares_one_scheduler(recorder: PollRecorder):
+    mcp = FastMCP("many-tasks")
+    mcp.add_extension(TasksExtension(concurrency=200))
+    release = asyncio.Event()
+
+    @mcp.tool(task=True)
+    async def square(n: int) -> int:
+        await release.wait()
+        return n * n
+
+    async with Client(mcp, mode="auto") as client:
+        tasks = [await call_tool_task(client, "square", {"n": n}) for n in range(200)]
+        tracker = task_tracker(client.session)
+
+        waiting = asyncio.gather(*(task.result() for task in tasks))
+        with anyio.fail_after(10):
+            while tracker.outstanding < 200:
+                await asyncio.sleep(0.01)
+        release.set()
+        results = await waiting
+
+    assert [r.data for r in results] == [n * n for n in range(200)]
+    assert tracker.outstanding == 0
+    assert set(recorder.polls) == {task.task_id for task in tasks}
+    # Released as soon as every task is tracked, each task's backoff (0.02s
+    # doubling, plus jitter) fits a few polls before release and one or two
+    # after it; the cap on requests in flight spreads them out further.
+    assert recorder.total <= 200 * 7
+    assert recorder.peak_in_flight <= MAX_POLLS_IN_FLIGHT
+    # Every task keeps its own backoff however slowly the polls were served:
+    # no gap between its polls is shorter than the ramp allows.
+    ceiling = _poll_ceiling(None)
+    for times in recorder.times.values():
+        gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+        floors = [min(MIN_POLL_INTERVAL * 2**i, ceiling) for i in range(len(gaps))]
+        assert all(gap >= floor * 0.9 for gap, floor in zip(gaps, floors))
+
+
+async def test_waiters_on_one_task_share_its_polls(recorder: PollRecorder):
+    mcp = FastMCP("shared-polls")
+    mcp.add_extension(TasksExtension())
+    release = asyncio.Event()
+
+    @mcp.tool(task=True)
+    async def gated() -> str:
+        await release.wait()
+        return "done"
+
+    async with Client(mcp, mode="auto") as client:
+        task = await call_tool_task(client, "gated", {})
+        tracker = task_tracker(client.session)
+
+        waiters = [
+            asyncio.create_task(task.wait(timeout=5)),
+            asyncio.create_task(task.wait(timeout=5)),
+            asyncio.create_task(task.result()),
+        ]
+        await asyncio.sleep(0.1)
+        assert tracker.outstanding == 1
+        polls_while_waiting = recorder.polls[task.task_id]
+        release.set()
+        first, second, result = await asyncio.gather(*waiters)
+
+    assert first.status == second.status == "completed"
+    assert result.data == "done"
+    # Three callers for 0.1s: the one ramp of 0.02, 0.04, 0.08... not three.
+    assert polls_while_waiting <= 4
+
+
+async def test_backoff_ramps_up_to_the_advertised_interval(recorder: PollRecorder):
+    mcp = FastMCP("advertised")
+    mcp.add_extension(TasksExtension())
+
+    @mcp.tool(task=TaskConfig(mode="optional", poll_interval=timedelta(seconds=0.1)))
+    async def slow() -> str:
+        await asyncio.sleep(0.6)
+        return "done"
+
+    async with Client(mcp, mode="auto") as client:
+        task = await call_tool_task(client, "slow", {})
+        assert (await task.wait(timeout=5)).status == "completed"
+
+    times = recorder.times[task.task_id]
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    floors = [min(MIN_POLL_INTERVAL * 2**i, 0.1) for i in range(len(gaps))]
+    assert len(gaps) >= 5
+    assert all(gap >= floor * 0.9 for gap, floor in zip(gaps, floors))
+    assert all(gap < 0.1 * (1 + POLL_JITTER) + 0.05 for gap in gaps)
+
+
+async def test_timed_out_waiter_stops_polling(recorder: PollRecorder):
+    mcp = FastMCP("timeout")
+    mcp.add_extension(TasksExtension())
+
+    @mcp.tool(task=True)
+    async def forever() -> str:
+        await asyncio.Event().wait()
+        return "never"
+
+    async with Client(mcp, mode="auto") as client:
+        task = await call_tool_task(client, "forever", {})
+        tracker = task_tracker(client.session)
+
+        with pytest.raises(TimeoutError, match="did not reach"):
+            await task.wait(timeout=0.1)
+
+        assert tracker.outstanding == 0
+        polls = recorder.total
+        await asyncio.sleep(0.1)
+        assert recorder.total == polls
+        await task.cancel()
+
+
+async def test_poll_is_bounded_by_its_waiters_deadline(monkeypatch: pytest.MonkeyPatch):
+    read_timeouts: list[float | None] = []
+
+    async def stalled_send_get(
+        session: ClientSession, task_id: str, read_timeout_seconds=None
+    ):
+        read_timeouts.append(read_timeout_seconds)
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(tasks_client, "_send_get", stalled_send_get)
+    mcp = FastMCP("stalled")
+    async with Client(mcp) as client:
+        tracker = TaskTracker(client.session, max_in_flight=1)
+
+        with pytest.raises(TimeoutError):
+            await tracker.wait("a", lambda _: True, timeout=0.1)
+        # The abandoned poll was cancelled, so its slot is free for the next.
+        with pytest.raises(TimeoutError):
+            await tracker.wait("b", lambda _: True, timeout=0.1)
+
+    assert len(read_timeouts) == 2
+    assert all(t is not None and 0 < t <= 0.1 for t in read_timeouts)
+    assert tracker.outstanding == 0
@@ -0,0 +1,243 @@
+"""Adaptive worker concurrency driven by queue depth."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import timedelta
+
+import anyio
+import pytest
+from docket import Docket, Worker
+from fastmcp_tasks.autoscale import (
+    ConcurrencyController,
+    DocketQueueDepth,
+    QueueSample,
+    _controllers,
+    _observe,
+)
+
+from fastmcp import FastMCP
+from fastmcp_tasks import TasksExtension
+from tests.tasks.task_helpers import run_task, running_task_server
+
+
+class FakeQueueDepth:
+    """Replays queued samples, then reports an empty queue."""
+
+    def __init__(self, *samples: QueueSample):
+        self.samples = list(samples)
+
+    async def sample(self) -> QueueSample:
+        if self.samples:
+            return self.samples.pop(0)
+        return IDLE
+
+
+IDLE = QueueSample(backlog=0, oldest_wait=0.0)
+
+
+def backlogged(backlog: int, wait: float = 5.0) -> QueueSample:
+    return QueueSample(backlog=backlog, oldest_wait=wait)
+
+
+@pytest.fixture
+async def docket() -> AsyncIterator[Docket]:
+    async with Docket(name="autoscale", url="memory://") as docket:
+        yield docket
+
+
+def make_controller(
+    docket: Docket,
+    concurrency: int = 4,
+    *,
+    min_concurrency: int = 2,
+    max_concurrency: int = 16,
+    target_latency: timedelta = timedelta(seconds=1),
+    scale_down_after: int = 3,
+) -> ConcurrencyController:
+    return ConcurrencyController(
+        Worker(docket, concurrency=concurrency),
+        FakeQueueDepth(),
+        min_concurrency=min_concurrency,
+        max_concurrency=max_concurrency,
+        target_latency=target_latency,
+        scale_down_after=scale_down_after,
+    )
+
+
+class TestDecisions:
+    def test_grows_with_backlog_at_most_doubling(self, docket: Docket):
+        controller = make_controller(docket)
+
+        assert controller.observe(backlogged(1)) == 5
+        assert controller.observe(backlogged(100)) == 10
+        assert controller.observe(backlogged(100)) == 16
+        assert controller.observe(backlogged(100)) == 16
+        assert controller.worker.concurrency == 16
+
+    def test_holds_while_wait_is_under_target(self, docket: Docket):
+        controller = make_controller(docket, target_latency=timedelta(seconds=1))
+
+        assert controller.observe(backlogged(50, wait=0.5)) == 4
+        assert controller.observe(backlogged(50, wait=1.0)) == 8
+
+    def test_shrinks_after_consecutive_idle_samples(self, docket: Docket):
+        controller = make_controller(docket, concurrency=16, scale_down_after=2)
+
+        assert controller.observe(IDLE) == 16
+        assert controller.observe(IDLE) == 12
+        assert controller.observe(IDLE) == 12
+        assert controller.observe(IDLE) == 9
+
+    def test_backlog_resets_idle_streak(self, docket: Docket):
+        controller = make_controller(docket, concurrency=8, scale_down_after=2)
+
+        controller.observe(IDLE)
+        controller.observe(backlogged(3, wait=0.0))
+        assert controller.observe(IDLE) == 8
+        assert controller.observe(IDLE) == 6
+
+    def test_never_drops_below_minimum(self, docket: Docket):
+        controller = make_controller(docket, concurrency=3, scale_down_after=1)
+
+        for _ in range(5):
+            controller.observe(IDLE)
+
+        assert controller.concurrency == 2
+
+    def test_starting_concurrency_is_clamped(self, docket: Docket):
+        assert make_controller(docket, concurrency=100).concurrency == 16
+        assert make_controller(docket, concurrency=1).concurrency == 2
+
+    def test_records_backlog(self, docket: Docket):
+        controller = make_controller(docket)
+
+        controller.observe(backlogged(7, wait=2.5))
+
+        assert (controller.backlog, controller.oldest_wait) == (7, 2.5)
+
+    @pytest.mark.parametrize("bounds", [(0, 4), (5, 4)])
+    def test_invalid_bounds(self, docket: Docket, bounds: tuple[int, int]):
+        with pytest.raises(ValueError, match="min_concurrency"):
+            make_controller(
+                docket, min_concurrency=bounds[0], max_concurrency=bounds[1]
+            )
+
+
+async def test_run_applies_samples_and_registers_for_metrics(docket: Docket):
+    controller = ConcurrencyController(
+        Worker(docket, concurrency=2),
+        FakeQueueDepth(backlogged(10), backlogged(10)),
+        min_concurrency=1,
+        max_concurrency=32,
+        interval=timedelta(milliseconds=10),
+    )
+
+    task = asyncio.create_task(controller.run())
+    with anyio.fail_after(2):
+        while controller.concurrency < 8:
+            await asyncio.sleep(0.01)
+    assert controller in _controllers
+    observations = [o for o in _observe("backlog") if o.value == 10]
+    assert observations[0].attributes == {
+        "docket.name": "autoscale",
+        "docket.worker": controller.worker.name,
+    }
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert controller not in _controllers
+
+
+async def test_failed_samples_are_skipped(docket: Docket):
+    class Flaky:
+        calls = 0
+
+        async def sample(self) -> QueueSample:
+            self.calls += 1
+            if self.calls == 1:
+                raise ConnectionError("backend down")
+            return backlogged(4)
+
+    controller = ConcurrencyController(
+        Worker(docket, concurrency=2),
+        Flaky(),
+        min_concurrency=1,
+        max_concurrency=8,
+        interval=timedelta(milliseconds=10),
+    )
+
+    task = asyncio.create_task(controller.run())
+    with anyio.fail_after(2):
+        while controller.concurrency == 2:
+            await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+async def noop() -> None:
+    pass
+
+
+class TestDocketQueueDepth:
+    async def test_empty_queue(self, docket: Docket):
+        assert await DocketQueueDepth(docket).sample() == IDLE
+
+    async def test_counts_undelivered_tasks(self, docket: Docket):
+        docket.register(noop)
+        for _ in range(3):
+            await docket.add(noop)()
+        await asyncio.sleep(0.05)
+
+        sample = await DocketQueueDepth(docket).sample()
+
+        assert sample.backlog == 3
+        assert sample.oldest_wait >= 0.04
+
+    async def test_delivered_tasks_leave_the_backlog(self, docket: Docket):
+        docket.register(noop)
+        for _ in range(3):
+            await docket.add(noop)()
+
+        async with Worker(docket) as worker:
+            await worker.run_until_finished()
+
+        assert await DocketQueueDepth(docket).sample() == IDLE
+
+
+async def test_extension_runs_controller_when_max_concurrency_set():
+    mcp = FastMCP("autoscaled")
+    mcp.add_extension(
+        TasksExtension(concurrency=50, min_concurrency=2, max_concurrency=20)
+    )
+
+    @mcp.tool(task=True)
+    async def square(n: int) -> int:
+        return n * n
+
+    async with running_task_server(mcp):
+        worker = mcp._worker
+        assert worker is not None
+        assert worker.concurrency == 20
+        with anyio.fail_after(2):
+            while not any(c.worker is worker for c in _controllers):
+                await asyncio.sleep(0.01)
+        assert (await run_task(mcp, "square", {"n": 3})).status == "completed"
+
+
+async def test_extension_without_max_concurrency_is_fixed():
+    mcp = FastMCP("fixed")
+    mcp.add_extension(TasksExtension(concurrency=50))
+
+    @mcp.tool(task=True)
+    async def square(n: int) -> int:
+        return n * n
+
+    async with running_task_server(mcp):
+        worker = mcp._worker
+        assert worker is not None
+        assert worker.concurrency == 50
+        assert not any(c.worker is worker for c in _controllers)
@@ -0,0 +1,332 @@
+"""Compression, encryption, and blob offload of stored task results."""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import pickle
+import time
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any, SupportsFloat
+
+import anyio.to_thread
+import pytest
+from fastmcp_tasks.encryption import (
+    SnapshotDecryptionError,
+    clear_codec_cache,
+    snapshot_codec,
+)
+from fastmcp_tasks.result_store import (
+    FileBlobStore,
+    TaskResultStore,
+    TaskResultUnavailableError,
+)
+from fastmcp_tasks.settings import tasks_settings
+from key_value.aio.protocols.key_value import AsyncKeyValue
+from key_value.aio.stores.memory import MemoryStore
+from key_value.aio.wrappers.base import BaseWrapper
+from pydantic import SecretStr
+
+from fastmcp import FastMCP
+from fastmcp_tasks import TasksExtension
+from tests.tasks.task_helpers import run_task, running_task_server
+
+KEY = "a-test-encryption-key-for-task-results"
+
+
+class RecordingStore(BaseWrapper):
+    """Records the serialized size of every value written through it."""
+
+    def __init__(self, key_value: AsyncKeyValue):
+        self.key_value = key_value
+        self.written: list[int] = []
+        super().__init__()
+
+    async def put(
+        self,
+        key: str,
+        value: Mapping[str, Any],
+        *,
+        collection: str | None = None,
+        ttl: SupportsFloat | None = None,
+    ) -> None:
+        self.written.append(len(json.dumps(dict(value))))
+        await self.key_value.put(key=key, value=value, collection=collection, ttl=ttl)
+
+
+@pytest.fixture
+def encryption_key() -> Iterator[str]:
+    clear_codec_cache()
+    previous = tasks_settings.encryption_key
+    tasks_settings.encryption_key = SecretStr(KEY)
+    try:
+        yield KEY
+    finally:
+        tasks_settings.encryption_key = previous
+        clear_codec_cache()
+
+
+@pytest.fixture
+def no_encryption_key() -> Iterator[None]:
+    clear_codec_cache()
+    previous = tasks_settings.encryption_key
+    tasks_settings.encryption_key = None
+    try:
+        yield
+    finally:
+        tasks_settings.encryption_key = previous
+        clear_codec_cache()
+
+
+def stored(result: object) -> dict[str, str]:
+    """The value Docket writes for a task returning `result`."""
+    return {"data": base64.b64encode(pickle.dumps(result)).decode()}
+
+
+def loaded(value: dict[str, Any] | None) -> object:
+    assert value is not None
+    return pickle.loads(base64.b64decode(value["data"]))
+
+
+def compressible(size: int) -> str:
+    return os.urandom(size // 4).hex() * 2
+
+
+@pytest.fixture
+def inner() -> RecordingStore:
+    return RecordingStore(MemoryStore())
+
+
+class TestTaskResultStore:
+    async def test_small_plaintext_result_is_stored_as_is(
+        self, inner: RecordingStore, no_encryption_key: None
+    ):
+        store = TaskResultStore(inner)
+
+        await store.put("k", stored("hello"))
+
+        assert await inner.get("k") == stored("hello")
+        assert loaded(await store.get("k")) == "hello"
+
+    async def test_large_result_is_compressed(
+        self, inner: RecordingStore, no_encryption_key: None
+    ):
+        result = compressible(1_000_000)
+        store = TaskResultStore(inner, compression_threshold=1024)
+
+        await store.put("k", stored(result))
+
+        raw = await inner.get("k")
+        assert raw is not None and raw["encoding"] == ["zlib"]
+        assert inner.written[0] < len(stored(result)["data"]) * 0.7
+        assert loaded(await store.get("k")) == result
+
+    async def test_result_over_offload_threshold_leaves_a_reference(
+        self, inner: RecordingStore, tmp_path: Path, no_encryption_key: None
+    ):
+        result = compressible(4_000_000)
+        store = TaskResultStore(
+            inner,
+            compression_threshold=1024,
+            offload_threshold=64 * 1024,
+            blob_store=FileBlobStore(tmp_path),
+        )
+
+        await store.put("k", stored(result), ttl=60)
+
+        assert inner.written[0] < 200
+        raw = await inner.get("k")
+        assert raw is not None and "data" not in raw
+        assert (tmp_path / raw["blob"]).exists()
+        assert loaded(await store.get("k")) == result
+
+    async def test_encrypted_round_trip(
+        self, inner: RecordingStore, tmp_path: Path, encryption_key: str
+    ):
+        small, large = "secret", "secret" + compressible(2_000_000)
+        store = TaskResultStore(
+            inner,
+            compression_threshold=1024,
+            offload_threshold=64 * 1024,
+            blob_store=FileBlobStore(tmp_path),
+        )
+
+        await store.put("small", stored(small))
+        await store.put("large", stored(large), ttl=60)
+
+        small_raw = await inner.get("small")
+        assert small_raw is not None and small_raw["encoding"] == ["fernet"]
+        assert b"secret" not in base64.urlsafe_b64decode(small_raw["data"])
+        large_raw = await inner.get("large")
+        assert large_raw is not None and large_raw["encoding"] == ["zlib", "fernet"]
+        assert inner.written[1] < 200
+        assert loaded(await store.get("small")) == small
+        assert loaded(await store.get("large")) == large
+
+    async def test_encrypted_result_without_key_fails(
+        self, inner: RecordingStore, encryption_key: str
+    ):
+        codec = snapshot_codec()
+        await TaskResultStore(inner, codec=codec).put("k", stored("secret"))
+
+        clear_codec_cache()
+        tasks_settings.encryption_key = None
+        with pytest.raises(SnapshotDecryptionError):
+            await TaskResultStore(inner).get("k")
+
+    async def test_missing_blob_fails(
+        self, inner: RecordingStore, tmp_path: Path, no_encryption_key: None
+    ):
+        store = TaskResultStore(
+            inner,
+            compression_threshold=0,
+            offload_threshold=0,
+            blob_store=FileBlobStore(tmp_path),
+        )
+        await store.put("k", stored("x" * 1000))
+
+        for path in tmp_path.iterdir():
+            path.unlink()
+
+        with pytest.raises(TaskResultUnavailableError):
+            await store.get("k")
+
+    async def test_delete_removes_blob(
+        self, inner: RecordingStore, tmp_path: Path, no_encryption_key: None
+    ):
+        store = TaskResultStore(
+            inner,
+            compression_threshold=0,
+            offload_threshold=0,
+            blob_store=FileBlobStore(tmp_path),
+        )
+        await store.put("k", stored("x" * 1000))
+
+        assert await store.delete("k")
+        assert list(tmp_path.iterdir()) == []
+        assert await store.get("k") is None
+
+    async def test_delete_many_reads_blob_refs_in_one_batch(
+        self,
+        inner: RecordingStore,
+        tmp_path: Path,
+        no_encryption_key: None,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        store = TaskResultStore(
+            inner,
+            compression_threshold=0,
+            offload_threshold=0,
+            blob_store=FileBlobStore(tmp_path),
+        )
+        for key in ("a", "b", "c"):
+            await store.put(key, stored("x" * 1000))
+
+        reads: list[str] = []
+        get, get_many = inner.get, inner.get_many
+
+        async def counting_get(*args: Any, **kwargs: Any) -> Any:
+            reads.append("get")
+            return await get(*args, **kwargs)
+
+        async def counting_get_many(*args: Any, **kwargs: Any) -> Any:
+            reads.append("get_many")
+            return await get_many(*args, **kwargs)
+
+        monkeypatch.setattr(inner, "get", counting_get)
+        monkeypatch.setattr(inner, "get_many", counting_get_many)
+
+        assert await store.delete_many(["a", "b", "c", "missing"]) == 3
+        assert reads == ["get_many"]
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_batch_read_decodes_in_one_thread_hop(
+        self,
+        inner: RecordingStore,
+        encryption_key: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        store = TaskResultStore(inner, compression_threshold=1024)
+        results = [compressible(200_000) for _ in range(3)]
+        for i, result in enumerate(results):
+            await store.put(f"k{i}", stored(result))
+        await store.put("small", stored("small"))
+
+        hops: list[object] = []
+        run_sync = anyio.to_thread.run_sync
+
+        async def counting_run_sync(func, *args):
+            hops.append(func)
+            return await run_sync(func, *args)
+
+        monkeypatch.setattr(anyio.to_thread, "run_sync", counting_run_sync)
+        values = await store.get_many(["k0", "k1", "missing", "k2", "small"])
+
+        assert len(hops) == 1
+        assert [loaded(v) for v in values if v is not None] == [*results, "small"]
+        assert values[2] is None
+
+
+class TestFileBlobStore:
+    async def test_round_trip(self, tmp_path: Path):
+        blobs = FileBlobStore(tmp_path / "blobs")
+
+        ref = await blobs.put(b"payload", ttl=60)
+
+        assert await blobs.get(ref) == b"payload"
+        await blobs.delete(ref)
+        assert await blobs.get(ref) is None
+
+    async def test_expired_blob_is_gone(self, tmp_path: Path):
+        blobs = FileBlobStore(tmp_path)
+        ref = await blobs.put(b"payload", ttl=60)
+        expired = f"{int(time.time()) - 1}-{ref.split('-', 1)[1]}"
+        (tmp_path / ref).rename(tmp_path / expired)
+
+        assert await blobs.get(expired) is None
+        assert not (tmp_path / expired).exists()
+
+    async def test_sweep_removes_only_expired_blobs(self, tmp_path: Path):
+        blobs = FileBlobStore(tmp_path)
+        live = await blobs.put(b"live", ttl=60)
+        forever = await blobs.put(b"forever")
+        (tmp_path / f"{int(time.time()) - 1}-{'0' * 32}").write_bytes(b"old")
+
+        assert blobs.sweep() == 1
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted([live, forever])
+
+    @pytest.mark.parametrize("ref", ["../secret", "0-abc", str(Path("a/b"))])
+    async def test_rejects_foreign_references(self, tmp_path: Path, ref: str):
+        with pytest.raises(ValueError, match="Invalid blob reference"):
+            await FileBlobStore(tmp_path).get(ref)
+
+
+async def test_large_task_result_round_trips_through_blob_store(
+    tmp_path: Path, encryption_key: str
+):
+    mcp = FastMCP("large-results")
+    mcp.add_extension(TasksExtension(result_blob_store=FileBlobStore(tmp_path)))
+    payload = compressible(8_000_000)
+
+    @mcp.tool(task=True)
+    async def export() -> str:
+        return payload
+
+    async with running_task_server(mcp):
+        docket = mcp._docket
+        assert docket is not None
+        store = docket.result_storage
+        assert isinstance(store, TaskResultStore)
+        recorder = RecordingStore(store.key_value)
+        store.key_value = recorder
+
+        final = await run_task(mcp, "export", {})
+
+    assert final.status == "completed"
+    assert final.result is not None
+    assert final.result["content"][0]["text"] == payload
+    assert len(recorder.written) == 1
+    assert recorder.written[0] < 200
+    assert len(list(tmp_path.iterdir())) == 1
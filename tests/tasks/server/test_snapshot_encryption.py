@@ -12,15 +12,18 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 from collections.abc import Iterator
 from unittest.mock import patch
 
 import pytest
 from fastmcp_tasks.context import TaskContextSnapshot
 from fastmcp_tasks.encryption import (
+    THREAD_OFFLOAD_THRESHOLD,
     EncryptedCodec,
     PlaintextCodec,
     SnapshotDecryptionError,
+    _PlaintextCache,
     clear_codec_cache,
     snapshot_codec,
 )
@@ -142,6 +145,137 @@ class TestSnapshotCodec:
             PlaintextCodec().decode(encrypted)
 
 
+@pytest.fixture(scope="module")
+def shared_codec() -> EncryptedCodec:
+    """One codec for the cache tests; deriving its key costs about a second."""
+    return EncryptedCodec(KEY)
+
+
+@pytest.fixture
+def codec(shared_codec: EncryptedCodec) -> Iterator[EncryptedCodec]:
+    shared_codec._cache.clear()
+    yield shared_codec
+    shared_codec._cache.clear()
+
+
+class CountingDecrypt:
+    """Wraps a Fernet's decrypt, recording the thread of each call."""
+
+    def __init__(self, codec: EncryptedCodec, monkeypatch: pytest.MonkeyPatch):
+        self.threads: list[int] = []
+        self._decrypt = codec._fernet.decrypt
+        monkeypatch.setattr(codec._fernet, "decrypt", self)
+
+    def __call__(self, token: bytes) -> bytes:
+        self.threads.append(threading.get_ident())
+        return self._decrypt(token)
+
+
+class TestDecryptedPayloadCache:
+    def test_repeat_decode_skips_decryption(
+        self, codec: EncryptedCodec, monkeypatch: pytest.MonkeyPatch
+    ):
+        stored = codec.encode('{"a": 1}')
+        codec._cache.clear()
+        decrypts = CountingDecrypt(codec, monkeypatch)
+
+        for _ in range(5):
+            assert codec.decode(stored) == '{"a": 1}'
+
+        assert len(decrypts.threads) == 1
+
+    def test_own_writes_are_cached(
+        self, codec: EncryptedCodec, monkeypatch: pytest.MonkeyPatch
+    ):
+        stored = codec.encode_bytes(b"result")
+        decrypts = CountingDecrypt(codec, monkeypatch)
+
+        assert codec.decode_bytes(stored) == b"result"
+        assert decrypts.threads == []
+
+    def test_tampered_value_is_not_served_from_cache(self, codec: EncryptedCodec):
+        stored = codec.encode('{"a": 1}')
+        tampered = stored[:-2] + ("A" if stored[-2] != "A" else "B") + stored[-1]
+
+        with pytest.raises(SnapshotDecryptionError):
+            codec.decode(tampered)
+
+    def test_cache_can_be_disabled(self, monkeypatch: pytest.MonkeyPatch):
+        codec = EncryptedCodec(KEY, cache_entries=0)
+        stored = codec.encode('{"a": 1}')
+        decrypts = CountingDecrypt(codec, monkeypatch)
+
+        codec.decode(stored)
+        codec.decode(stored)
+
+        assert len(decrypts.threads) == 2
+
+    def test_cache_is_bounded(self):
+        cache = _PlaintextCache(max_entries=2, max_bytes=400)
+
+        cache.put(b"a", b"x" * 10)
+        cache.put(b"b", b"x" * 10)
+        cache.get(b"a")
+        cache.put(b"c", b"x" * 10)
+        assert [cache.get(k) is not None for k in (b"a", b"b", b"c")] == [
+            True,
+            False,
+            True,
+        ]
+
+        cache.put(b"d", b"x" * 101)
+        assert cache.get(b"d") is None
+
+        cache = _PlaintextCache(max_entries=10, max_bytes=400)
+        for key in (b"a", b"b", b"c", b"d", b"e"):
+            cache.put(key, b"x" * 100)
+        assert [cache.get(k) is not None for k in (b"a", b"b", b"c", b"d", b"e")] == [
+            False,
+            True,
+            True,
+            True,
+            True,
+        ]
+
+
+class TestAsyncCodec:
+    async def test_small_payload_decodes_on_the_loop(
+        self, codec: EncryptedCodec, monkeypatch: pytest.MonkeyPatch
+    ):
+        stored = codec.encode('{"a": 1}')
+        codec._cache.clear()
+        decrypts = CountingDecrypt(codec, monkeypatch)
+
+        assert await codec.decode_async(stored) == '{"a": 1}'
+        assert decrypts.threads == [threading.get_ident()]
+
+    async def test_large_payload_decodes_in_a_thread(
+        self, codec: EncryptedCodec, monkeypatch: pytest.MonkeyPatch
+    ):
+        payload = json.dumps({"blob": "x" * THREAD_OFFLOAD_THRESHOLD})
+        stored = await codec.encode_async(payload)
+        codec._cache.clear()
+        decrypts = CountingDecrypt(codec, monkeypatch)
+
+        assert await codec.decode_async(stored) == payload
+        assert decrypts.threads != [threading.get_ident()]
+
+    async def test_decode_many(self, codec: EncryptedCodec):
+        payloads = ['{"a": 1}', json.dumps({"b": "y" * THREAD_OFFLOAD_THRESHOLD})]
+        stored = [codec.encode(p) for p in payloads]
+
+        assert await codec.decode_many(stored) == payloads
+        assert await codec.decode_many([]) == []
+        with pytest.raises(SnapshotDecryptionError):
+            await codec.decode_many([stored[0], '{"plaintext": true}'])
+
+    async def test_plaintext_codec_async(self):
+        codec = PlaintextCodec()
+
+        assert await codec.encode_async('{"a": 1}') == '{"a": 1}'
+        assert await codec.decode_many(['{"a": 1}', b"{}"]) == ['{"a": 1}', "{}"]
+
+
 class TestTasksSettings:
     def test_encryption_key_defaults_to_none(self, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.delenv("FASTMCP_TASKS_ENCRYPTION_KEY", raising=False)
@@ -0,0 +1,305 @@
+"""Notify-on-release update locking and pushed cancellation state.
+
+`tasks/cancel` waits for the per-task update lock held by an in-flight
+`tasks/update`, and `tasks/get` checks the task's cancellation marker on every
+poll. Both used to cost a Redis round trip per check (a `SET NX` spin and an
+`EXISTS`). These tests count the commands issued against the in-memory Redis
+backend to pin the event-driven replacements.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import anyio
+import mcp_types
+import pytest
+from docket import Docket
+from fastmcp_tasks.context import get_task_scope
+from fastmcp_tasks.input_store import (
+    _cancelled_key,
+    _listeners,
+    acquire_update_lock,
+    acquire_update_lock_blocking,
+    is_cancelled,
+    listen_for_cancellations,
+    mark_cancelled,
+    release_update_lock,
+)
+
+from fastmcp import Context, FastMCP
+from fastmcp_tasks import TasksExtension
+from tests.tasks.task_helpers import (
+    cancel_task,
+    get_task,
+    running_task_server,
+    submit_task,
+    wait_for_task,
+)
+
+TASK_ID = "task-1"
+
+
+class _CountingClient:
+    def __init__(self, redis: Any, commands: Counter[str]):
+        self._redis = redis
+        self._commands = commands
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._redis, name)
+        if not callable(attr):
+            return attr
+
+        def counted(*args: Any, **kwargs: Any) -> Any:
+            self._commands[name] += 1
+            return attr(*args, **kwargs)
+
+        return counted
+
+
+def count_commands(docket: Docket, monkeypatch: pytest.MonkeyPatch) -> Counter[str]:
+    """Count every command issued through `docket.redis()` and `_publish`."""
+    commands: Counter[str] = Counter()
+    original_redis = docket.redis
+    original_publish = docket._publish
+
+    @asynccontextmanager
+    async def counting_redis() -> AsyncIterator[Any]:
+        async with original_redis() as redis:
+            yield _CountingClient(redis, commands)
+
+    async def counting_publish(channel: str, message: str) -> int:
+        commands["publish"] += 1
+        return await original_publish(channel, message)
+
+    monkeypatch.setattr(docket, "redis", counting_redis)
+    monkeypatch.setattr(docket, "_publish", counting_publish)
+    return commands
+
+
+@pytest.fixture
+async def docket() -> AsyncIterator[Docket]:
+    async with Docket(name="lock-signalling", url="memory://") as docket:
+        yield docket
+
+
+async def wait_until_subscribed(docket: Docket) -> None:
+    listener = _listeners[docket]
+    while not listener._subscribed:
+        await asyncio.sleep(0.01)
+
+
+class TestUpdateLock:
+    async def test_contended_acquire_waits_without_polling(
+        self, docket: Docket, monkeypatch: pytest.MonkeyPatch
+    ):
+        commands = count_commands(docket, monkeypatch)
+        assert await acquire_update_lock(docket, None, TASK_ID)
+
+        waiter = asyncio.create_task(
+            acquire_update_lock_blocking(docket, None, TASK_ID)
+        )
+        await asyncio.sleep(0.3)
+        assert not waiter.done()
+        await release_update_lock(docket, None, TASK_ID)
+
+        assert await waiter
+        # Holder SET, waiter SET + BLPOP, release, waiter SET. A 20ms spin
+        # would have issued ~15 SETs while the lock was held.
+        assert commands["set"] == 3
+        assert commands["blpop"] == 1
+
+    async def test_waiters_are_woken_one_at_a_time(self, docket: Docket):
+        assert await acquire_update_lock(docket, None, TASK_ID)
+        order: list[int] = []
+
+        async def wait_then_release(n: int) -> None:
+            assert await acquire_update_lock_blocking(docket, None, TASK_ID)
+            order.append(n)
+            await release_update_lock(docket, None, TASK_ID)
+
+        waiters = [asyncio.create_task(wait_then_release(n)) for n in range(3)]
+        await asyncio.sleep(0.05)
+        await release_update_lock(docket, None, TASK_ID)
+        await asyncio.wait_for(asyncio.gather(*waiters), timeout=2)
+
+        assert sorted(order) == [0, 1, 2]
+
+    async def test_times_out_when_holder_never_releases(
+        self, docket: Docket, monkeypatch: pytest.MonkeyPatch
+    ):
+        assert await acquire_update_lock(docket, None, TASK_ID)
+        commands = count_commands(docket, monkeypatch)
+
+        assert not await acquire_update_lock_blocking(
+            docket, None, TASK_ID, timeout=0.2
+        )
+        assert commands["blpop"] <= 2
+
+    async def test_release_is_one_round_trip(
+        self, docket: Docket, monkeypatch: pytest.MonkeyPatch
+    ):
+        assert await acquire_update_lock(docket, None, TASK_ID)
+        commands = count_commands(docket, monkeypatch)
+
+        await release_update_lock(docket, None, TASK_ID)
+
+        assert commands == Counter({"pipeline": 1})
+        assert await acquire_update_lock(docket, None, TASK_ID)
+
+    async def test_stale_token_costs_one_retry(
+        self, docket: Docket, monkeypatch: pytest.MonkeyPatch
+    ):
+        # A release with no waiter leaves one token behind.
+        assert await acquire_update_lock(docket, None, TASK_ID)
+        await release_update_lock(docket, None, TASK_ID)
+        assert await acquire_update_lock(docket, None, TASK_ID)
+        commands = count_commands(docket, monkeypatch)
+
+        waiter = asyncio.create_task(
+            acquire_update_lock_blocking(docket, None, TASK_ID)
+        )
+        await asyncio.sleep(0.2)
+        await release_update_lock(docket, None, TASK_ID)
+
+        assert await waiter
+        assert commands["blpop"] == 2
+
+
+class TestCancellationSignalling:
+    async def test_negative_checks_are_served_locally_while_subscribed(
+        self, docket: Docket, monkeypatch: pytest.MonkeyPatch
+    ):
+        commands = count_commands(docket, monkeypatch)
+        async with listen_for_cancellations(docket):
+            await wait_until_subscribed(docket)
+
+            for _ in range(10):
+                assert not await is_cancelled(docket, None, TASK_ID)
+            assert commands["exists"] == 1
+
+            assert not await is_cancelled(docket, None, TASK_ID, authoritative=True)
+            assert commands["exists"] == 2
+
+    async def test_cancellation_elsewhere_is_pushed(
+        self, docket: Docket, monkeypatch: pytest.MonkeyPatch
+    ):
+        commands = count_commands(docket, monkeypatch)
+        async with (
+            listen_for_cancellations(docket),
+            Docket(name="lock-signalling", url="memory://") as other_process,
+        ):
+            await wait_until_subscribed(docket)
+            assert not await is_cancelled(docket, None, TASK_ID)
+
+            await mark_cancelled(other_process, None, TASK_ID, ttl_seconds=60)
+            key = _cancelled_key(docket, None, TASK_ID)
+            listener = _listeners[docket]
+            with anyio.fail_after(2):
+                while not listener.lookup(key, allow_negative=False):
+                    await asyncio.sleep(0.01)
+
+            assert await is_cancelled(docket, None, TASK_ID)
+            assert await is_cancelled(docket, None, TASK_ID, authoritative=True)
+            assert commands["exists"] == 1
+
+    async def test_without_listener_reads_redis(
+        self, docket: Docket, monkeypatch: pytest.MonkeyPatch
+    ):
+        commands = count_commands(docket, monkeypatch)
+
+        assert not await is_cancelled(docket, None, TASK_ID)
+        await mark_cancelled(docket, None, TASK_ID, ttl_seconds=60)
+        assert await is_cancelled(docket, None, TASK_ID)
+
+        assert commands["exists"] == 2
+
+    async def test_listener_resubscribes_after_a_failure(
+        self, docket: Docket, monkeypatch: pytest.MonkeyPatch, caplog: Any
+    ):
+        monkeypatch.setattr("fastmcp_tasks.input_store._RESUBSCRIBE_MIN_SECONDS", 0.01)
+        original_redis = docket.redis
+        failures = 1
+
+        @asynccontextmanager
+        async def flaky_redis() -> AsyncIterator[Any]:
+            nonlocal failures
+            if failures:
+                failures -= 1
+                raise ConnectionError("redis went away")
+            async with original_redis() as redis:
+                yield redis
+
+        monkeypatch.setattr(docket, "redis", flaky_redis)
+        async with listen_for_cancellations(docket):
+            with anyio.fail_after(2):
+                await wait_until_subscribed(docket)
+
+        assert "Cancellation subscription failed" in caplog.text
+
+    async def test_negatives_are_dropped_with_the_subscription(self, docket: Docket):
+        async with listen_for_cancellations(docket):
+            await wait_until_subscribed(docket)
+            listener = _listeners[docket]
+            assert not await is_cancelled(docket, None, TASK_ID)
+            key = _cancelled_key(docket, None, TASK_ID)
+            assert listener.lookup(key, allow_negative=True) is False
+
+        assert docket not in _listeners
+        assert listener.lookup(key, allow_negative=True) is None
+
+
+async def test_cancel_racing_update_issues_few_commands(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """`tasks/cancel` blocked behind an update waits on BLPOP, then wins."""
+    mcp = FastMCP("lock-race")
+    mcp.add_extension(TasksExtension())
+
+    @mcp.tool(task=True)
+    async def ask(ctx: Context) -> str | mcp_types.InputRequiredResult:
+        if ctx.input_responses is None:
+            return mcp_types.InputRequiredResult(
+                result_type="input_required",
+                input_requests={
+                    "name": mcp_types.ElicitRequest(
+                        params=mcp_types.ElicitRequestFormParams(
+                            message="Name?",
+                            requested_schema={"type": "object", "properties": {}},
+                        )
+                    )
+                },
+            )
+        return "done"
+
+    async with running_task_server(mcp):
+        created = await submit_task(mcp, "ask", {})
+        await wait_for_task(
+            mcp, created.task_id, target_states=frozenset({"input_required"})
+        )
+        docket = mcp._docket
+        assert docket is not None
+        scope = get_task_scope()
+
+        # Simulate a tasks/update holding the lock while cancel arrives.
+        assert await acquire_update_lock(docket, scope, created.task_id)
+        commands = count_commands(docket, monkeypatch)
+        cancelling = asyncio.create_task(cancel_task(mcp, created.task_id))
+        await asyncio.sleep(0.3)
+        assert not cancelling.done()
+        await release_update_lock(docket, scope, created.task_id)
+        await cancelling
+
+        assert commands["blpop"] == 1
+        assert commands["set"] == 3  # two lock attempts + the cancel marker
+        # Our cancellation push, plus Docket's own cancel broadcast to workers.
+        assert commands["publish"] == 2
+
+        for _ in range(5):
+            assert (await get_task(mcp, created.task_id)).status == "cancelled"
+        # The marker this process wrote is answered locally on every poll.
+        assert commands["exists"] == 0
@@ -1,5 +1,6 @@
 """Tests for argument transformation in tool transforms."""
 
+from copy import deepcopy
 from dataclasses import dataclass
 from typing import Annotated, Any
 
@@ -301,6 +302,32 @@ async def test_arg_transform_hidden_with_default_factory():
     assert len(result.content[0].text.split("_")[1]) > 10
 
 
+async def test_arg_transform_defaults_follow_replaced_schema(add_tool):
+    """A copy with a new schema uses its own defaults, not the original's."""
+    tool = Tool.from_tool(add_tool, transform_args={"old_y": ArgTransform(default=1)})
+    result = await tool.run(arguments={"old_x": 1})
+    assert result.structured_content == {"result": 2}
+
+    parameters = deepcopy(tool.parameters)
+    parameters["properties"]["old_y"]["default"] = 100
+    copy = tool.model_copy(update={"parameters": parameters})
+
+    result = await copy.run(arguments={"old_x": 1})
+    assert result.structured_content == {"result": 101}
+    result = await tool.run(arguments={"old_x": 1})
+    assert result.structured_content == {"result": 2}
+    assert "run_plan" not in tool.model_dump()
+
+
+async def test_forwarding_rejects_unknown_and_missing_arguments(add_tool):
+    tool = Tool.from_tool(add_tool, transform_args={"old_x": ArgTransform(name="x")})
+
+    with pytest.raises(TypeError, match="unexpected keyword argument\\(s\\): old_x, z"):
+        await tool.run(arguments={"x": 1, "z": 2, "old_x": 3})
+    with pytest.raises(TypeError, match="Missing required argument\\(s\\): x"):
+        await tool.run(arguments={"old_y": 2})
+
+
 async def test_arg_transform_default_and_factory_raises_error():
     """Test that providing both default and default_factory raises an error."""
     with pytest.raises(
@@ -0,0 +1,200 @@
+"""Fusion of stacked forwarding-only transforms into a single hop."""
+
+import itertools
+from typing import Any
+
+import pytest
+
+from fastmcp.tools import Tool, forward
+from fastmcp.tools.base import ToolResult
+from fastmcp.tools.function_tool import FunctionTool
+from fastmcp.tools.tool_transform import (
+    ArgTransform,
+    ArgTransformConfig,
+    ToolTransformConfig,
+    TransformedTool,
+)
+
+
+class CallCounter:
+    def __init__(self, monkeypatch: pytest.MonkeyPatch):
+        self.root_calls: list[dict[str, Any]] = []
+        self.transformed_runs = 0
+        self.conversions = 0
+
+        original_run = TransformedTool.run
+        original_convert = FunctionTool.convert_result
+
+        async def counting_run(tool: TransformedTool, arguments: dict[str, Any]):
+            self.transformed_runs += 1
+            return await original_run(tool, arguments)
+
+        def counting_convert(tool: FunctionTool, raw_value: Any) -> ToolResult:
+            self.conversions += 1
+            return original_convert(tool, raw_value)
+
+        monkeypatch.setattr(TransformedTool, "run", counting_run)
+        monkeypatch.setattr(FunctionTool, "convert_result", counting_convert)
+
+    def root(self) -> FunctionTool:
+        def search(
+            query: str, limit: int = 10, region: str = "us", request_id: int = 0
+        ) -> dict[str, Any]:
+            args = {
+                "query": query,
+                "limit": limit,
+                "region": region,
+                "request_id": request_id,
+            }
+            self.root_calls.append(args)
+            return args
+
+        return Tool.from_function(search)
+
+
+@pytest.fixture
+def counter(monkeypatch: pytest.MonkeyPatch) -> CallCounter:
+    return CallCounter(monkeypatch)
+
+
+def stack_five(root: Tool) -> TransformedTool:
+    ids = itertools.count(1)
+    namespaced = Tool.from_tool(root, name="docs_search")
+    configured = ToolTransformConfig(
+        arguments={"query": ArgTransformConfig(name="q")}
+    ).apply(namespaced)
+    hidden = Tool.from_tool(
+        configured, transform_args={"region": ArgTransform(hide=True, default="eu")}
+    )
+    defaulted = Tool.from_tool(
+        hidden, transform_args={"limit": ArgTransform(default=3)}
+    )
+    return Tool.from_tool(
+        defaulted,
+        transform_args={
+            "request_id": ArgTransform(hide=True, default_factory=lambda: next(ids))
+        },
+    )
+
+
+class TestChainFusion:
+    async def test_five_stacked_transforms_run_root_once(self, counter: CallCounter):
+        root = counter.root()
+        tool = stack_five(root)
+
+        result = await tool.run({"q": "fusion"})
+
+        expected = {"query": "fusion", "limit": 3, "region": "eu", "request_id": 1}
+        assert counter.root_calls == [expected]
+        assert counter.transformed_runs == 1
+        assert counter.conversions == 1
+        assert result.structured_content == expected
+        assert result.content == (await root.run(expected)).content
+
+    async def test_fused_chain_matches_each_layer(self, counter: CallCounter):
+        tool = stack_five(counter.root())
+        layers = [tool]
+        while isinstance(layers[-1].parent_tool, TransformedTool):
+            layers.append(layers[-1].parent_tool)
+
+        assert len(layers) == 5
+        for layer in layers:
+            assert layer.forwarding_plan is not None
+            assert layer.forwarding_plan.target is layers[-1].parent_tool
+
+        result = await tool.run({"q": "a", "limit": 7})
+        assert result.structured_content == {
+            "query": "a",
+            "limit": 7,
+            "region": "eu",
+            "request_id": 1,
+        }
+
+    async def test_validation_errors_are_preserved(self, counter: CallCounter):
+        tool = stack_five(counter.root())
+
+        with pytest.raises(TypeError, match="unexpected keyword argument"):
+            await tool.run({"q": "a", "region": "us"})
+        with pytest.raises(TypeError, match="Missing required argument"):
+            await tool.run({"limit": 1})
+        assert counter.root_calls == []
+
+    async def test_hidden_arg_without_default_uses_root_default(
+        self, counter: CallCounter
+    ):
+        middle = Tool.from_tool(
+            counter.root(), transform_args={"region": ArgTransform(hide=True)}
+        )
+        tool = Tool.from_tool(middle, transform_args={"query": ArgTransform(name="q")})
+
+        result = await tool.run({"q": "a"})
+
+        assert result.structured_content == {
+            "query": "a",
+            "limit": 10,
+            "region": "us",
+            "request_id": 0,
+        }
+        assert counter.transformed_runs == 1
+
+    async def test_forward_from_custom_fn_skips_forwarding_layers(
+        self, counter: CallCounter
+    ):
+        renamed = Tool.from_tool(
+            counter.root(), transform_args={"query": ArgTransform(name="q")}
+        )
+
+        async def shout(q: str, **kwargs: Any) -> ToolResult:
+            return await forward(q=q.upper(), **kwargs)
+
+        tool = Tool.from_tool(renamed, transform_fn=shout)
+        result = await tool.run({"q": "hi"})
+
+        assert counter.root_calls[0]["query"] == "HI"
+        assert counter.transformed_runs == 1
+        assert result.structured_content is not None
+
+    async def test_forward_still_checks_skipped_layer_requirements(
+        self, counter: CallCounter
+    ):
+        required = Tool.from_tool(
+            counter.root(), transform_args={"limit": ArgTransform(required=True)}
+        )
+
+        async def passthrough(**kwargs: Any) -> ToolResult:
+            return await forward(query=kwargs["query"])
+
+        tool = Tool.from_tool(
+            required,
+            transform_fn=passthrough,
+            transform_args={"limit": ArgTransform(default=5)},
+        )
+
+        with pytest.raises(TypeError, match="Missing required argument\\(s\\): limit"):
+            await tool.run({"query": "a"})
+        assert counter.root_calls == []
+
+
+class TestFusionIsSkipped:
+    async def test_custom_fn_parent_is_not_skipped(self, counter: CallCounter):
+        async def wrap(**kwargs: Any) -> ToolResult:
+            return await forward(**kwargs)
+
+        custom = Tool.from_tool(counter.root(), transform_fn=wrap)
+        tool = Tool.from_tool(custom, transform_args={"query": ArgTransform(name="q")})
+
+        assert tool.forwarding_plan is not None
+        assert tool.forwarding_plan.target is custom
+        await tool.run({"q": "a"})
+        assert counter.transformed_runs == 2
+
+    async def test_parent_that_drops_structured_content_is_not_skipped(
+        self, counter: CallCounter
+    ):
+        unstructured = Tool.from_tool(counter.root(), output_schema={"type": "string"})
+        tool = Tool.from_tool(unstructured, output_schema=None)
+
+        assert tool.forwarding_plan is not None
+        assert tool.forwarding_plan.target is unstructured
+        result = await tool.run({"query": "a"})
+        assert result.structured_content is None
@@ -0,0 +1,75 @@
+"""Tests for the on-disk OpenAPI route cache."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from fastmcp.utilities.openapi import (
+    extract_output_schema_from_responses,
+    load_or_parse_http_routes,
+    parse_openapi_to_http_routes,
+    route_key,
+    routes_cache_key,
+)
+
+
+class TestRoutesCache:
+    def test_cached_routes_round_trip(self, tmp_path: Path, collision_spec):
+        parsed = load_or_parse_http_routes(collision_spec, tmp_path)
+        assert len(list(tmp_path.glob("openapi-routes-*.json"))) == 1
+
+        with patch(
+            "fastmcp.utilities.openapi.cache.parse_openapi_to_http_routes"
+        ) as parse:
+            cached = load_or_parse_http_routes(collision_spec, tmp_path)
+
+        parse.assert_not_called()
+        assert cached == parsed
+        assert cached.routes == parse_openapi_to_http_routes(collision_spec)
+
+    def test_output_schemas_are_cached(self, tmp_path: Path, basic_openapi_30_spec):
+        load_or_parse_http_routes(basic_openapi_30_spec, tmp_path)
+        cached = load_or_parse_http_routes(basic_openapi_30_spec, tmp_path)
+
+        (route,) = cached.routes
+        assert cached.output_schemas[route_key(route)] == (
+            extract_output_schema_from_responses(
+                route.responses, route.response_schemas, route.openapi_version
+            )
+        )
+
+    def test_key_changes_with_spec_content(self, basic_openapi_30_spec):
+        key = routes_cache_key(basic_openapi_30_spec)
+        basic_openapi_30_spec["info"]["version"] = "2.0.0"
+        assert routes_cache_key(basic_openapi_30_spec) != key
+
+    def test_key_ignores_dict_ordering(self, basic_openapi_30_spec):
+        reordered = dict(reversed(list(basic_openapi_30_spec.items())))
+        assert routes_cache_key(reordered) == routes_cache_key(basic_openapi_30_spec)
+
+    def test_key_changes_with_fastmcp_version(self, basic_openapi_30_spec):
+        key = routes_cache_key(basic_openapi_30_spec)
+        with patch("fastmcp.__version__", "0.0.0-other"):
+            assert routes_cache_key(basic_openapi_30_spec) != key
+
+    def test_corrupt_entry_is_reparsed_and_replaced(
+        self, tmp_path: Path, basic_openapi_30_spec
+    ):
+        key = routes_cache_key(basic_openapi_30_spec)
+        cache_file = tmp_path / f"openapi-routes-{key}.json"
+        cache_file.write_text("{not json")
+
+        parsed = load_or_parse_http_routes(basic_openapi_30_spec, tmp_path)
+
+        assert parsed.routes == parse_openapi_to_http_routes(basic_openapi_30_spec)
+        assert load_or_parse_http_routes(basic_openapi_30_spec, tmp_path) == parsed
+        assert cache_file.read_text().startswith('{"routes"')
+
+    def test_unwritable_cache_dir_still_parses(
+        self, tmp_path: Path, basic_openapi_30_spec
+    ):
+        not_a_dir = tmp_path / "file"
+        not_a_dir.write_text("")
+
+        parsed = load_or_parse_http_routes(basic_openapi_30_spec, not_a_dir)
+
+        assert parsed.routes == parse_openapi_to_http_routes(basic_openapi_30_spec)
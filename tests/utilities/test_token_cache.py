@@ -5,7 +5,7 @@ import time
 import pytest
 
 from fastmcp.server.auth.auth import AccessToken
-from fastmcp.utilities.token_cache import TokenCache
+from fastmcp.utilities.token_cache import TokenCache, TokenCacheStats
 
 
 def _make_token(
@@ -210,6 +210,135 @@ class TestTokenCacheSizeLimit:
         assert result_0 is not None
         assert result_0.client_id == "0-updated"
 
+    def test_get_marks_entry_recently_used(self):
+        cache = TokenCache(ttl_seconds=300, max_size=2)
+        cache.set("tok-0", _make_token(client_id="0"))
+        cache.set("tok-1", _make_token(client_id="1"))
+
+        # Reading tok-0 makes tok-1 the least recently used entry
+        assert cache.get("tok-0")[0]
+        cache.set("tok-2", _make_token(client_id="2"))
+
+        assert cache.get("tok-0")[0]
+        assert not cache.get("tok-1")[0]
+        assert cache.get("tok-2")[0]
+
+    def test_eviction_order_follows_use(self):
+        cache = TokenCache(ttl_seconds=300, max_size=3)
+        for i in range(3):
+            cache.set(f"tok-{i}", _make_token(client_id=str(i)))
+
+        cache.get("tok-0")
+        cache.set("tok-1", _make_token(client_id="1-updated"))
+        # Recency is now tok-2, tok-0, tok-1 from oldest to newest
+        evicted = []
+        for i in range(3, 6):
+            before = set(cache._entries)
+            cache.set(f"tok-{i}", _make_token(client_id=str(i)))
+            evicted.extend(before - set(cache._entries))
+
+        assert evicted == [cache._hash_token(f"tok-{i}") for i in (2, 0, 1)]
+        assert cache.stats.evictions == 3
+
+
+class TestTokenCacheNegative:
+    """Short-lived caching of rejected tokens."""
+
+    @pytest.fixture
+    def cache(self) -> TokenCache:
+        return TokenCache(ttl_seconds=300, max_size=2, negative_ttl_seconds=5)
+
+    def test_rejected_token_is_a_hit_with_no_result(self, cache: TokenCache):
+        cache.set_rejected("bad")
+        assert cache.get("bad") == (True, None)
+
+    def test_disabled_by_default(self):
+        cache = TokenCache(ttl_seconds=300)
+        cache.set_rejected("bad")
+        assert cache.get("bad") == (False, None)
+        assert len(cache._rejected) == 0
+
+    def test_requires_positive_caching(self):
+        cache = TokenCache(ttl_seconds=0, negative_ttl_seconds=5)
+        cache.set_rejected("bad")
+        assert cache.get("bad") == (False, None)
+
+    def test_negative_ttl_raises(self):
+        with pytest.raises(
+            ValueError, match="negative_cache_ttl_seconds must be non-negative"
+        ):
+            TokenCache(ttl_seconds=300, negative_ttl_seconds=-1)
+
+    def test_capped_at_ttl(self):
+        cache = TokenCache(ttl_seconds=2, negative_ttl_seconds=60)
+        cache.set_rejected("bad")
+        entry = cache._rejected[cache._hash_token("bad")]
+        assert entry.expires_at <= time.time() + 2
+
+    def test_rejection_expires(self, cache: TokenCache):
+        cache.set_rejected("bad")
+        cache._rejected[cache._hash_token("bad")].expires_at = time.time() - 1
+
+        assert cache.get("bad") == (False, None)
+        assert len(cache._rejected) == 0
+
+    def test_success_replaces_rejection(self, cache: TokenCache):
+        cache.set_rejected("tok")
+        cache.set("tok", _make_token(client_id="user-1"))
+
+        hit, result = cache.get("tok")
+        assert hit
+        assert result is not None
+        assert result.client_id == "user-1"
+
+    def test_rejection_replaces_success(self, cache: TokenCache):
+        cache.set("tok", _make_token())
+        cache.set_rejected("tok")
+
+        assert cache.get("tok") == (True, None)
+        assert len(cache._entries) == 0
+
+    def test_rejections_do_not_evict_valid_tokens(self, cache: TokenCache):
+        cache.set("good-0", _make_token())
+        cache.set("good-1", _make_token())
+        for i in range(10):
+            cache.set_rejected(f"bad-{i}")
+
+        assert len(cache._rejected) == 2
+        assert cache.get("good-0")[0]
+        assert cache.get("good-1")[0]
+
+
+class TestTokenCacheStats:
+    """Hit, miss, and eviction counters."""
+
+    def test_counts_lookups(self):
+        cache = TokenCache(ttl_seconds=300, max_size=1, negative_ttl_seconds=5)
+        cache.set("good", _make_token())
+        cache.set_rejected("bad")
+
+        cache.get("good")
+        cache.get("good")
+        cache.get("bad")
+        cache.get("unknown")
+        cache.set("other", _make_token())
+
+        assert cache.stats == TokenCacheStats(
+            hits=2, negative_hits=1, misses=1, evictions=1
+        )
+
+    def test_stats_is_a_snapshot(self):
+        cache = TokenCache(ttl_seconds=300)
+        stats = cache.stats
+        cache.get("unknown")
+        assert stats.misses == 0
+        assert cache.stats.misses == 1
+
+    def test_disabled_cache_counts_nothing(self):
+        cache = TokenCache(ttl_seconds=0)
+        cache.get("tok")
+        assert cache.stats == TokenCacheStats()
+
 
 class TestTokenCacheHashing:
     """SHA-256 key hashing."""